@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import click
+import concurrent.futures
 import ipaddress
 import json
 import syslog
@@ -11,8 +12,9 @@ import tabulate
 import pyangbind.lib.pybindJSON as pybindJSON
 from natsort import natsorted
 from sonic_py_common import multi_asic
-from swsscommon.swsscommon import SonicV2Connector, ConfigDBConnector
+from swsscommon.swsscommon import SonicV2Connector, ConfigDBConnector, ConfigDBPipeConnector
 from utilities_common.general import load_db_config
+from acl_loader.native_parser import InvalidAclFile, parse_acl_json as native_parse_acl_json
 
 def info(msg):
     click.echo(click.style("Info: ", fg='cyan') + click.style(str(msg), fg='green'))
@@ -125,6 +127,7 @@ class AclLoader(object):
         self.rules_info = {}
         self.tables_state_info = None
         self.rules_state_info = None
+        self.capability_cache = None
 
         # Load database config files
         load_db_config()
@@ -446,14 +449,30 @@ class AclLoader(object):
                 raise AclLoaderException("Invalid input file %s" % filename)
         return yang_acl
 
-    def load_rules_from_file(self, filename, skip_action_validation=False):
+    @staticmethod
+    def parse_acl_json_native(filename):
+        """
+        Parse file in openconfig ACL format into plain python objects, without pyangbind.
+        :param filename: File in openconfig ACL format
+        :return: object with the same attributes as the pyangbind openconfig_acl object
+        """
+        try:
+            return native_parse_acl_json(filename)
+        except InvalidAclFile as e:
+            raise AclLoaderException("Invalid input file %s: %s" % (filename, e))
+
+    def load_rules_from_file(self, filename, skip_action_validation=False, native_parser=False):
         """
         Load file with ACL rules configuration in openconfig ACL format. Convert rules
         to Config DB schema.
         :param filename: File in openconfig ACL format
+        :param native_parser: Parse the file without pyangbind, faster for large files
         :return:
         """
-        self.yang_acl = AclLoader.parse_acl_json(filename)
+        if native_parser:
+            self.yang_acl = AclLoader.parse_acl_json_native(filename)
+        else:
+            self.yang_acl = AclLoader.parse_acl_json(filename)
         self.convert_rules(skip_action_validation)
 
     def convert_action(self, table_name, rule_idx, rule, skip_validation=False):
@@ -501,19 +520,7 @@ class AclLoader(object):
             raise AclLoaderException("Table {} does not exist".format(table_name))
 
         stage = self.tables_db_info[table_name].get("stage", Stage.INGRESS)
-
-        # check if per npu state db is there then read using first state db
-        # else read from global statedb
-        if self.per_npu_statedb:
-            # For multi-npu we will read using anyone statedb connector for front asic namespace.
-            # Same information should be there in all state DB's
-            # as it is static information about switch capability
-            namespace_statedb = list(self.per_npu_statedb.values())[0]
-            aclcapability = namespace_statedb.get_all(self.statedb.STATE_DB, "{}|{}".format(self.ACL_STAGE_CAPABILITY_TABLE, stage.upper()))
-            switchcapability = namespace_statedb.get_all(self.statedb.STATE_DB, "{}|switch".format(self.SWITCH_CAPABILITY_TABLE))
-        else:
-            aclcapability = self.statedb.get_all(self.statedb.STATE_DB, "{}|{}".format(self.ACL_STAGE_CAPABILITY_TABLE, stage.upper()))
-            switchcapability = self.statedb.get_all(self.statedb.STATE_DB, "{}|switch".format(self.SWITCH_CAPABILITY_TABLE))
+        aclcapability, switchcapability = self.read_action_capability(stage)
         # In the load_minigraph path, it's possible that the STATE_DB entry haven't pop up because orchagent is stopped
         # before loading acl.json. So we skip the validation if any table is empty
         if skip_validation and (not aclcapability or not switchcapability):
@@ -544,6 +551,37 @@ class AclLoader(object):
 
         return action_count == len(action_props)
 
+    def read_action_capability(self, stage):
+        """
+        Read ACL stage and switch capabilities from STATE_DB. They are read once
+        per stage while converting rules.
+        :param stage: ACL stage
+        :return: tuple of ACL stage capability and switch capability
+        """
+        if self.capability_cache is not None and stage in self.capability_cache:
+            return self.capability_cache[stage]
+
+        # check if per npu state db is there then read using first state db
+        # else read from global statedb
+        if self.per_npu_statedb:
+            # For multi-npu we will read using anyone statedb connector for front asic namespace.
+            # Same information should be there in all state DB's
+            # as it is static information about switch capability
+            namespace_statedb = list(self.per_npu_statedb.values())[0]
+            aclcapability = namespace_statedb.get_all(
+                self.statedb.STATE_DB, "{}|{}".format(self.ACL_STAGE_CAPABILITY_TABLE, stage.upper()))
+            switchcapability = namespace_statedb.get_all(
+                self.statedb.STATE_DB, "{}|switch".format(self.SWITCH_CAPABILITY_TABLE))
+        else:
+            aclcapability = self.statedb.get_all(
+                self.statedb.STATE_DB, "{}|{}".format(self.ACL_STAGE_CAPABILITY_TABLE, stage.upper()))
+            switchcapability = self.statedb.get_all(
+                self.statedb.STATE_DB, "{}|switch".format(self.SWITCH_CAPABILITY_TABLE))
+
+        if self.capability_cache is not None:
+            self.capability_cache[stage] = (aclcapability, switchcapability)
+        return aclcapability, switchcapability
+
     def convert_l2(self, table_name, rule_idx, rule):
         rule_props = {}
 
@@ -804,6 +842,13 @@ class AclLoader(object):
         Convert rules in openconfig ACL format to Config DB schema
         :return:
         """
+        self.capability_cache = {}
+        try:
+            self._convert_rules(skip_aciton_validation)
+        finally:
+            self.capability_cache = None
+
+    def _convert_rules(self, skip_aciton_validation):
         for acl_set_name in self.yang_acl.acl.acl_sets.acl_set:
             table_name = acl_set_name.replace(" ", "_").replace("-", "_").upper()
             acl_set = self.yang_acl.acl.acl_sets.acl_set[acl_set_name]
@@ -847,13 +892,17 @@ class AclLoader(object):
         for namespace_configdb in self.per_npu_configdb.values():
             namespace_configdb.mod_config({self.ACL_RULE: self.rules_info})
 
-    def incremental_update(self):
+    def incremental_update(self, diff=False):
         """
         Perform incremental ACL rules configuration update. Get existing rules from
         Config DB. Compare with rules specified in file and perform corresponding
         modifications.
+        :param diff: Only write the rules which differ, for dataplane ACLs also
         :return:
         """
+        if diff:
+            self.diff_update()
+            return
 
         # TODO: Until we test ASIC behavior, we cannot assume that we can insert
         # dataplane ACLs and shift existing ACLs. Therefore, we perform a full
@@ -922,6 +971,89 @@ class AclLoader(object):
                 for namespace_configdb in self.per_npu_configdb.values():
                     namespace_configdb.set_entry(self.ACL_RULE, key, self.rules_info[key])
 
+    @staticmethod
+    def stringify_rule(rule):
+        return {field: str(value) for field, value in rule.items()}
+
+    def get_rules_delta(self):
+        """
+        Compare rules loaded from file with existing rules in Config DB.
+        :return: tuple of (added, changed, removed) rule keys. Added and changed
+                 rules are sorted by decreasing priority.
+        """
+        new_rules = set(self.rules_info.keys())
+        current_rules = set(self.rules_db_info.keys())
+
+        added = new_rules.difference(current_rules)
+        removed = current_rules.difference(new_rules)
+        # Config DB returns every field as a string, while the converted
+        # rules keep some as ints, e.g. IP_PROTOCOL or ICMP_TYPE
+        changed = set(key for key in new_rules.intersection(current_rules)
+                      if not operator.eq(self.stringify_rule(self.rules_info[key]),
+                                         self.stringify_rule(self.rules_db_info[key])))
+
+        def priority(key):
+            return int(self.rules_info[key].get("PRIORITY", 0))
+
+        return (sorted(added, key=priority, reverse=True),
+                sorted(changed, key=priority, reverse=True),
+                natsorted(removed))
+
+    def get_pipe_configdbs(self):
+        """
+        Get pipelined Config DB connectors for the host and every front asic namespace
+        :return: list of ConfigDBPipeConnector
+        """
+        configdbs = [ConfigDBPipeConnector()]
+        for namespace in self.per_npu_configdb or {}:
+            configdbs.append(ConfigDBPipeConnector(namespace=namespace))
+        for configdb in configdbs:
+            configdb.connect()
+        return configdbs
+
+    def write_rules_delta(self, configdb, added, changed, removed):
+        """
+        Write the rules delta to Config DB.
+        New and changed rules are written first, in place, so that packets keep
+        matching the old or the new rule while the ACL is updated. Rules which
+        are no longer present are removed after.
+        :param configdb: ConfigDBPipeConnector
+        :return:
+        """
+        # mod_config only sets fields: a changed rule which no longer has some
+        # fields would briefly hold both the old and the new fields (e.g. two
+        # actions), it is replaced as a whole instead
+        replaced = [key for key in changed if set(self.rules_db_info[key]).difference(self.rules_info[key])]
+        rules = {key: self.rules_info[key] for key in added + changed if key not in replaced}
+        if rules:
+            configdb.mod_config({self.ACL_RULE: rules})
+
+        for key in replaced:
+            configdb.set_entry(self.ACL_RULE, key, self.rules_info[key])
+
+        if removed:
+            configdb.mod_config({self.ACL_RULE: {key: None for key in removed}})
+
+    def diff_update(self):
+        """
+        Perform incremental ACL rules configuration update, writing only the
+        added, changed and removed rules of both control plane and dataplane ACLs.
+        The delta is written through pipelines, to the host and every front asic
+        namespace concurrently.
+        :return:
+        """
+        added, changed, removed = self.get_rules_delta()
+        info("Updating ACL rules: %d added, %d changed, %d removed" % (len(added), len(changed), len(removed)))
+        if not (added or changed or removed):
+            return
+
+        configdbs = self.get_pipe_configdbs()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(configdbs)) as executor:
+            futures = [executor.submit(self.write_rules_delta, configdb, added, changed, removed)
+                       for configdb in configdbs]
+            for future in futures:
+                future.result()
+
     def delete(self, table=None, rule=None):
         """
         :param table:
@@ -1188,8 +1320,10 @@ def update(ctx):
 @click.option('--mirror_stage', type=click.Choice(["ingress", "egress"]), default="ingress")
 @click.option('--max_priority', type=click.INT, required=False)
 @click.option('--skip_action_validation', is_flag=True, default=False, help="Skip action validation")
+@click.option('--native_parser', is_flag=True, default=False,
+              help="Parse the file without pyangbind, faster for large files")
 @click.pass_context
-def full(ctx, filename, table_name, session_name, mirror_stage, max_priority, skip_action_validation):
+def full(ctx, filename, table_name, session_name, mirror_stage, max_priority, skip_action_validation, native_parser):
     """
     Full update of ACL rules configuration.
     If a table_name is provided, the operation will be restricted in the specified table.
@@ -1207,7 +1341,7 @@ def full(ctx, filename, table_name, session_name, mirror_stage, max_priority, sk
     if max_priority:
         acl_loader.set_max_priority(max_priority)
 
-    acl_loader.load_rules_from_file(filename, skip_action_validation)
+    acl_loader.load_rules_from_file(filename, skip_action_validation, native_parser)
     acl_loader.full_update()
 
 
@@ -1216,8 +1350,12 @@ def full(ctx, filename, table_name, session_name, mirror_stage, max_priority, sk
 @click.option('--session_name', type=click.STRING, required=False)
 @click.option('--mirror_stage', type=click.Choice(["ingress", "egress"]), default="ingress")
 @click.option('--max_priority', type=click.INT, required=False)
+@click.option('--diff', is_flag=True, default=False,
+              help="Only write the added, changed and removed rules, for dataplane ACLs also")
+@click.option('--native_parser', is_flag=True, default=False,
+              help="Parse the file without pyangbind, faster for large files")
 @click.pass_context
-def incremental(ctx, filename, session_name, mirror_stage, max_priority):
+def incremental(ctx, filename, session_name, mirror_stage, max_priority, diff, native_parser):
     """
     Incremental update of ACL rule configuration.
     """
@@ -1231,8 +1369,8 @@ def incremental(ctx, filename, session_name, mirror_stage, max_priority):
     if max_priority:
         acl_loader.set_max_priority(max_priority)
 
-    acl_loader.load_rules_from_file(filename)
-    acl_loader.incremental_update()
+    acl_loader.load_rules_from_file(filename, native_parser=native_parser)
+    acl_loader.incremental_update(diff)
 
 
 @cli.command()
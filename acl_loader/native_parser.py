@@ -0,0 +1,299 @@
+"""
+Native parser for ACL files in openconfig ACL format.
+
+pybindJSON.load builds a pyangbind object for every node of the file, which
+is slow and memory hungry for files with tens of thousands of rules. This
+parser reads the file once with json.load and validates it against the
+subset of the openconfig-acl model used by acl-loader.
+
+The result exposes the same attribute names as the pyangbind bindings
+(acl.acl_sets.acl_set[name].acl_entries.acl_entry[seq].ip.config.protocol...),
+with leaves typed and defaulted like pyangbind does: integer leaves are
+converted to int, unset leaves read as "" and unset leaf-lists as []. The
+rules are then converted by AclLoader exactly like the pyangbind objects.
+"""
+
+import ipaddress
+import json
+import re
+
+ETHERTYPES = {
+    "ETHERTYPE_LLDP", "ETHERTYPE_VLAN", "ETHERTYPE_ROCE", "ETHERTYPE_ARP",
+    "ETHERTYPE_IPV4", "ETHERTYPE_IPV6", "ETHERTYPE_MPLS"
+}
+
+IP_PROTOCOLS = {
+    "IP_TCP", "IP_UDP", "IP_ICMP", "IP_IGMP", "IP_PIM", "IP_RSVP", "IP_GRE",
+    "IP_AUTH", "IP_L2TP", "IP_ICMPV6"
+}
+
+FORWARDING_ACTIONS = {"ACCEPT", "DROP", "REJECT"}
+
+LOG_ACTIONS = {"LOG_SYSLOG", "LOG_NONE"}
+
+TCP_FLAGS = {"TCP_SYN", "TCP_FIN", "TCP_RST", "TCP_PSH", "TCP_ACK", "TCP_URG", "TCP_ECE", "TCP_CWR"}
+
+PORT_RANGE_RE = re.compile(r"^\d{1,5}\.\.\d{1,5}$")
+
+
+class InvalidAclFile(Exception):
+    pass
+
+
+class Node(object):
+    """
+    Container of the parsed ACL, children are accessed as attributes
+    """
+    def __init__(self, children):
+        self.__dict__.update(children)
+
+
+def _identity(value):
+    # Identities may be prefixed with their module name
+    return value.split(":")[-1]
+
+
+def _is_number(value):
+    return isinstance(value, int) and not isinstance(value, bool) or \
+        isinstance(value, str) and value.lstrip("-").isdigit()
+
+
+class Leaf(object):
+    default = ""
+
+    def __call__(self, value):
+        return value
+
+
+class String(Leaf):
+    def __call__(self, value):
+        if not isinstance(value, str):
+            raise ValueError("{!r} is not a string".format(value))
+        return value
+
+
+class UInt(Leaf):
+    def __init__(self, low, high):
+        self.low = low
+        self.high = high
+
+    def __call__(self, value):
+        if not _is_number(value):
+            raise ValueError("{!r} is not an integer".format(value))
+        value = int(value)
+        if value < self.low or value > self.high:
+            raise ValueError("{} is out of range [{}, {}]".format(value, self.low, self.high))
+        return value
+
+
+class Identity(Leaf):
+    def __init__(self, identities):
+        self.identities = identities
+
+    def __call__(self, value):
+        if not isinstance(value, str) or _identity(value) not in self.identities:
+            raise ValueError("{!r} is not one of {}".format(value, ", ".join(sorted(self.identities))))
+        return value
+
+
+class UIntOrIdentity(Leaf):
+    def __init__(self, low, high, identities):
+        self.uint = UInt(low, high)
+        self.identity = Identity(identities)
+
+    def __call__(self, value):
+        if _is_number(value):
+            return self.uint(value)
+        return self.identity(value)
+
+
+class Port(Leaf):
+    def __init__(self):
+        self.uint = UInt(0, 65535)
+
+    def __call__(self, value):
+        if _is_number(value):
+            return self.uint(value)
+        if value == "ANY" or isinstance(value, str) and PORT_RANGE_RE.match(value):
+            return value
+        raise ValueError("{!r} is neither a port nor a port range".format(value))
+
+
+class IpPrefix(Leaf):
+    def __call__(self, value):
+        if not isinstance(value, str) or "/" not in value:
+            raise ValueError("{!r} is not an IP prefix".format(value))
+        ipaddress.ip_network(value, strict=False)
+        return value
+
+
+class IdentityList(Leaf):
+    def __init__(self, identities):
+        self.identity = Identity(identities)
+
+    @property
+    def default(self):
+        return []
+
+    def __call__(self, value):
+        if not isinstance(value, list):
+            raise ValueError("{!r} is not a list".format(value))
+        return [self.identity(item) for item in value]
+
+
+class List(object):
+    """
+    Keyed list, in the pyangbind JSON format: an object whose members are the
+    list entries
+    """
+    def __init__(self, schema):
+        self.schema = schema
+
+
+# Containers which are accepted but not used by acl-loader
+IGNORED = None
+
+ACL_ENTRY_SCHEMA = {
+    "config": {
+        "sequence_id": UInt(0, 4294967295),
+        "description": String(),
+    },
+    "state": IGNORED,
+    "actions": {
+        "config": {
+            "forwarding_action": Identity(FORWARDING_ACTIONS),
+            "log_action": Identity(LOG_ACTIONS),
+        },
+        "state": IGNORED,
+    },
+    "l2": {
+        "config": {
+            "source_mac": String(),
+            "source_mac_mask": String(),
+            "destination_mac": String(),
+            "destination_mac_mask": String(),
+            "ethertype": UIntOrIdentity(0, 65535, ETHERTYPES),
+            "vlan_id": UInt(1, 4094),
+        },
+        "state": IGNORED,
+    },
+    "ip": {
+        "config": {
+            "ip_version": Leaf(),
+            "source_ip_address": IpPrefix(),
+            "destination_ip_address": IpPrefix(),
+            "source_ip_flow_label": Leaf(),
+            "destination_ip_flow_label": Leaf(),
+            "dscp": UInt(0, 63),
+            "protocol": UIntOrIdentity(0, 255, IP_PROTOCOLS),
+            "hop_limit": UInt(0, 255),
+        },
+        "state": IGNORED,
+    },
+    "transport": {
+        "config": {
+            "source_port": Port(),
+            "destination_port": Port(),
+            "tcp_flags": IdentityList(TCP_FLAGS),
+        },
+        "state": IGNORED,
+    },
+    "icmp": {
+        "config": {
+            "type": UInt(0, 255),
+            "code": UInt(0, 255),
+        },
+        "state": IGNORED,
+    },
+    "input_interface": {
+        "interface_ref": {
+            "config": {
+                "interface": String(),
+                "subinterface": Leaf(),
+            },
+            "state": IGNORED,
+        },
+    },
+}
+
+ACL_SCHEMA = {
+    "acl": {
+        "config": IGNORED,
+        "state": IGNORED,
+        "interfaces": IGNORED,
+        "acl_sets": {
+            "acl_set": List({
+                "config": {
+                    "name": String(),
+                    "type": Leaf(),
+                    "description": String(),
+                },
+                "state": IGNORED,
+                "acl_entries": {
+                    "acl_entry": List(ACL_ENTRY_SCHEMA),
+                },
+            }),
+        },
+    },
+}
+
+# Unset containers are shared, they are only read
+_defaults = {}
+
+
+def _default(schema):
+    if isinstance(schema, Leaf):
+        return schema.default
+    if isinstance(schema, List):
+        return {}
+    if schema is IGNORED:
+        return None
+    if id(schema) not in _defaults:
+        _defaults[id(schema)] = Node({name: _default(child) for name, child in schema.items()})
+    return _defaults[id(schema)]
+
+
+def _parse(schema, data, path):
+    if isinstance(schema, List):
+        if not isinstance(data, dict):
+            raise InvalidAclFile("{} is not a list".format(path))
+        return {name: _parse(schema.schema, entry, "{}[{}]".format(path, name)) for name, entry in data.items()}
+
+    if isinstance(schema, Leaf):
+        try:
+            return schema(data)
+        except ValueError as e:
+            raise ValueError("Invalid value for {}: {}".format(path, e))
+
+    if not isinstance(data, dict):
+        raise InvalidAclFile("{} is not a container".format(path))
+
+    children = {}
+    for key, value in data.items():
+        name = _identity(key).replace("-", "_")
+        if name not in schema:
+            raise InvalidAclFile("Unknown node {}/{}".format(path, key))
+        children[name] = _parse(schema[name], value, "{}/{}".format(path, key)) if schema[name] is not IGNORED else None
+    for name, child in schema.items():
+        if name not in children:
+            children[name] = _default(child)
+    return Node(children)
+
+
+def parse_acl_json(filename):
+    """
+    Parse and validate an ACL file in openconfig ACL format.
+    :param filename: File in openconfig ACL format
+    :return: Node with the same attributes as the pyangbind openconfig_acl object
+    :raises InvalidAclFile: if the file does not follow the openconfig ACL model
+    :raises ValueError: if a leaf has an invalid value
+    """
+    try:
+        with open(filename, 'r') as f:
+            data = json.load(f)
+    except ValueError as e:
+        raise InvalidAclFile("Invalid JSON: {}".format(e))
+
+    if not isinstance(data, dict) or "acl" not in data:
+        raise InvalidAclFile("acl container is missing")
+    return _parse(ACL_SCHEMA, data, "")
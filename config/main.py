@@ -17,11 +17,13 @@ import time
 import itertools
 import copy
 import tempfile
+import shutil
 import sonic_yang
 
 from jsonpatch import JsonPatchConflict
 from jsonpointer import JsonPointerException
 from collections import OrderedDict
+from contextlib import contextmanager
 from generic_config_updater.generic_updater import GenericUpdater, ConfigFormat, extract_scope
 from generic_config_updater.gu_common import HOST_NAMESPACE, GenericConfigUpdaterError
 from minigraph import parse_device_desc_xml, minigraph_encoder
@@ -39,6 +41,7 @@ from swsscommon.swsscommon import SonicV2Connector, ConfigDBConnector, ConfigDBP
 from utilities_common.db import Db
 from utilities_common.intf_filter import parse_interface_in_filter
 from utilities_common import bgp_util
+from utilities_common import db_waiter
 import utilities_common.cli as clicommon
 from utilities_common.helper import get_port_pbh_binding, get_port_acl_binding, update_config
 from utilities_common.general import load_db_config, load_module_from_source
@@ -48,26 +51,8 @@ from utilities_common.flock import try_lock
 
 from .utils import log
 
-from . import aaa
-from . import chassis_modules
-from . import console
-from . import feature
-from . import fabric
-from . import flow_counters
-from . import kdump
-from . import kube
-from . import muxcable
-from . import nat
-from . import vlan
-from . import vxlan
 from . import plugins
 from .config_mgmt import ConfigMgmtDPB, ConfigMgmt, YANG_DIR
-from . import mclag
-from . import syslog
-from . import switchport
-from . import dns
-from . import bgp_cli
-from . import stp
 
 # mock masic APIs for unit test
 try:
@@ -172,6 +157,26 @@ def write_json_file(json_input, fileName):
     except Exception as e:
         raise Exception(str(e))
 
+
+# write given JSON file atomically, readers never see a partially written file
+def write_json_file_atomic(json_input, fileName):
+    fileName = os.path.realpath(fileName)
+    fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(fileName),
+                                    prefix='.{}.'.format(os.path.basename(fileName)))
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(json_input, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(fileName):
+            shutil.copymode(fileName, tmp_name)
+        else:
+            os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, fileName)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
 def _get_breakout_options(ctx, args, incomplete):
     """ Provides dynamic mode option as per user argument i.e. interface name """
     all_mode_options = []
@@ -857,21 +862,15 @@ def storm_control_delete_entry(port_name, storm_type):
 def _wait_until_clear(tables, interval=0.5, timeout=30, verbose=False):
     if timeout == 0:
         return True
-    start = time.time()
-    empty = False
     app_db = SonicV2Connector(host='127.0.0.1')
     app_db.connect(app_db.APPL_DB)
 
-    while not empty and time.time() - start < timeout:
-        non_empty_table_count = 0
-        for table in tables:
-            keys = app_db.keys(app_db.APPL_DB, table)
-            if keys:
-                non_empty_table_count += 1
-                if verbose:
-                    click.echo("Some entries matching {} still exist: {}".format(table, keys[0]))
-                time.sleep(interval)
-        empty = (non_empty_table_count == 0)
+    def on_pending(table, key):
+        if verbose:
+            click.echo("Some entries matching {} still exist: {}".format(table, key))
+
+    empty = db_waiter.wait_until_clear(app_db, app_db.APPL_DB, tables, timeout,
+                                       interval=interval, on_pending=on_pending)
 
     if not empty:
         click.echo("Operation not completed successfully, please save and reload configuration.")
@@ -1006,17 +1005,12 @@ def get_service_finish_timestamp(service):
 
 
 def wait_service_restart_finish(service, last_timestamp, timeout=30):
-    start_time = time.time()
-    elapsed_time = 0
-    while elapsed_time < timeout:
+    def restarted():
         current_timestamp = get_service_finish_timestamp(service)
-        if current_timestamp and (current_timestamp != last_timestamp):
-            return
-
-        time.sleep(1)
-        elapsed_time = time.time() - start_time
+        return bool(current_timestamp) and current_timestamp != last_timestamp
 
-    log.log_warning("Service: {} does not restart in {} seconds, stop waiting".format(service, timeout))
+    if not db_waiter.wait_until(restarted, timeout, interval=1):
+        log.log_warning("Service: {} does not restart in {} seconds, stop waiting".format(service, timeout))
 
 
 def _restart_services():
@@ -1306,6 +1300,27 @@ def validate_gre_type(ctx, _, value):
         raise click.UsageError("{} is not a valid GRE type".format(value))
 
 
+def dump_config_db(namespace=None):
+    """Read the CONFIG_DB of namespace with pipelined reads, in the format
+    printed by 'sonic-cfggen -d --print-data', tables and keys sorted
+    """
+    if namespace is None:
+        config_db = ConfigDBPipeConnector(use_unix_socket_path=True)
+    else:
+        config_db = ConfigDBPipeConnector(use_unix_socket_path=True, namespace=namespace)
+    config_db.connect(False)
+
+    config = config_db.get_config()
+    sonic_cfggen.FormatConverter.to_serialized(config)
+    return sort_dict(config)
+
+
+def save_config_db_to_file(namespace, filename):
+    """Save the CONFIG_DB of namespace to filename
+    """
+    write_json_file_atomic(dump_config_db(namespace), filename)
+
+
 def multiasic_save_to_singlefile(db, filename):
     """A function to save all asic's config to single file
     """
@@ -1432,15 +1447,126 @@ def delete_transceiver_tables():
         state_db.delete_all_by_pattern(state_db.STATE_DB, table + state_db_del_pattern)
 
 
-def migrate_db_to_lastest(namespace=DEFAULT_NAMESPACE):
+def migrate_db_to_lastest(namespace=DEFAULT_NAMESPACE, run_command=None):
     # Migrate DB contents to latest version
+    if run_command is None:
+        run_command = clicommon.run_command
     db_migrator = '/usr/local/bin/db_migrator.py'
     if os.path.isfile(db_migrator) and os.access(db_migrator, os.X_OK):
         if namespace is DEFAULT_NAMESPACE:
             command = [db_migrator, '-o', 'migrate']
         else:
             command = [db_migrator, '-o', 'migrate', '-n', namespace]
-        clicommon.run_command(command, display_cmd=True)
+        run_command(command, display_cmd=True)
+
+
+class NamespaceReloadError(Exception):
+    pass
+
+
+class NamespaceReload(object):
+    """The reload of the CONFIG_DB of one namespace, made of stages
+    (flush, load, migrate...) whose duration is recorded.
+
+    With capture_output, the commands run and their output are kept in
+    output instead of being printed, so that namespaces reloaded
+    concurrently don't interleave their output.
+    """
+    def __init__(self, namespace, capture_output=False):
+        self.namespace = namespace
+        self.capture_output = capture_output
+        self.output = []
+        self.timings = []
+        self.current_stage = None
+        self.error = None
+
+    @property
+    def name(self):
+        return HOST_NAMESPACE if self.namespace == DEFAULT_NAMESPACE else self.namespace
+
+    @contextmanager
+    def stage(self, name):
+        start = time.monotonic()
+        self.current_stage = name
+        try:
+            yield
+        finally:
+            self.timings.append((name, time.monotonic() - start))
+
+    def run_command(self, command, display_cmd=False):
+        if not self.capture_output:
+            clicommon.run_command(command, display_cmd=display_cmd)
+            return
+
+        if display_cmd:
+            self.output.append(click.style("Running command: ", fg='cyan') + click.style(' '.join(command), fg='green'))
+        proc = subprocess.Popen(command, text=True, stdout=subprocess.PIPE)
+        out, _ = proc.communicate()
+        if out:
+            self.output.append(out.rstrip('\n'))
+        if proc.returncode != 0:
+            raise NamespaceReloadError("'{}' failed with exit code {}".format(' '.join(command), proc.returncode))
+
+    def format_timings(self):
+        return "{}: {}".format(self.name, ", ".join("{} {:.2f}s".format(stage, duration)
+                                                    for stage, duration in self.timings))
+
+
+def run_namespace_reloads(operation, namespaces, reload_func, parallel=False):
+    """Run reload_func(NamespaceReload) for every namespace in namespaces.
+
+    The host namespace, always first in namespaces, is reloaded first. With
+    parallel, the ASIC namespaces are then reloaded concurrently, the heavy
+    work of every stage running in its own process (sonic-cfggen,
+    db_migrator...). Their output is printed in namespace order, along with
+    the time spent in each stage. The failures of all namespaces are
+    reported before exiting.
+    """
+    reloads = [NamespaceReload(namespace, capture_output=parallel) for namespace in namespaces]
+    if not parallel:
+        for reload in reloads:
+            reload_func(reload)
+        log.log_notice("'{}' stage timing: {}".format(operation, "; ".join(r.format_timings() for r in reloads)))
+        return
+
+    def run(reload):
+        try:
+            reload_func(reload)
+        except (Exception, SystemExit) as e:
+            reload.error = e
+
+    def report(reload):
+        for line in reload.output:
+            click.echo(line)
+        if reload.error is not None:
+            message = "'{}' of {} failed at stage {}: {}".format(operation, reload.name,
+                                                                 reload.current_stage, reload.error)
+            log.log_error(message)
+            click.secho(message, fg='red', err=True)
+
+    host_reloads = [r for r in reloads if r.namespace == DEFAULT_NAMESPACE]
+    asic_reloads = [r for r in reloads if r.namespace != DEFAULT_NAMESPACE]
+    for reload in host_reloads:
+        run(reload)
+        report(reload)
+    if any(r.error is not None for r in host_reloads):
+        if asic_reloads:
+            click.secho("Skipping the ASIC namespaces", fg='red', err=True)
+    elif asic_reloads:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(asic_reloads)) as executor:
+            futures = [executor.submit(run, reload) for reload in asic_reloads]
+            for reload, future in zip(asic_reloads, futures):
+                future.result()
+                report(reload)
+
+    click.echo("'{}' stage timing:".format(operation))
+    for reload in reloads:
+        if reload.timings:
+            click.echo("  " + reload.format_timings())
+    log.log_notice("'{}' stage timing: {}".format(operation, "; ".join(r.format_timings() for r in reloads)))
+
+    if any(r.error is not None for r in reloads):
+        sys.exit(1)
 
 
 def multiasic_write_to_db(filename, load_sysinfo):
@@ -1547,38 +1673,35 @@ def config(ctx):
     ctx.obj = Db()
 
 
-# Add groups from other modules
-config.add_command(aaa.aaa)
-config.add_command(aaa.tacacs)
-config.add_command(aaa.radius)
-config.add_command(chassis_modules.chassis)
-config.add_command(console.console)
-config.add_command(fabric.fabric)
-config.add_command(feature.feature)
-config.add_command(flow_counters.flowcnt_route)
-config.add_command(kdump.kdump)
-config.add_command(kube.kubernetes)
-config.add_command(muxcable.muxcable)
-config.add_command(nat.nat)
-config.add_command(vlan.vlan)
-config.add_command(vxlan.vxlan)
-
-# add stp commands
-config.add_command(stp.spanning_tree)
-
-# add mclag commands
-config.add_command(mclag.mclag)
-config.add_command(mclag.mclag_member)
-config.add_command(mclag.mclag_unique_ip)
-
-# syslog module
-config.add_command(syslog.syslog)
-
-# DNS module
-config.add_command(dns.dns)
-
-# Switchport module
-config.add_command(switchport.switchport)
+# Add groups from other modules, they are imported on first use
+clicommon.add_lazy_commands(config, {
+    'aaa': ('config.aaa', 'aaa'),
+    'tacacs': ('config.aaa', 'tacacs'),
+    'radius': ('config.aaa', 'radius'),
+    'chassis': ('config.chassis_modules', 'chassis'),
+    'console': ('config.console', 'console'),
+    'fabric': ('config.fabric', 'fabric'),
+    'feature': ('config.feature', 'feature'),
+    'flowcnt-route': ('config.flow_counters', 'flowcnt_route'),
+    'kdump': ('config.kdump', 'kdump'),
+    'kubernetes': ('config.kube', 'kubernetes'),
+    'muxcable': ('config.muxcable', 'muxcable'),
+    'nat': ('config.nat', 'nat'),
+    'vlan': ('config.vlan', 'vlan'),
+    'vxlan': ('config.vxlan', 'vxlan'),
+    # add stp commands
+    'spanning-tree': ('config.stp', 'spanning_tree'),
+    # add mclag commands
+    'mclag': ('config.mclag', 'mclag'),
+    'member': ('config.mclag', 'mclag_member'),
+    'unique-ip': ('config.mclag', 'mclag_unique_ip'),
+    # syslog module
+    'syslog': ('config.syslog', 'syslog'),
+    # DNS module
+    'dns': ('config.dns', 'dns'),
+    # Switchport module
+    'switchport': ('config.switchport', 'switchport'),
+})
 
 @config.command()
 @click.option('-y', '--yes', is_flag=True, callback=_abort_if_false,
@@ -1612,6 +1735,7 @@ def save(db, filename):
 
     # In case of multi-asic mode we have additional config_db{NS}.json files for
     # various namespaces created per ASIC. {NS} is the namespace index.
+    save_files = []
     for inst in range(-1, num_cfg_file-1):
         #inst = -1, refers to the linux host where there is no namespace.
         if inst == -1:
@@ -1628,17 +1752,29 @@ def save(db, filename):
             else:
                 file = "/etc/sonic/config_db{}.json".format(inst)
 
+        save_files.append((namespace, file))
+
+    log.log_info("'save' executing...")
+    for namespace, file in save_files:
         if namespace is None:
-            command = "{} -d --print-data > {}".format(SONIC_CFGGEN_PATH, file)
+            click.echo("Saving CONFIG_DB to {}".format(file))
         else:
-            command = "{} -n {} -d --print-data > {}".format(SONIC_CFGGEN_PATH, namespace, file)
+            click.echo("Saving CONFIG_DB of {} to {}".format(namespace, file))
 
-        log.log_info("'save' executing...")
-        clicommon.run_command(command, display_cmd=True, shell=True)
-
-        config_db = sort_dict(read_json_file(file))
-        with open(file, 'w') as config_db_file:
-            json.dump(config_db, config_db_file, indent=4)
+    # The namespaces are dumped concurrently, most of the time is spent waiting for redis
+    failed = False
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(save_files)) as executor:
+        futures = [executor.submit(save_config_db_to_file, namespace, file) for namespace, file in save_files]
+        for (namespace, file), future in zip(save_files, futures):
+            try:
+                future.result()
+            except Exception as e:
+                failed = True
+                message = "Failed to save CONFIG_DB of {} to {}: {}".format(namespace or 'host', file, e)
+                log.log_error(message)
+                click.secho(message, fg='red', err=True)
+    if failed:
+        sys.exit(1)
 
 @config.command()
 @click.option('-y', '--yes', is_flag=True)
@@ -1909,10 +2045,12 @@ def list_checkpoints(ctx, time, verbose):
 @click.option('-f', '--force', default=False, is_flag=True, help='Force config reload without system checks')
 @click.option('-t', '--file_format', default='config_db',type=click.Choice(['config_yang', 'config_db']),show_default=True,help='specify the file format')
 @click.option('-b', '--bypass-lock', default=False, is_flag=True, help='Do reload without acquiring lock')
+@click.option('--parallel', default=False, is_flag=True,
+              help='Reload the ASIC namespaces concurrently, once the host is reloaded')
 @click.argument('filename', required=False)
 @clicommon.pass_db
 @try_lock(SYSTEM_RELOAD_LOCK, timeout=0)
-def reload(db, filename, yes, load_sysinfo, no_service_restart, force, file_format, bypass_lock):
+def reload(db, filename, yes, load_sysinfo, no_service_restart, force, file_format, bypass_lock, parallel):
     """Clear current configuration and import a previous saved config DB dump file.
        <filename> : Names of configuration file(s) to load, separated by comma with no spaces in between
     """
@@ -1972,6 +2110,7 @@ def reload(db, filename, yes, load_sysinfo, no_service_restart, force, file_form
         # service running in the host + DB services running in each ASIC namespace created per ASIC.
         # In the below logic, we get all namespaces in this platform and add an empty namespace ''
         # denoting the current namespace which we are in ( the linux host )
+        reload_files = {}
         for inst in range(-1, num_cfg_file-1):
             # Get the namespace name, for linux host it is DEFAULT_NAMESPACE
             if inst == -1:
@@ -2007,6 +2146,7 @@ def reload(db, filename, yes, load_sysinfo, no_service_restart, force, file_form
                 if not load_sysinfo:
                     load_sysinfo = load_sysinfo_if_missing(file_input)
 
+            cfg_hwsku = None
             if load_sysinfo:
                 try:
                     command = [SONIC_CFGGEN_PATH, "-j", file, '-v', "DEVICE_METADATA.localhost.hwsku"]
@@ -2026,17 +2166,25 @@ def reload(db, filename, yes, load_sysinfo, no_service_restart, force, file_form
 
                 cfg_hwsku = output.strip()
 
-            client, config_db = flush_configdb(namespace)
-            delete_transceiver_tables()
+            reload_files[namespace] = (file, cfg_hwsku)
 
-            if load_sysinfo:
-                if namespace is DEFAULT_NAMESPACE:
-                    command = [
-                        str(SONIC_CFGGEN_PATH), '-H', '-k', str(cfg_hwsku), '--write-to-db']
-                else:
-                    command = [
-                        str(SONIC_CFGGEN_PATH), '-H', '-k', str(cfg_hwsku), '-n', str(namespace), '--write-to-db']
-                clicommon.run_command(command, display_cmd=True)
+        def reload_namespace(reload):
+            namespace = reload.namespace
+            file, cfg_hwsku = reload_files[namespace]
+
+            with reload.stage('flush'):
+                client, config_db = flush_configdb(namespace)
+                delete_transceiver_tables()
+
+            if cfg_hwsku is not None:
+                with reload.stage('sysinfo'):
+                    if namespace is DEFAULT_NAMESPACE:
+                        command = [
+                            str(SONIC_CFGGEN_PATH), '-H', '-k', str(cfg_hwsku), '--write-to-db']
+                    else:
+                        command = [
+                            str(SONIC_CFGGEN_PATH), '-H', '-k', str(cfg_hwsku), '-n', str(namespace), '--write-to-db']
+                    reload.run_command(command, display_cmd=True)
 
             # For the database service running in linux host we use the file user gives as input
             # or by default DEFAULT_CONFIG_DB_FILE. In the case of database service running in namespace,
@@ -2057,8 +2205,9 @@ def reload(db, filename, yes, load_sysinfo, no_service_restart, force, file_form
 
             command = [SONIC_CFGGEN_PATH] + config_gen_opts + ['--write-to-db']
 
-            clicommon.run_command(command, display_cmd=True)
-            client.set(config_db.INIT_INDICATOR, 1)
+            with reload.stage('load'):
+                reload.run_command(command, display_cmd=True)
+                client.set(config_db.INIT_INDICATOR, 1)
 
             if os.path.exists(file) and file.endswith("_configReloadStdin"):
                 # Remove tmpfile
@@ -2068,7 +2217,10 @@ def reload(db, filename, yes, load_sysinfo, no_service_restart, force, file_form
                     click.echo("An error occurred while removing the temporary file: {}".format(str(e)), err=True)
 
             # Migrate DB contents to latest version
-            migrate_db_to_lastest(namespace)
+            with reload.stage('migrate'):
+                migrate_db_to_lastest(namespace, reload.run_command)
+
+        run_namespace_reloads('reload', list(reload_files), reload_namespace, parallel)
 
     # Re-generate the environment variable in case config_db.json was edited
     update_sonic_environment()
@@ -2130,9 +2282,12 @@ def load_mgmt_config(filename):
 @click.option('-o', '--override_config', default=False, is_flag=True, help='Enable config override. Proceed with default path.')
 @click.option('-p', '--golden_config_path', help='Provide golden config path to override. Use with --override_config')
 @click.option('-b', '--bypass-lock', default=False, is_flag=True, help='Do load minigraph without acquiring lock')
+@click.option('--parallel', default=False, is_flag=True,
+              help='Load the ASIC namespaces concurrently, once the host is loaded')
 @clicommon.pass_db
 @try_lock(SYSTEM_RELOAD_LOCK, timeout=0)
-def load_minigraph(db, no_service_restart, traffic_shift_away, override_config, golden_config_path, bypass_lock):
+def load_minigraph(db, no_service_restart, traffic_shift_away, override_config, golden_config_path, bypass_lock,
+                   parallel):
     """Reconfigure based on minigraph."""
     argv_str = ' '.join(['config', *sys.argv[1:]])
     log.log_notice(f"'load_minigraph' executing with command: {argv_str}")
@@ -2175,24 +2330,27 @@ def load_minigraph(db, no_service_restart, traffic_shift_away, override_config,
     if num_npus > 1:
         namespace_list += multi_asic.get_namespaces_from_linux()
 
-    for namespace in namespace_list:
+    def load_namespace(reload):
+        namespace = reload.namespace
         if namespace is DEFAULT_NAMESPACE:
             config_db = ConfigDBConnector()
             cfggen_namespace_option = []
-            ns_cmd_prefix = ""
         else:
             config_db = ConfigDBConnector(use_unix_socket_path=True, namespace=namespace)
             cfggen_namespace_option = ['-n', str(namespace)]
-            ns_cmd_prefix = "sudo ip netns exec {} ".format(namespace)
-        config_db.connect()
-        client = config_db.get_redis_client(config_db.CONFIG_DB)
-        client.flushdb()
+        with reload.stage('flush'):
+            config_db.connect()
+            client = config_db.get_redis_client(config_db.CONFIG_DB)
+            client.flushdb()
         if os.path.isfile('/etc/sonic/init_cfg.json'):
             command = [SONIC_CFGGEN_PATH, '-H', '-m', '-j', '/etc/sonic/init_cfg.json'] + cfggen_namespace_option + ['--write-to-db']
         else:
             command = [SONIC_CFGGEN_PATH, '-H', '-m', '--write-to-db'] + cfggen_namespace_option
-        clicommon.run_command(command, display_cmd=True)
-        client.set(config_db.INIT_INDICATOR, 1)
+        with reload.stage('load'):
+            reload.run_command(command, display_cmd=True)
+            client.set(config_db.INIT_INDICATOR, 1)
+
+    run_namespace_reloads('load_minigraph', namespace_list, load_namespace, parallel)
 
     # Update SONiC environmnet file
     update_sonic_environment()
@@ -2226,12 +2384,15 @@ def load_minigraph(db, no_service_restart, traffic_shift_away, override_config,
     # Write latest db version string into db
     db_migrator = '/usr/local/bin/db_migrator.py'
     if os.path.isfile(db_migrator) and os.access(db_migrator, os.X_OK):
-        for namespace in namespace_list:
-            if namespace is DEFAULT_NAMESPACE:
+        def set_version(reload):
+            if reload.namespace is DEFAULT_NAMESPACE:
                 cfggen_namespace_option = []
             else:
-                cfggen_namespace_option = ['-n', str(namespace)]
-            clicommon.run_command([db_migrator, '-o', 'set_version'] + cfggen_namespace_option)
+                cfggen_namespace_option = ['-n', str(reload.namespace)]
+            with reload.stage('set_version'):
+                reload.run_command([db_migrator, '-o', 'set_version'] + cfggen_namespace_option)
+
+        run_namespace_reloads('set_version', namespace_list, set_version, parallel)
 
     # Keep device isolated with TSA
     if traffic_shift_away:
@@ -4514,9 +4675,8 @@ def bgp():
     pass
 
 
-
 # BGP module extensions
-config.commands['bgp'].add_command(bgp_cli.DEVICE_GLOBAL)
+clicommon.add_lazy_commands(config.commands['bgp'], {'device-global': ('config.bgp_cli', 'DEVICE_GLOBAL')})
 
 #
 # 'shutdown' subgroup ('config bgp shutdown ...')
@@ -8978,7 +9138,7 @@ def smoothing_interval(interval, rates_type):
 
 # Load plugins and register them
 helper = util_base.UtilHelper()
-helper.load_and_register_plugins(plugins, config)
+helper.load_and_register_plugins(plugins, config, helper.get_plugins_manifest_path(plugins))
 
 #
 # 'subinterface' group ('config subinterface ...')
@@ -6,7 +6,7 @@ import click
 from tabulate import tabulate
 from sonic_py_common import multi_asic
 from utilities_common.constants import DEFAULT_NAMESPACE
-from dump.match_infra import RedisSource, JsonSource, MatchEngine, CONN
+from dump.match_infra import RedisSource, RedisPySource, JsonSource, MatchEngine
 from swsscommon.swsscommon import ConfigDBConnector
 from dump import plugins
 
@@ -108,6 +108,8 @@ def extract_rid(info, ns, conn_pool):
     r.connect("ASIC_DB", ns)
     vidtorid = {}
     vid_cache = {}  # Cache Entries to reduce number of Redis Calls
+    # Resolve the vids of all the args in one go
+    fill_vid_cache(r, [vid for arg in info.keys() for vid in get_vids(info[arg])], vid_cache)
     for arg in info.keys():
         mp = get_v_r_map(r, info[arg], vid_cache)
         if mp:
@@ -115,8 +117,8 @@ def extract_rid(info, ns, conn_pool):
     return vidtorid
 
 
-def get_v_r_map(r, single_dict, vid_cache):
-    v_r_map = {}
+def get_vids(single_dict):
+    vids = []
     asic_obj_ptrn = "ASIC_STATE:.*:oid:0x\w{1,14}"
 
     if "ASIC_DB" in single_dict and "keys" in single_dict["ASIC_DB"]:
@@ -124,13 +126,23 @@ def get_v_r_map(r, single_dict, vid_cache):
             if re.match(asic_obj_ptrn, redis_key):
                 matches = re.findall(r"oid:0x\w{1,14}", redis_key)
                 if matches:
-                    vid = matches[0]
-                    if vid in vid_cache:
-                        rid = vid_cache[vid]
-                    else:
-                        rid = r.hget("ASIC_DB", "VIDTORID", vid)
-                        vid_cache[vid] = rid
-                    v_r_map[vid] = rid if rid else "Real ID Not Found"
+                    vids.append(matches[0])
+    return vids
+
+
+def fill_vid_cache(r, vids, vid_cache):
+    missing_vids = list(dict.fromkeys(vid for vid in vids if vid not in vid_cache))
+    if missing_vids:
+        vid_cache.update(zip(missing_vids, r.hmget("ASIC_DB", "VIDTORID", missing_vids)))
+
+
+def get_v_r_map(r, single_dict, vid_cache):
+    v_r_map = {}
+    vids = get_vids(single_dict)
+    fill_vid_cache(r, vids, vid_cache)
+    for vid in vids:
+        rid = vid_cache[vid]
+        v_r_map[vid] = rid if rid else "Real ID Not Found"
     return v_r_map
 
 
@@ -151,16 +163,33 @@ def populate_fv(info, module, namespace, conn_pool, dash_object):
         for db_name in info[id].keys():
             all_dbs.add(db_name)
 
-    db_cfg_file = JsonSource()
+    dash_available = True
+    if dash_object and "APPL_DB" in all_dbs:
+        try:
+            from dump.dash_util import get_decoded_value  # noqa: F401
+        except ModuleNotFoundError:
+            dash_available = False
+
+    # Read the field-value pairs of all the keys of a db in one go
+    db_fvs = {}
     for db_name in all_dbs:
+        keys = list(dict.fromkeys(key for id in info.keys() if db_name in info[id]
+                                  for key in info[id][db_name]["keys"]))
         if db_name == "CONFIG_FILE":
-            db_cfg_file.connect(plugins.dump_modules[module].CONFIG_FILE, namespace)
+            src = JsonSource()
+            src.connect(plugins.dump_modules[module].CONFIG_FILE, namespace)
+            fvs = [src.get(db_name, key) for key in keys]
+        elif dash_object and db_name == "APPL_DB":
+            if not dash_available:
+                continue
+            src = RedisPySource(conn_pool, dash_object)
+            src.connect(db_name, namespace)
+            fvs = src.hgetall_many(db_name, keys)
         else:
-            conn_pool.get(db_name, namespace)
-    if dash_object:
-        conn_pool.get_dash_conn(namespace)
-        redis_conn = conn_pool.cache.get(namespace, {}).get("DASH_"+CONN, None)
-    db_conn = conn_pool.cache.get(namespace, {}).get(CONN, None)
+            src = RedisSource(conn_pool)
+            src.connect(db_name, namespace)
+            fvs = src.hgetall_many(db_name, keys)
+        db_fvs[db_name] = dict(zip(keys, fvs))
 
     final_info = {}
     for id in info.keys():
@@ -170,19 +199,10 @@ def populate_fv(info, module, namespace, conn_pool, dash_object):
             final_info[id][db_name]["keys"] = []
             final_info[id][db_name]["tables_not_found"] = info[id][db_name]["tables_not_found"]
             for key in info[id][db_name]["keys"]:
-                if db_name == "CONFIG_FILE":
-                    fv = db_cfg_file.get(db_name, key)
-                elif dash_object and db_name == "APPL_DB":
-                    try:
-                        from dump.dash_util import get_decoded_value
-                        pb_data = redis_conn.hgetall(key)
-                        fv = get_decoded_value(dash_object, pb_data)
-                    except ModuleNotFoundError:
-                        print("Issue in importing dash module!")
-                        return final_info
-                else:
-                    fv = db_conn.get_all(db_name, key)
-                final_info[id][db_name]["keys"].append({key: fv})
+                if db_name not in db_fvs:
+                    print("Issue in importing dash module!")
+                    return final_info
+                final_info[id][db_name]["keys"].append({key: db_fvs[db_name][key]})
     return final_info
 
 
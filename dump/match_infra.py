@@ -6,6 +6,7 @@ from dump.helper import verbose_print
 from swsscommon.swsscommon import SonicV2Connector, SonicDBConfig
 from sonic_py_common import multi_asic
 from utilities_common.constants import DEFAULT_NAMESPACE
+from utilities_common import bulk_db
 import redis
 
 
@@ -165,6 +166,18 @@ class SourceAdapter(ABC):
     def hgetall(self, db, key):
         raise NotImplementedError
 
+    def hget_many(self, db, keys, field):
+        """ Return the value of field for each of the keys, in the same order """
+        return [self.hget(db, key, field) for key in keys]
+
+    def hgetall_many(self, db, keys):
+        """ Return the field-value pairs of each of the keys, in the same order """
+        return [self.hgetall(db, key) for key in keys]
+
+    def hmget(self, db, key, fields):
+        """ Return the values of the fields of a single key, in the same order """
+        return [self.hget(db, key, field) for field in fields]
+
 
 class RedisSource(SourceAdapter):
     """ Concrete Adaptor Class for connecting to Redis Data Sources """
@@ -196,6 +209,15 @@ class RedisSource(SourceAdapter):
     def hgetall(self, db, key):
         return self.conn.get_all(db, key)
 
+    def hget_many(self, db, keys, field):
+        return bulk_db.hget_many(self.conn, db, keys, field)
+
+    def hgetall_many(self, db, keys):
+        return bulk_db.hgetall_many(self.conn, db, keys)
+
+    def hmget(self, db, key, fields):
+        return bulk_db.hmget(self.conn, db, key, fields)
+
 
 class RedisPySource(SourceAdapter):
     """ Concrete Adaptor Class for connecting to APPL_DB using Redis library"""
@@ -242,6 +264,21 @@ class RedisPySource(SourceAdapter):
         key_val = self.conn.hgetall(key)
         return self.get_decoded_value(self.pb_obj, key_val)
 
+    def get_raw_values(self, keys):
+        """ Read the protobuf encoded hashes of keys in a single round-trip """
+        if not hasattr(self.conn, "pipeline"):
+            return [self.conn.hgetall(key) for key in keys]
+        pipe = self.conn.pipeline(transaction=False)
+        for key in keys:
+            pipe.hgetall(key)
+        return pipe.execute()
+
+    def hget_many(self, db, keys, field):
+        return [decoded_dict.get(field) for decoded_dict in self.hgetall_many(db, keys)]
+
+    def hgetall_many(self, db, keys):
+        return [self.get_decoded_value(self.pb_obj, key_val) for key_val in self.get_raw_values(keys)]
+
 class JsonSource(SourceAdapter):
     """ Concrete Adaptor Class for connecting to JSON Data Sources """
 
@@ -400,8 +437,8 @@ class MatchEngine:
             return all_matched_keys
 
         filtered_keys = []
-        for key in all_matched_keys:
-            f_values = src.hget(req.db, key, req.field)
+        all_f_values = src.hget_many(req.db, all_matched_keys, req.field)
+        for key, f_values in zip(all_matched_keys, all_f_values):
             if not f_values:
                 continue
             if "," in f_values and not req.match_entire_list:
@@ -413,18 +450,18 @@ class MatchEngine:
         return filtered_keys
 
     def __fill_template(self, src, req, filtered_keys, template):
-        for key in filtered_keys:
-            temp = {}
-            if not req.just_keys:
-                temp[key] = src.get(req.db, key)
-                template["keys"].append(temp)
-            elif len(req.return_fields) > 0:
+        if not req.just_keys:
+            for key, fv in zip(filtered_keys, src.hgetall_many(req.db, filtered_keys)):
+                template["keys"].append({key: fv})
+        elif len(req.return_fields) > 0:
+            for key in filtered_keys:
                 template["keys"].append(key)
                 template["return_values"][key] = {}
-                for field in req.return_fields:
-                    template["return_values"][key][field] = src.hget(req.db, key, field)
-            else:
-                template["keys"].append(key)
+            for field in req.return_fields:
+                for key, value in zip(filtered_keys, src.hget_many(req.db, filtered_keys, field)):
+                    template["return_values"][key][field] = value
+        else:
+            template["keys"].extend(filtered_keys)
         verbose_print("Return Values:" + str(template["return_values"]))
         return template
 
@@ -83,6 +83,9 @@ class ChangeApplier:
             "BUFFER_PROFILE",
             "FLEX_COUNTER_TABLE"
         ]
+        # Running config as verified after the last applied change; reused
+        # as the starting point of the next change instead of re-reading it.
+        self.running_config = None
         if (not ChangeApplier.updater_conf) and os.path.exists(UPDATER_CONF_FILE):
             with open(UPDATER_CONF_FILE, "r") as s:
                 ChangeApplier.updater_conf = json.load(s)
@@ -137,8 +140,16 @@ class ChangeApplier:
         log_error("run_data vs expected_data: {}".format(
             str(jsondiff.diff(run_data, upd_data))[0:40]))
 
+    def _get_running_config(self):
+        # The snapshot is consumed here and only restored by a successful
+        # verification, so any failure forces a fresh read on the next change.
+        run_data, self.running_config = self.running_config, None
+        if run_data is None:
+            run_data = get_config_db_as_json(self.scope)
+        return run_data
+
     def apply(self, change):
-        run_data = get_config_db_as_json(self.scope)
+        run_data = self._get_running_config()
         upd_data = prune_empty_table(change.apply(copy.deepcopy(run_data)))
         upd_keys = defaultdict(dict)
 
@@ -148,11 +159,14 @@ class ChangeApplier:
         ret = self._services_validate(run_data, upd_data, upd_keys)
         if not ret:
             run_data = get_config_db_as_json(self.scope)
+            verified_data = copy.deepcopy(run_data)
             self.remove_backend_tables_from_config(upd_data)
             self.remove_backend_tables_from_config(run_data)
             if upd_data != run_data:
                 self._report_mismatch(run_data, upd_data)
                 ret = -1
+            else:
+                self.running_config = verified_data
         if ret:
             log_error("Failed to apply Json change")
         return ret
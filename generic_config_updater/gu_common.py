@@ -1,5 +1,6 @@
 import json
 import jsonpatch
+import hashlib
 import importlib
 from jsonpointer import JsonPointer
 import sonic_yang
@@ -7,9 +8,12 @@ import sonic_yang_ext
 import subprocess
 import yang as ly
 import copy
+import glob
 import re
 import os
+import threading
 from sonic_py_common import logger, multi_asic
+from swsscommon.swsscommon import ConfigDBPipeConnector
 from enum import Enum
 
 YANG_DIR = "/usr/local/yang-models"
@@ -55,9 +59,27 @@ class JsonChange:
 
 
 def get_config_db_as_json(scope=None):
-    text = get_config_db_as_text(scope=scope)
-    config_db_json = json.loads(text)
-    config_db_json.pop("bgpraw", None)
+    """
+    Read the running CONFIG_DB in-process, in the same format as
+    `sonic-cfggen -d --print-data`.
+
+    The whole database is read through ConfigDBPipeConnector, which
+    fetches the tables with pipelined requests instead of spawning a
+    sonic-cfggen process.
+    """
+    namespace = scope if scope is not None else multi_asic.DEFAULT_NAMESPACE
+    try:
+        config_db = ConfigDBPipeConnector(use_unix_socket_path=True, namespace=namespace)
+        config_db.connect()
+        data = config_db.get_config()
+    except Exception as ex:
+        raise GenericConfigUpdaterError(f"Failed to get running config for namespace: {scope},"
+                                        f" Error: {ex}")
+
+    data.pop("bgpraw", None)
+    config_db_json = {}
+    for table, entries in data.items():
+        config_db_json[table] = {config_db.serialize_key(key): entry for key, entry in entries.items()}
     return config_db_json
 
 
@@ -75,10 +97,105 @@ def get_config_db_as_text(scope=None):
     return text
 
 
+# sonic_yang.SonicYang objects with loaded models and the YANG table references
+# derived from them, shared by all the ConfigWrapper instances of the process.
+# Both are keyed by the hash of the YANG directory contents. The libyang
+# context of a SonicYang is not shared between threads, so the loaded models
+# are also keyed by thread.
+_loaded_sonic_yang_cache = {}
+_loaded_sonic_yang_cache_lock = threading.Lock()
+_yang_table_references_cache = {}
+
+
+def get_yang_dir_hash(yang_dir):
+    """
+    Returns a hash of the names and contents of the YANG models in yang_dir.
+    """
+    yang_dir_hash = hashlib.sha256()
+    for yang_file in sorted(glob.glob(os.path.join(yang_dir, "*.yang"))):
+        yang_dir_hash.update(os.path.basename(yang_file).encode())
+        with open(yang_file, "rb") as fh:
+            yang_dir_hash.update(fh.read())
+    return yang_dir_hash.hexdigest()
+
+
+def get_sonic_yang_with_loaded_models(yang_dir_hash, yang_dir, print_log_enabled):
+    """
+    Returns the sonic_yang.SonicYang of the calling thread with the models of yang_dir loaded.
+    The returned object must not be modified, callers should work on a copy.copy of it.
+    """
+    key = (yang_dir_hash, print_log_enabled, threading.get_ident())
+    with _loaded_sonic_yang_cache_lock:
+        loaded_models_sy = _loaded_sonic_yang_cache.get(key)
+    if loaded_models_sy is None:
+        loaded_models_sy = sonic_yang.SonicYang(yang_dir, print_log_enabled=print_log_enabled)
+        loaded_models_sy.loadYangModel()  # This call takes a long time (100s of ms) because it reads files from disk
+        with _loaded_sonic_yang_cache_lock:
+            _loaded_sonic_yang_cache[key] = loaded_models_sy
+    return loaded_models_sy
+
+
+def _get_yang_grouping_models(sy, model, table_module):
+    """
+    Returns the grouping models used by the given model, following nested 'uses'.
+    """
+    groupings = []
+    pending = [model]
+    seen = set()
+    while pending:
+        current = pending.pop()
+        if isinstance(current, list):
+            pending.extend(current)
+            continue
+        if not isinstance(current, dict):
+            continue
+        for key, value in current.items():
+            if key != 'uses':
+                pending.append(value)
+                continue
+            for uses in value if isinstance(value, list) else [value]:
+                name_parts = uses['@name'].split(':')
+                if len(name_parts) > 1:
+                    uses_module_name = sy._findYangModuleFromPrefix(name_parts[0].strip(), table_module)
+                else:
+                    uses_module_name = table_module['@name']
+                grouping_key = (uses_module_name, name_parts[-1].strip())
+                if grouping_key in seen:
+                    continue
+                seen.add(grouping_key)
+                grouping = sy.preProcessedYang['grouping'][grouping_key[0]][grouping_key[1]]
+                groupings.append(grouping)
+                pending.append(grouping)
+    return groupings
+
+
+def get_yang_table_references(sy):
+    """
+    Returns a dictionary mapping each table with a YANG model to the set of other tables it
+    references, by leafref, must or when statements.
+
+    The references are found by looking for table names in the table model (including the
+    groupings it uses), so the result can only over-approximate the real references. If
+    the model of a table cannot be resolved, the table is assumed to reference all tables.
+    """
+    tables = {table for table, cmap in sy.confDbYangMap.items() if 'container' in cmap}
+    references = {}
+    for table in tables:
+        cmap = sy.confDbYangMap[table]
+        try:
+            models = [cmap['container']] + _get_yang_grouping_models(sy, cmap['container'], cmap['yangModule'])
+            tokens = set(re.findall(r'\w+', json.dumps(models)))
+            references[table] = (tokens & tables) - {table}
+        except Exception:
+            references[table] = tables - {table}
+    return references
+
+
 class ConfigWrapper:
     def __init__(self, yang_dir=YANG_DIR, scope=multi_asic.DEFAULT_NAMESPACE):
         self.scope = scope
         self.yang_dir = YANG_DIR
+        self.yang_dir_hash = None
         self.sonic_yang_with_loaded_models = None
 
     def get_config_db_as_json(self):
@@ -137,7 +254,14 @@ class ConfigWrapper:
         except sonic_yang.SonicYangException as ex:
             return False, ex
 
-    def validate_config_db_config(self, config_db_as_json):
+    def validate_config_db_config(self, config_db_as_json, touched_tables=None):
+        """
+        Validates config_db_as_json against the YANG models.
+
+        If touched_tables is given, config_db_as_json is known to be valid except for the
+        touched tables, so only those tables and the tables linked to them by YANG references
+        are loaded and validated.
+        """
         sy = self.create_sonic_yang_with_loaded_models()
 
         # TODO: Move these validators to YANG models
@@ -145,7 +269,12 @@ class ConfigWrapper:
                                         self.validate_lanes]
 
         try:
-            tmp_config_db_as_json = copy.deepcopy(config_db_as_json)
+            if touched_tables is None:
+                tmp_config_db_as_json = copy.deepcopy(config_db_as_json)
+            else:
+                tmp_config_db_as_json = {table: copy.deepcopy(config_db_as_json[table])
+                                         for table in self.get_tables_to_validate(touched_tables)
+                                         if table in config_db_as_json}
 
             sy.loadData(tmp_config_db_as_json)
 
@@ -342,13 +471,42 @@ class ConfigWrapper:
                 config_with_non_empty_tables[table] = copy.deepcopy(config[table])
         return config_with_non_empty_tables
 
+    def get_tables_to_validate(self, touched_tables):
+        """
+        Returns the tables to validate when only touched_tables were modified in a valid config:
+        the touched tables, the tables referencing them, and everything those tables reference
+        (recursively) so that the references can be resolved.
+        """
+        sy = self.create_sonic_yang_with_loaded_models()
+        references = _yang_table_references_cache.get(self.yang_dir_hash)
+        if references is None:
+            references = _yang_table_references_cache.setdefault(self.yang_dir_hash,
+                                                                 get_yang_table_references(sy))
+
+        touched_tables = set(touched_tables)
+        tables = set(touched_tables)
+        for table, referenced_tables in references.items():
+            if referenced_tables & touched_tables:
+                tables.add(table)
+
+        pending = list(tables)
+        while pending:
+            for referenced_table in references.get(pending.pop(), ()):
+                if referenced_table not in tables:
+                    tables.add(referenced_table)
+                    pending.append(referenced_table)
+
+        return tables
+
     # TODO: move creating copies of sonic_yang with loaded models to sonic-yang-mgmt directly
     def create_sonic_yang_with_loaded_models(self):
-        # sonic_yang_with_loaded_models will only be initialized once the first time this method is called
+        # sonic_yang_with_loaded_models will only be initialized once the first time this method is called,
+        # the models themselves are loaded once per process for a given YANG directory content
         if self.sonic_yang_with_loaded_models is None:
             sonic_yang_print_log_enabled = genericUpdaterLogging.get_verbose()
-            loaded_models_sy = sonic_yang.SonicYang(self.yang_dir, print_log_enabled=sonic_yang_print_log_enabled)
-            loaded_models_sy.loadYangModel() # This call takes a long time (100s of ms) because it reads files from disk
+            self.yang_dir_hash = get_yang_dir_hash(self.yang_dir)
+            loaded_models_sy = get_sonic_yang_with_loaded_models(self.yang_dir_hash, self.yang_dir,
+                                                                 sonic_yang_print_log_enabled)
             self.sonic_yang_with_loaded_models = loaded_models_sy
 
         return copy.copy(self.sonic_yang_with_loaded_models)
@@ -606,6 +764,22 @@ class PathAddressing:
         # TODO: Also fetch references by must statement (check similar statements)
         return self._find_leafref_paths(path, config)
 
+    def find_ref_paths_many(self, paths, config):
+        """
+        Same as find_ref_paths for each of the given paths, but the config is loaded only once.
+        Returns a dictionary mapping each path to its referencing paths.
+        """
+        if not paths:
+            return {}
+
+        sy = self._create_sonic_yang_with_loaded_models()
+
+        tmp_config = copy.deepcopy(config)
+
+        sy.loadData(tmp_config)
+
+        return {path: self._find_leafref_paths_in_loaded_config(path, config, sy) for path in paths}
+
     def _find_leafref_paths(self, path, config):
         sy = self._create_sonic_yang_with_loaded_models()
 
@@ -613,6 +787,9 @@ class PathAddressing:
 
         sy.loadData(tmp_config)
 
+        return self._find_leafref_paths_in_loaded_config(path, config, sy)
+
+    def _find_leafref_paths_in_loaded_config(self, path, config, sy):
         xpath = self.convert_path_to_xpath(path, config, sy)
 
         leaf_xpaths = self._get_inner_leaf_xpaths(xpath, sy)
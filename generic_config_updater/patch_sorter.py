@@ -676,15 +676,39 @@ class DeleteWholeConfigMoveValidator:
 class FullConfigMoveValidator:
     """
     A class to validate that full config is valid according to YANG models after applying the move.
+
+    The configs found valid are remembered, a move applied to one of them only needs the tables
+    it touches, and the tables linked to them by YANG references, to be validated again.
     """
+    MAX_VALID_CONFIGS = 16
+
     def __init__(self, config_wrapper):
         self.config_wrapper = config_wrapper
+        self.valid_configs = deque(maxlen=FullConfigMoveValidator.MAX_VALID_CONFIGS)
 
     def validate(self, move, diff):
         simulated_config = move.apply(diff.current_config)
-        is_valid, error = self.config_wrapper.validate_config_db_config(simulated_config)
+        touched_tables = self._get_touched_tables(move)
+        if touched_tables and self._is_known_valid(diff.current_config):
+            is_valid, error = self.config_wrapper.validate_config_db_config(simulated_config,
+                                                                            touched_tables=touched_tables)
+        else:
+            is_valid, error = self.config_wrapper.validate_config_db_config(simulated_config)
+
+        if is_valid:
+            self.valid_configs.append(simulated_config)
         return is_valid
 
+    def _get_touched_tables(self, move):
+        # A move on the whole config (empty path) touches all the tables
+        tokens = move.current_config_tokens
+        if not isinstance(tokens, list) or not tokens:
+            return None
+        return {tokens[0]}
+
+    def _is_known_valid(self, config):
+        return any(config is valid_config or config == valid_config for valid_config in self.valid_configs)
+
 class CreateOnlyMoveValidator:
     """
     A class to validate create-only fields are only created, but never modified/updated. In other words:
@@ -936,8 +960,8 @@ class NoDependencyMoveValidator:
 
     def _find_ref_paths(self, paths, config):
         refs = []
-        for path in paths:
-            refs.extend(self.path_addressing.find_ref_paths(path, config))
+        for path_refs in self.path_addressing.find_ref_paths_many(paths, config).values():
+            refs.extend(path_refs)
         return refs
 
 class NoEmptyTableMoveValidator:
@@ -1624,10 +1648,139 @@ class MemoizationSorter:
         self.mem[diff_hash] = bst_moves
         return bst_moves
 
+
+class DependencySorter:
+    """
+    A sorter that orders the key level operations of the diff according to the leafref dependencies
+    between the changed keys, instead of searching through all the possible moves:
+      - A key referencing an added key is added/replaced after it.
+      - A key referencing a removed key is removed/replaced before it.
+
+    The references of all the changed keys are found by loading the current and the target configs only
+    once. Every move is still checked by the move validators before it is taken. The operations which are
+    rejected by the validators (e.g. create-only fields, required values) or which are part of a dependency
+    cycle are left to the fallback sorter.
+    """
+    def __init__(self, move_wrapper, path_addressing, fallback_sorter=None):
+        self.move_wrapper = move_wrapper
+        self.path_addressing = path_addressing
+        self.fallback_sorter = fallback_sorter if fallback_sorter else DfsSorter(move_wrapper)
+
+    def sort(self, diff):
+        if diff.has_no_diff():
+            return []
+
+        operations = self._get_key_operations(diff)
+        dependents, dependencies_count, self_dependent = self._get_dependencies(diff, operations)
+
+        moves = []
+        current_diff = diff
+        ready = deque(operation for operation in operations if not dependencies_count[operation])
+        while ready:
+            operation = ready.popleft()
+            move = self._create_move(current_diff, operation)
+            if not self._validate(move, current_diff, operation in self_dependent):
+                # Leave the operation, and everything depending on it, to the fallback sorter
+                continue
+
+            moves.append(move)
+            current_diff = self.move_wrapper.simulate(move, current_diff)
+            for dependent in dependents[operation]:
+                dependencies_count[dependent] -= 1
+                if not dependencies_count[dependent]:
+                    ready.append(dependent)
+
+        if current_diff.has_no_diff():
+            return moves
+
+        remaining_moves = self.fallback_sorter.sort(current_diff)
+        if remaining_moves is not None:
+            return moves + remaining_moves
+
+        # The moves taken so far might have made the remaining operations impossible, search from the start
+        return self.fallback_sorter.sort(diff)
+
+    def _get_key_operations(self, diff):
+        """
+        Returns the (operation type, table, key) tuples transforming the current config to the target
+        config one key at a time, removals first.
+        """
+        removed, replaced, added = [], [], []
+        for table in sorted(set(diff.current_config) | set(diff.target_config)):
+            current_table = diff.current_config.get(table, {})
+            target_table = diff.target_config.get(table, {})
+            if not isinstance(current_table, dict) or not isinstance(target_table, dict):
+                continue
+            for key in current_table:
+                if key not in target_table:
+                    removed.append((OperationType.REMOVE, table, key))
+                elif current_table[key] != target_table[key]:
+                    replaced.append((OperationType.REPLACE, table, key))
+            for key in target_table:
+                if key not in current_table:
+                    added.append((OperationType.ADD, table, key))
+        return removed + replaced + added
+
+    def _get_dependencies(self, diff, operations):
+        """
+        Returns the dependents of each operation, the number of operations each operation depends on,
+        and the set of operations whose key references itself.
+        """
+        keys = {(table, key): operation for operation in operations for _, table, key in [operation]}
+        dependents = {operation: [] for operation in operations}
+        dependencies_count = {operation: 0 for operation in operations}
+        self_dependent = set()
+
+        def add_dependency(operation, dependent):
+            dependents[operation].append(dependent)
+            dependencies_count[dependent] += 1
+
+        for op_type, config in [(OperationType.REMOVE, diff.current_config), (OperationType.ADD, diff.target_config)]:
+            paths = {self.path_addressing.create_path([table, key]): (op, table, key)
+                     for (op, table, key) in operations if op == op_type}
+            for path, ref_paths in self.path_addressing.find_ref_paths_many(list(paths), config).items():
+                operation = paths[path]
+                for ref_path in ref_paths:
+                    if ref_path.startswith(path):
+                        self_dependent.add(operation)
+                    ref_tokens = self.path_addressing.get_path_tokens(ref_path)
+                    ref_operation = keys.get(tuple(ref_tokens[:2]))
+                    if ref_operation is None or ref_operation == operation or ref_operation[0] == OperationType.ADD \
+                            and op_type == OperationType.REMOVE:
+                        continue
+                    if op_type == OperationType.REMOVE:
+                        # The referencing key must stop referencing the removed key first
+                        add_dependency(ref_operation, operation)
+                    elif ref_operation[0] != OperationType.REMOVE:
+                        # The added key must exist before the referencing key is added/replaced
+                        add_dependency(operation, ref_operation)
+
+        return dependents, dependencies_count, self_dependent
+
+    def _create_move(self, diff, operation):
+        op_type, table, key = operation
+        if op_type == OperationType.REMOVE and len(diff.current_config[table]) == 1:
+            # Removing the last key removes the table, empty tables do not show up in ConfigDB
+            return JsonMove(diff, op_type, [table])
+        return JsonMove(diff, op_type, [table, key], [table, key])
+
+    def _validate(self, move, diff, self_dependent):
+        for validator in self.move_wrapper.move_validators:
+            if isinstance(validator, NoDependencyMoveValidator) and move.op_type != OperationType.REPLACE \
+                    and len(move.current_config_tokens) == 2:
+                # Already known from the references found while ordering the operations
+                if self_dependent:
+                    return False
+                continue
+            if not validator.validate(move, diff):
+                return False
+        return True
+
 class Algorithm(Enum):
     DFS = 1
     BFS = 2
     MEMOIZATION = 3
+    DEPENDENCY = 4
 
 class SortAlgorithmFactory:
     def __init__(self, operation_wrapper, config_wrapper, path_addressing):
@@ -1660,6 +1813,8 @@ class SortAlgorithmFactory:
             sorter = BfsSorter(move_wrapper)
         elif algorithm == Algorithm.MEMOIZATION:
             sorter = MemoizationSorter(move_wrapper)
+        elif algorithm == Algorithm.DEPENDENCY:
+            sorter = DependencySorter(move_wrapper, self.path_addressing)
         else:
             raise ValueError(f"Algorithm {algorithm} is not supported")
 
@@ -1915,6 +2070,10 @@ class NonStrictPatchSorter:
         return changes
 
 class PatchSorter:
+    # Patches with at least this many operations are sorted by following the dependencies between the
+    # changed keys rather than searching through the possible moves, see DependencySorter
+    DEPENDENCY_SORT_MIN_OPERATIONS = 100
+
     def __init__(self, config_wrapper, patch_wrapper, sort_algorithm_factory=None):
         self.config_wrapper = config_wrapper
         self.patch_wrapper = patch_wrapper
@@ -1929,6 +2088,10 @@ class PatchSorter:
 
         diff = Diff(current_config, target_config)
 
+        if algorithm == Algorithm.DFS and isinstance(patch, jsonpatch.JsonPatch) and \
+                len(patch.patch) >= self.DEPENDENCY_SORT_MIN_OPERATIONS:
+            algorithm = Algorithm.DEPENDENCY
+
         sort_algorithm = self.sort_algorithm_factory.create(algorithm)
         moves = sort_algorithm.sort(diff)
 
@@ -8,7 +8,7 @@ from natsort import natsorted
 from sonic_py_common.multi_asic import get_external_ports
 from tabulate import tabulate
 from utilities_common import multi_asic as multi_asic_util
-from utilities_common import constants
+from utilities_common import bulk_db, constants
 from utilities_common.general import load_db_config
 from sonic_py_common import logger
 
@@ -53,6 +53,9 @@ CONFIG_DESCRIPTION = [
     ('RESTORATION TIME', 'restoration_time', 'infinite')
 ]
 
+# Fields read from the COUNTERS:<queue oid> hashes: the OK/DROP counter pairs, then the status
+STATS_FIELDS = [field for stat in STATS_DESCRIPTION for field in stat[1:]] + ['PFC_WD_STATUS']
+
 STATS_HEADER = ('QUEUE', 'STATUS',) + list(zip(*STATS_DESCRIPTION))[0]
 CONFIG_HEADER = ('PORT',) + list(zip(*CONFIG_DESCRIPTION))[0]
 
@@ -65,8 +68,10 @@ def cli():
     """ SONiC PFC Watchdog """
     load_db_config()
 
-def get_all_queues(db, namespace=None, display=constants.DISPLAY_ALL):
-    queue_names = db.get_all(db.COUNTERS_DB, 'COUNTERS_QUEUE_NAME_MAP')
+
+def get_all_queues(db, namespace=None, display=constants.DISPLAY_ALL, queue_names=None):
+    if queue_names is None:
+        queue_names = db.get_all(db.COUNTERS_DB, 'COUNTERS_QUEUE_NAME_MAP')
     queues = list(queue_names.keys()) if queue_names else {}
     if display == constants.DISPLAY_ALL:
         return natsorted(queues)
@@ -128,42 +133,53 @@ class PfcwdCli(object):
         self.table = []
         self.all_ports = []
 
-    @multi_asic_util.run_on_multi_asic
+    @multi_asic_util.run_on_multi_asic_concurrently
     def collect_stats(self, empty, queues):
+        """
+        Returns the stats table of the namespace. The queue name map is read
+        once and the stats of all the queues are read with pipelined HGETALLs,
+        all-zero rows are filtered on the raw values. Queues without a
+        COUNTERS hash are skipped, even with empty.
+        """
         table = []
 
+        queue_names = self.db.get_all(
+            self.db.COUNTERS_DB, 'COUNTERS_QUEUE_NAME_MAP'
+        ) or {}
         if len(queues) == 0:
             queues = get_all_queues(
                 self.db,
                 self.multi_asic.current_namespace,
-                self.multi_asic.display_option
+                self.multi_asic.display_option,
+                queue_names
             )
 
-        for queue in queues:
-            stats_list = []
-            queue_oid = self.db.get(
-                self.db.COUNTERS_DB, 'COUNTERS_QUEUE_NAME_MAP', queue
-            )
-            if queue_oid is None:
+        queues = [queue for queue in queues if queue in queue_names]
+        all_fvs = bulk_db.hgetall_many(
+            self.db, self.db.COUNTERS_DB,
+            ['COUNTERS:' + queue_names[queue] for queue in queues]
+        )
+
+        for queue, fvs in zip(queues, all_fvs):
+            if not fvs:
                 continue
-            stats = self.db.get_all(
-                self.db.COUNTERS_DB, 'COUNTERS:' + queue_oid
-            )
-            if stats is None:
+            stats = [fvs.get(field) for field in STATS_FIELDS]
+            counters = stats[:-1]
+            if not empty and all(value in (None, '0') for value in counters):
                 continue
-            for stat in STATS_DESCRIPTION:
-                line = stats.get(stat[1], '0') + '/' + stats.get(stat[2], '0')
-                stats_list.append(line)
-            if stats_list != ['0/0'] * len(STATS_DESCRIPTION) or empty:
-                table.append(
-                    [queue, stats.get('PFC_WD_STATUS', 'N/A')] + stats_list
-                )
+            stats_list = [
+                ('0' if ok is None else ok) + '/' + ('0' if drop is None else drop)
+                for ok, drop in zip(counters[0::2], counters[1::2])
+            ]
+            status = 'N/A' if stats[-1] is None else stats[-1]
+            table.append([queue, status] + stats_list)
 
-        self.table += table
+        return table
 
     def show_stats(self, empty, queues):
         del self.table[:]
-        self.collect_stats(empty, queues)
+        for table in self.collect_stats(empty, queues):
+            self.table += table
         click.echo(tabulate(
             self.table, STATS_HEADER, stralign='right', numalign='right',
             tablefmt='simple'
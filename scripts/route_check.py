@@ -19,6 +19,16 @@ How:
     5) Rule out local interfaces & default routes
     6) If still outstanding diffs, report failure.
 
+Incremental mode:
+    With --incremental and a scan interval, the APPL-DB & ASIC-DB route
+    sets of each namespace are kept in memory across scans. They are
+    loaded once from the ROUTE_TABLE & ASIC_STATE subscriptions, and
+    every later scan only applies the SET/DEL updates received since the
+    previous one and re-diffs the changed prefixes. The FRR routes are
+    checked on every scan, as routes stuck not offloaded in FRR don't
+    change APPL-DB. A full resync is done every --resync_interval seconds
+    as a safety net.
+
 To verify:
     Run this tool in SONiC switch and watch the result. In case of failure
     checkout the result to validate the failure.
@@ -48,7 +58,8 @@ import traceback
 import subprocess
 import concurrent.futures
 
-from ipaddress import ip_network
+from collections import Counter
+from ipaddress import ip_interface, ip_network
 from swsscommon import swsscommon
 from utilities_common import chassis
 from sonic_py_common import multi_asic, device_info
@@ -71,9 +82,14 @@ os.environ['PYTHONUNBUFFERED']='True'
 PREFIX_SEPARATOR = '/'
 IPV6_SEPARATOR = ':'
 
+# Flag bit of the packed IPv6 prefixes, above the 128 address & 8 prefix length bits
+IPV6_PACKED_FLAG = 1 << 136
+
 MIN_SCAN_INTERVAL = 10      # Every 10 seconds
 MAX_SCAN_INTERVAL = 3600    # An hour
 
+FULL_RESYNC_INTERVAL = 3600     # Full resync of the incremental mode snapshot, every hour
+
 PRINT_MSG_LEN_MAX = 1000
 
 FRR_CHECK_RETRIES = 3
@@ -233,16 +249,147 @@ def diff_sorted_lists(t1, t2):
     return t1_miss, t2_miss
 
 
+def pack_prefix(prefix):
+    """
+    helper to pack a prefix into a single integer: the address followed
+    by a byte of prefix length, and a flag bit for IPv6. IPv4 prefixes
+    stay small ints, and the packed prefixes are hashable so that the
+    route sets are diffed with set operations. Host bits are kept, so
+    that prefixes match exactly like their strings.
+    :param prefix: prefix as ip_interface or string
+    :return packed prefix as int
+    :raises ValueError: if prefix is not an IP prefix
+    """
+    if isinstance(prefix, str):
+        prefix = ip_interface(prefix)
+    packed = (int(prefix.ip) << 8) | prefix.network.prefixlen
+    if prefix.version == 6:
+        packed |= IPV6_PACKED_FLAG
+    return packed
+
+
+def format_prefix(packed):
+    """
+    helper to turn a packed prefix back to its string form.
+    :param packed: packed prefix as int
+    :return prefix as string
+    """
+    prefixlen = packed & 0xff
+    if packed & IPV6_PACKED_FLAG:
+        return str(ipaddress.IPv6Interface(((packed ^ IPV6_PACKED_FLAG) >> 8, prefixlen)))
+    return str(ipaddress.IPv4Interface((packed >> 8, prefixlen)))
+
+
+def format_prefixes(packed_list):
+    """
+    helper to turn packed prefixes back to a sorted list of strings.
+    """
+    return sorted(format_prefix(p) for p in packed_list)
+
+
+class PrefixSet(object):
+    """
+    Multiset of packed prefixes. The unique prefixes are kept in a set,
+    and the few prefixes present more than once (e.g. in several VRFs)
+    have their extra count in a Counter, so that diffing two sets is a
+    C level set difference.
+    """
+
+    def __init__(self, prefixes=()):
+        self.prefixes = set()
+        self.extra = Counter()
+        for prefix in prefixes:
+            self.add(prefix)
+
+    def __contains__(self, prefix):
+        return prefix in self.prefixes
+
+    def __len__(self):
+        return len(self.prefixes) + sum(self.extra.values())
+
+    def __iter__(self):
+        return iter(self.prefixes)
+
+    def add(self, prefix):
+        if prefix in self.prefixes:
+            self.extra[prefix] += 1
+        else:
+            self.prefixes.add(prefix)
+
+    def remove(self, prefix):
+        if self.extra.get(prefix):
+            self.extra[prefix] -= 1
+            if not self.extra[prefix]:
+                del self.extra[prefix]
+        else:
+            self.prefixes.discard(prefix)
+
+    def count(self, prefix):
+        return (prefix in self.prefixes) + self.extra.get(prefix, 0)
+
+    def difference(self, other):
+        """
+        :return list of the packed prefixes of this set not in other,
+        repeated as many times as they are in excess.
+        """
+        diff = self.prefixes - other.prefixes
+        miss = list(diff)
+        for prefix in self.extra:
+            excess = self.count(prefix) - other.count(prefix) - (prefix in diff)
+            if excess > 0:
+                miss.extend([prefix] * excess)
+        return miss
+
+
+def diff_prefix_sets(s1, s2):
+    """
+    helper to compare two prefix sets.
+    :param s1: PrefixSet 1
+    :param s2: PrefixSet 2
+    :return (<sorted s1 prefixes not in s2>, <sorted s2 prefixes not in s1>) as strings
+    """
+    return format_prefixes(s1.difference(s2)), format_prefixes(s2.difference(s1))
+
+
+def parse_route_key(k, prefix):
+    """
+    helper to parse the prefix of a route key, invalid keys are reported.
+    :param k: route key as string
+    :param prefix: prefix of the key as string
+    :return prefix as ip_interface or None if it is invalid
+    """
+    try:
+        return ip_interface(prefix)
+    except ValueError:
+        print_message(syslog.LOG_WARNING, "Skipping route {} with invalid prefix {}".format(k, prefix))
+        return None
+
+
 def checkout_rt_entry(k):
     """
     helper to filter out correct keys and strip out IP alone.
     :param ip: key to check as string
-    :return (True, ip) or (False, None)
+    :return (True, packed prefix) or (False, None)
     """
     if k.startswith(ASIC_KEY_PREFIX):
-        e = k.lower()[len(ASIC_KEY_PREFIX) + len('{"dest":"'):].split("\"", 1)[0]
-        if not is_local(e):
-            return True, e
+        e = k[len(ASIC_KEY_PREFIX) + len('{"dest":"'):].split("\"", 1)[0]
+        intf = parse_route_key(k, e)
+        if intf is not None and not intf.ip.is_link_local:
+            return True, pack_prefix(intf)
+    return False, None
+
+
+def checkout_appl_rt_entry(k):
+    """
+    helper to filter out local APPL-DB routes and normalize the prefix.
+    :param k: APPL-DB ROUTE_TABLE key
+    :return (True, packed prefix) or (False, None)
+    """
+    e = k.split(":", 1)[1] if is_vrf(k) else k
+
+    intf = parse_route_key(k, e)
+    if intf is not None and not intf.ip.is_link_local:
+        return True, pack_prefix(intf)
     return False, None
 
 
@@ -272,9 +419,11 @@ def get_subscribe_updates(selector, subs):
                 elif op == "DEL":
                     deletes.append(e)
 
+    adds = format_prefixes(adds)
+    deletes = format_prefixes(deletes)
     print_message(syslog.LOG_DEBUG, "adds={}".format(adds))
     print_message(syslog.LOG_DEBUG, "dels={}".format(deletes))
-    return (sorted(adds), sorted(deletes))
+    return (adds, deletes)
 
 
 def is_vrf(k):
@@ -284,49 +433,49 @@ def is_vrf(k):
 def get_appdb_routes(namespace):
     """
     helper to read route table from APPL-DB.
-    :return list of sorted routes with prefix ensured
+    :return PrefixSet of the routes
     """
     db = swsscommon.DBConnector(APPL_DB_NAME, REDIS_TIMEOUT_MSECS, True, namespace)
     print_message(syslog.LOG_DEBUG, "APPL DB connected for routes")
     tbl = swsscommon.Table(db, 'ROUTE_TABLE')
     keys = tbl.getKeys()
 
-    valid_rt = []
+    valid_rt = PrefixSet()
     for k in keys:
-        if (is_vrf(k)):
-            k = k.split(":", 1)[1]
-
-        if not is_local(k):
-            valid_rt.append(add_prefix_ifnot(k.lower()))
+        res, e = checkout_appl_rt_entry(k)
+        if res:
+            valid_rt.add(e)
 
-    print_message(syslog.LOG_DEBUG, json.dumps({"ROUTE_TABLE": sorted(valid_rt)}, indent=4))
-    return sorted(valid_rt)
+    if report_level >= syslog.LOG_DEBUG:
+        print_message(syslog.LOG_DEBUG, json.dumps({"ROUTE_TABLE": format_prefixes(valid_rt)}, indent=4))
+    return valid_rt
 
 
 def get_asicdb_routes(namespace):
     """
     helper to read present route entries from ASIC-DB and
     as well initiate selector for ASIC-DB:ASIC-state updates.
-    :return (selector,  subscriber, <list of sorted routes>)
+    :return (selector,  subscriber, <PrefixSet of the routes>)
     """
     db = swsscommon.DBConnector(ASIC_DB_NAME, REDIS_TIMEOUT_MSECS, True, namespace)
     subs = swsscommon.SubscriberStateTable(db, ASIC_TABLE_NAME)
     print_message(syslog.LOG_DEBUG, "ASIC DB {} connected".format(namespace))
 
-    rt = []
+    rt = PrefixSet()
     while True:
         k, _, _ = subs.pop()
         if not k:
             break
         res, e = checkout_rt_entry(k)
         if res:
-            rt.append(e)
+            rt.add(e)
 
-    print_message(syslog.LOG_DEBUG, json.dumps({"ASIC_ROUTE_ENTRY": sorted(rt)}, indent=4))
+    if report_level >= syslog.LOG_DEBUG:
+        print_message(syslog.LOG_DEBUG, json.dumps({"ASIC_ROUTE_ENTRY": format_prefixes(rt)}, indent=4))
 
     selector = swsscommon.Select()
     selector.addSelectable(subs)
-    return (selector, subs, sorted(rt))
+    return (selector, subs, rt)
 
 
 def is_suppress_fib_pending_enabled(namespace):
@@ -612,7 +761,7 @@ def mitigate_installed_not_offloaded_frr_routes(namespace, missed_frr_rt, rt_app
     """
     db = swsscommon.DBConnector('APPL_STATE_DB', REDIS_TIMEOUT_MSECS, True, namespace)
     response_producer = swsscommon.NotificationProducer(db, f'{APPL_DB_NAME}_{swsscommon.APP_ROUTE_TABLE_NAME}_RESPONSE_CHANNEL')
-    for entry in [entry for entry in missed_frr_rt if entry['prefix'] in rt_appl]:
+    for entry in [entry for entry in missed_frr_rt if pack_prefix(entry['prefix']) in rt_appl]:
         fvs = swsscommon.FieldValuePairs([('err_str', 'SWSS_RC_SUCCESS'), ('protocol', entry['protocol'])])
         response_producer.send('SWSS_RC_SUCCESS', entry['prefix'], fvs)
 
@@ -704,6 +853,67 @@ def filter_out_vlan_neigh_route_miss(namespace, rt_appl_miss, rt_asic_miss):
     return rt_appl_miss, rt_asic_miss
 
 
+def filter_out_route_misses(namespace, intf_appl, rt_appl_miss, rt_asic_miss):
+    """
+    Rule out the APPL-DB & ASIC-DB route misses which are expected.
+    :param intf_appl: sorted APPL-DB INTF_TABLE addresses
+    :param rt_appl_miss: sorted APPL-DB routes missing in ASIC-DB
+    :param rt_asic_miss: sorted ASIC-DB routes missing in APPL-DB
+    :return (rt_appl_miss, rt_asic_miss) filtered
+    """
+    # Check missed ASIC routes against APPL-DB INTF_TABLE
+    _, rt_asic_miss = diff_sorted_lists(intf_appl, rt_asic_miss)
+    rt_asic_miss = filter_out_default_routes(rt_asic_miss)
+    rt_asic_miss = filter_out_vnet_routes(namespace, rt_asic_miss)
+    rt_asic_miss = filter_out_standalone_tunnel_routes(namespace, rt_asic_miss)
+    rt_asic_miss = filter_out_soc_ip_routes(namespace, rt_asic_miss)
+
+    if rt_appl_miss:
+        rt_appl_miss = filter_out_local_interfaces(namespace, rt_appl_miss)
+
+    if rt_appl_miss:
+        rt_appl_miss = filter_out_voq_neigh_routes(namespace, rt_appl_miss)
+
+    # NOTE: On dualtor environment, ignore any route miss for the
+    # neighbors learned from the vlan subnet.
+    if rt_appl_miss or rt_asic_miss:
+        rt_appl_miss, rt_asic_miss = filter_out_vlan_neigh_route_miss(namespace, rt_appl_miss, rt_asic_miss)
+
+    return rt_appl_miss, rt_asic_miss
+
+
+def get_route_check_results(namespace, rt_appl, rt_appl_miss, intf_appl_miss, rt_asic_miss):
+    """
+    Build the results of a namespace check and check the FRR routes.
+    :param rt_appl: APPL-DB routes, used to mitigate the FRR routes not offloaded
+    :return results dict; empty if all good
+    """
+    results = {}
+
+    if rt_appl_miss:
+        results["missed_ROUTE_TABLE_routes"] = rt_appl_miss
+
+    if intf_appl_miss:
+        results["missed_INTF_TABLE_entries"] = intf_appl_miss
+
+    if rt_asic_miss:
+        results["Unaccounted_ROUTE_ENTRY_TABLE_entries"] = rt_asic_miss
+
+    rt_frr_miss = check_frr_pending_routes(namespace)
+
+    if rt_frr_miss:
+        results["missed_FRR_routes"] = rt_frr_miss
+
+    if results:
+        if rt_frr_miss and not rt_appl_miss and not rt_asic_miss:
+            print_message(syslog.LOG_ERR, "Some routes are not set offloaded in FRR{} \
+                          but all routes in APPL_DB and ASIC_DB are in sync".format(namespace))
+            if is_suppress_fib_pending_enabled(namespace):
+                mitigate_installed_not_offloaded_frr_routes(namespace, rt_frr_miss, rt_appl)
+
+    return results
+
+
 def check_routes_for_namespace(namespace):
     """
     Process a Single Namespace:
@@ -725,13 +935,11 @@ def check_routes_for_namespace(namespace):
     the unjustifiable entries.
     """
 
-    results = {}
     adds = []
     deletes = []
     intf_appl_miss = []
     rt_appl_miss = []
     rt_asic_miss = []
-    rt_frr_miss = []
 
     selector, subs, rt_asic = get_asicdb_routes(namespace)
 
@@ -739,28 +947,12 @@ def check_routes_for_namespace(namespace):
     intf_appl = get_interfaces(namespace)
 
     # Diff APPL-DB routes & ASIC-DB routes
-    rt_appl_miss, rt_asic_miss = diff_sorted_lists(rt_appl, rt_asic)
-
-    # Check missed ASIC routes against APPL-DB INTF_TABLE
-    _, rt_asic_miss = diff_sorted_lists(intf_appl, rt_asic_miss)
-    rt_asic_miss = filter_out_default_routes(rt_asic_miss)
-    rt_asic_miss = filter_out_vnet_routes(namespace, rt_asic_miss)
-    rt_asic_miss = filter_out_standalone_tunnel_routes(namespace, rt_asic_miss)
-    rt_asic_miss = filter_out_soc_ip_routes(namespace, rt_asic_miss)
+    rt_appl_miss, rt_asic_miss = diff_prefix_sets(rt_appl, rt_asic)
 
     # Check APPL-DB INTF_TABLE with ASIC table route entries
-    intf_appl_miss, _ = diff_sorted_lists(intf_appl, rt_asic)
+    intf_appl_miss = [ip for ip in intf_appl if pack_prefix(ip) not in rt_asic]
 
-    if rt_appl_miss:
-        rt_appl_miss = filter_out_local_interfaces(namespace, rt_appl_miss)
-
-    if rt_appl_miss:
-        rt_appl_miss = filter_out_voq_neigh_routes(namespace, rt_appl_miss)
-
-    # NOTE: On dualtor environment, ignore any route miss for the
-    # neighbors learned from the vlan subnet.
-    if rt_appl_miss or rt_asic_miss:
-        rt_appl_miss, rt_asic_miss = filter_out_vlan_neigh_route_miss(namespace, rt_appl_miss, rt_asic_miss)
+    rt_appl_miss, rt_asic_miss = filter_out_route_misses(namespace, intf_appl, rt_appl_miss, rt_asic_miss)
 
     if rt_appl_miss or rt_asic_miss:
         # Look for subscribe updates for a second
@@ -772,33 +964,188 @@ def check_routes_for_namespace(namespace):
     # Drop all those for which DEL received
     rt_asic_miss, _ = diff_sorted_lists(rt_asic_miss, deletes)
 
-    if rt_appl_miss:
-        results["missed_ROUTE_TABLE_routes"] = rt_appl_miss
+    results = get_route_check_results(namespace, rt_appl, rt_appl_miss, intf_appl_miss, rt_asic_miss)
 
-    if intf_appl_miss:
-        results["missed_INTF_TABLE_entries"] = intf_appl_miss
+    return results, adds, deletes
 
-    if rt_asic_miss:
-        results["Unaccounted_ROUTE_ENTRY_TABLE_entries"] = rt_asic_miss
 
-    rt_frr_miss = check_frr_pending_routes(namespace)
+class RouteSnapshot(object):
+    """
+    In-memory APPL-DB & ASIC-DB route sets of a namespace, for the
+    incremental mode.
+    """
 
-    if rt_frr_miss:
-        results["missed_FRR_routes"] = rt_frr_miss
+    def __init__(self, namespace, resync_interval=FULL_RESYNC_INTERVAL):
+        self.namespace = namespace
+        self.resync_interval = resync_interval
+        self.resync()
+
+    def resync(self):
+        """
+        Rebuild the route sets from scratch with new subscriptions.
+        """
+        appl_db = swsscommon.DBConnector(APPL_DB_NAME, REDIS_TIMEOUT_MSECS, True, self.namespace)
+        self.appl_subs = swsscommon.SubscriberStateTable(appl_db, 'ROUTE_TABLE')
+        asic_db = swsscommon.DBConnector(ASIC_DB_NAME, REDIS_TIMEOUT_MSECS, True, self.namespace)
+        self.asic_subs = swsscommon.SubscriberStateTable(asic_db, ASIC_TABLE_NAME)
+        self.selector = swsscommon.Select()
+        self.selector.addSelectable(self.appl_subs)
+        self.selector.addSelectable(self.asic_subs)
+        print_message(syslog.LOG_DEBUG, "Route snapshot {} resync".format(self.namespace))
+
+        # Key -> packed prefix, to account the DEL updates
+        self.appl_keys = {}
+        self.asic_keys = {}
+        self.appl_routes = PrefixSet()
+        self.asic_routes = PrefixSet()
+        self.last_resync = time.time()
+
+        self.update()
+        self.appl_miss = Counter(self.appl_routes.difference(self.asic_routes))
+        self.asic_miss = Counter(self.asic_routes.difference(self.appl_routes))
+
+    def _apply(self, keys, routes, key, op, prefix, changed):
+        old = keys.pop(key, None)
+        if old is not None:
+            routes.remove(old)
+            changed.add(old)
+
+        if op == "SET" and prefix is not None:
+            keys[key] = prefix
+            routes.add(prefix)
+            changed.add(prefix)
+
+    def update(self):
+        """
+        Apply the pending subscribe updates.
+        :return (changed packed prefixes, ASIC-DB added prefixes, ASIC-DB deleted prefixes)
+        """
+        changed = set()
+        adds = []
+        deletes = []
+        while True:
+            key, op, _ = self.appl_subs.pop()
+            if not key:
+                break
+            _, e = checkout_appl_rt_entry(key)
+            self._apply(self.appl_keys, self.appl_routes, key, op, e, changed)
 
-    if results:
-        if rt_frr_miss and not rt_appl_miss and not rt_asic_miss:
-            print_message(syslog.LOG_ERR, "Some routes are not set offloaded in FRR{} \
-                          but all routes in APPL_DB and ASIC_DB are in sync".format(namespace))
-            if is_suppress_fib_pending_enabled(namespace):
-                mitigate_installed_not_offloaded_frr_routes(namespace, rt_frr_miss, rt_appl)
+        while True:
+            key, op, _ = self.asic_subs.pop()
+            if not key:
+                break
+            res, e = checkout_rt_entry(key)
+            if res:
+                if op == "SET":
+                    adds.append(e)
+                elif op == "DEL":
+                    deletes.append(e)
+            self._apply(self.asic_keys, self.asic_routes, key, op, e, changed)
+
+        return changed, adds, deletes
+
+    def rediff(self, prefixes):
+        """
+        Recompute the misses of the given packed prefixes.
+        """
+        for prefix in prefixes:
+            diff = self.appl_routes.count(prefix) - self.asic_routes.count(prefix)
+            self.appl_miss.pop(prefix, None)
+            self.asic_miss.pop(prefix, None)
+            if diff > 0:
+                self.appl_miss[prefix] = diff
+            elif diff < 0:
+                self.asic_miss[prefix] = -diff
+
+    def refresh(self):
+        """
+        Bring the snapshot up to date, with a full resync when due.
+        """
+        if time.time() - self.last_resync >= self.resync_interval:
+            self.resync()
+            return
+
+        changed, _, _ = self.update()
+        if changed:
+            self.rediff(changed)
+
+    def wait_for_updates(self):
+        """
+        Collect subscribe updates for a period and apply them.
+        :return (ASIC-DB added prefixes, ASIC-DB deleted prefixes) as sorted
+        """
+        all_adds = []
+        all_deletes = []
+        t_end = time.time() + SUBSCRIBE_WAIT_SECS
+        t_wait = SUBSCRIBE_WAIT_SECS
+
+        while t_wait > 0:
+            self.selector.select(t_wait)
+            t_wait = int(t_end - time.time())
+            changed, adds, deletes = self.update()
+            if changed:
+                self.rediff(changed)
+            all_adds += adds
+            all_deletes += deletes
+
+        all_adds = format_prefixes(all_adds)
+        all_deletes = format_prefixes(all_deletes)
+        print_message(syslog.LOG_DEBUG, "adds={}".format(all_adds))
+        print_message(syslog.LOG_DEBUG, "dels={}".format(all_deletes))
+        return all_adds, all_deletes
+
+    def get_misses(self):
+        """
+        :return (APPL-DB routes missing in ASIC-DB, ASIC-DB routes missing in APPL-DB) as sorted
+        """
+        return (format_prefixes(self.appl_miss.elements()), format_prefixes(self.asic_miss.elements()))
+
+
+def check_routes_for_namespace_incremental(snapshot):
+    """
+    Process a Single Namespace in incremental mode:
+    Same checks as check_routes_for_namespace, but on the route sets
+    of the snapshot which only applies the updates since the previous scan.
+    """
+    namespace = snapshot.namespace
+    adds = []
+    deletes = []
+
+    snapshot.refresh()
+
+    intf_appl = get_interfaces(namespace)
+    rt_appl_miss, rt_asic_miss = snapshot.get_misses()
+
+    # Check APPL-DB INTF_TABLE with ASIC table route entries
+    intf_appl_miss = [ip for ip in intf_appl if pack_prefix(ip) not in snapshot.asic_routes]
+
+    rt_appl_miss, rt_asic_miss = filter_out_route_misses(namespace, intf_appl, rt_appl_miss, rt_asic_miss)
+
+    if rt_appl_miss or rt_asic_miss:
+        # Look for subscribe updates for a second, the misses resolved
+        # meanwhile are dropped
+        adds, deletes = snapshot.wait_for_updates()
+        rt_appl_miss = [rt for rt in rt_appl_miss if pack_prefix(rt) in snapshot.appl_miss]
+        rt_asic_miss = [rt for rt in rt_asic_miss if pack_prefix(rt) in snapshot.asic_miss]
+
+    results = get_route_check_results(namespace, snapshot.appl_routes, rt_appl_miss, intf_appl_miss,
+                                      rt_asic_miss)
 
     return results, adds, deletes
 
 
-def check_routes(namespace):
+def check_routes_for_namespace_in_snapshot(snapshots, namespace, resync_interval):
+    if namespace not in snapshots:
+        snapshots[namespace] = RouteSnapshot(namespace, resync_interval)
+    return check_routes_for_namespace_incremental(snapshots[namespace])
+
+
+def check_routes(namespace, snapshots=None, resync_interval=FULL_RESYNC_INTERVAL):
     """
     Main function to parallelize route checks across all namespaces.
+    :param snapshots: dict of namespace to RouteSnapshot, to run in
+    incremental mode; the missing snapshots are created.
+    :param resync_interval: full resync interval of the created snapshots
     """
     namespace_list = []
     if namespace is not multi_asic.DEFAULT_NAMESPACE and namespace in multi_asic.get_namespace_list():
@@ -813,7 +1160,11 @@ def check_routes(namespace):
 
     # Use ThreadPoolExecutor to parallelize the check for each namespace
     with concurrent.futures.ThreadPoolExecutor() as executor:
-        futures = {executor.submit(check_routes_for_namespace, ns): ns for ns in namespace_list}
+        if snapshots is None:
+            futures = {executor.submit(check_routes_for_namespace, ns): ns for ns in namespace_list}
+        else:
+            futures = {executor.submit(check_routes_for_namespace_in_snapshot, snapshots, ns, resync_interval): ns
+                       for ns in namespace_list}
 
         for future in concurrent.futures.as_completed(futures):
             ns = futures[future]
@@ -852,6 +1203,10 @@ def main():
     parser.add_argument("-i", "--interval", type=int, default=0, help="Scan interval in seconds")
     parser.add_argument("-s", "--log_to_syslog", action="store_true", default=True, help="Write message to syslog")
     parser.add_argument('-n','--namespace',   default=multi_asic.DEFAULT_NAMESPACE, help='Verify routes for this specific namespace')
+    parser.add_argument("-I", "--incremental", action="store_true", default=False,
+                        help="With an interval, keep the routes in memory and only check the updates between scans")
+    parser.add_argument("--resync_interval", type=int, default=FULL_RESYNC_INTERVAL,
+                        help="Full resync interval in seconds of the incremental mode")
     args = parser.parse_args()
 
     namespace = args.namespace
@@ -882,9 +1237,11 @@ def main():
         print_message(syslog.LOG_INFO, "BGP feature is disabled, exiting without checking routes!!")
         return 0, None
 
+    snapshots = {} if (interval and args.incremental) else None
+
     while True:
         signal.alarm(TIMEOUT_SECONDS)
-        ret, res= check_routes(namespace)
+        ret, res = check_routes(namespace, snapshots, args.resync_interval)
         print_message(syslog.LOG_DEBUG, "ret={}, res={}".format(ret, res))
         signal.alarm(0)
 
@@ -219,7 +219,8 @@ setup(
             'pddf_ledutil = pddf_ledutil.main:cli',
             'rexec = rcli.rexec:cli',
             'rshell = rcli.rshell:cli',
-            'show = show.main:cli',
+            'show = show.client:main',
+            'show-server = show.server:main',
             'sonic-clear = clear.main:cli',
             'sonic-installer = sonic_installer.main:sonic_installer',
             'sonic_installer = sonic_installer.main:sonic_installer',  # Deprecated
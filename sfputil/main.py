@@ -6,7 +6,11 @@
 #
 
 import copy
+import hashlib
+import json
+import mmap
 import os
+import re
 import sys
 import natsort
 import ast
@@ -30,6 +34,7 @@ from utilities_common.sfp_helper import covert_application_advertisement_to_outp
 from utilities_common.sfp_helper import QSFP_DATA_MAP
 from tabulate import tabulate
 from utilities_common.general import load_db_config
+from utilities_common.port_runner import PortRunner, PortTimeoutError
 
 VERSION = '3.0'
 
@@ -48,6 +53,19 @@ ERROR_NOT_IMPLEMENTED = 5
 ERROR_INVALID_PORT = 6
 ERROR_INVALID_PAGE = 7
 SMBUS_BLOCK_WRITE_SIZE = 32
+
+# Concurrent EEPROM reads
+EEPROM_READ_WORKERS = 8
+EEPROM_READ_BUS_LIMIT = 1
+EEPROM_READ_TIMEOUT = 60  # Seconds per port
+# I2C bus in the sysfs path of an EEPROM, e.g. /sys/bus/i2c/devices/i2c-2/2-0050/eeprom
+I2C_BUS_RE = re.compile(r'i2c-(\d+)')
+# Concurrent firmware downloads
+FIRMWARE_DOWNLOAD_WORKERS = 8
+FIRMWARE_DOWNLOAD_BUS_LIMIT = 1
+# Resumable firmware downloads
+FIRMWARE_CHECKPOINT_DIR = '/var/cache/sfputil/firmware'
+FIRMWARE_CHECKPOINT_INTERVAL = 64 * 1024  # Bytes
 # Default host password as per CMIS spec:
 # http://www.qsfp-dd.com/wp-content/uploads/2021/05/CMIS5p0.pdf
 CDB_DEFAULT_HOST_PASSWORD = 0x00001011
@@ -624,15 +642,107 @@ def show():
     pass
 
 
+class EepromReadError(Exception):
+    """Error reading the EEPROM of a port, output is displayed before exiting with exit_code"""
+    def __init__(self, output, exit_code):
+        super(EepromReadError, self).__init__(output)
+        self.output = output
+        self.exit_code = exit_code
+
+
+def get_sfp_i2c_bus(physical_port):
+    """
+    Returns the I2C bus of the transceiver, taken from the sysfs path of its
+    EEPROM when the platform implements Sfp.get_eeprom_path(), else None
+    """
+    try:
+        path = platform_chassis.get_sfp(physical_port).get_eeprom_path()
+    except NotImplementedError:
+        return None
+    if not isinstance(path, str):
+        return None
+    match = I2C_BUS_RE.search(path)
+    return int(match.group(1)) if match else None
+
+
+def read_port_eeprom(port_name, physical_port, dump_dom):
+    """
+    Read the EEPROM, and the DOM if dump_dom, of a port and return its output
+    """
+    output = ""
+
+    if is_port_type_rj45(port_name):
+        output += "{}: SFP EEPROM is not applicable for RJ45 port\n".format(port_name)
+        output += '\n'
+        return output
+
+    try:
+        presence = platform_chassis.get_sfp(physical_port).get_presence()
+    except NotImplementedError:
+        raise EepromReadError("Sfp.get_presence() is currently not implemented for this platform",
+                              ERROR_NOT_IMPLEMENTED)
+
+    if not presence:
+        output += "{}: SFP EEPROM not detected\n".format(port_name)
+    else:
+        output += "{}: SFP EEPROM detected\n".format(port_name)
+
+        try:
+            xcvr_info = platform_chassis.get_sfp(physical_port).get_transceiver_info()
+        except NotImplementedError:
+            raise EepromReadError("Sfp.get_transceiver_info() is currently not implemented for this platform",
+                                  ERROR_NOT_IMPLEMENTED)
+
+        output += convert_sfp_info_to_output_string(xcvr_info)
+
+        if dump_dom:
+            try:
+                api = platform_chassis.get_sfp(physical_port).get_xcvr_api()
+            except NotImplementedError:
+                output += "API is currently not implemented for this platform\n"
+                raise EepromReadError(output, ERROR_NOT_IMPLEMENTED)
+            if api is None:
+                output += "API is none while getting DOM info!\n"
+                raise EepromReadError(output, ERROR_NOT_IMPLEMENTED)
+            else:
+                if api.is_flat_memory():
+                    output += "DOM values not supported for flat memory module\n"
+                    return output
+            try:
+                xcvr_dom_info = platform_chassis.get_sfp(physical_port).get_transceiver_dom_real_value()
+            except NotImplementedError:
+                raise EepromReadError("Sfp.get_transceiver_dom_real_value() is currently not implemented "
+                                      "for this platform", ERROR_NOT_IMPLEMENTED)
+
+            try:
+                xcvr_dom_threshold_info = platform_chassis.get_sfp(physical_port).get_transceiver_threshold_info()
+                if xcvr_dom_threshold_info:
+                    xcvr_dom_info.update(xcvr_dom_threshold_info)
+            except NotImplementedError:
+                raise EepromReadError("Sfp.get_transceiver_threshold_info() is currently not implemented "
+                                      "for this platform", ERROR_NOT_IMPLEMENTED)
+
+            output += convert_dom_to_output_string(xcvr_info['type'], xcvr_dom_info)
+
+    output += '\n'
+    return output
+
+
 # 'eeprom' subcommand
 @show.command()
 @click.option('-p', '--port', metavar='<port_name>', help="Display SFP EEPROM data for port <port_name> only")
 @click.option('-d', '--dom', 'dump_dom', is_flag=True, help="Also display Digital Optical Monitoring (DOM) data")
 @click.option('-n', '--namespace', default=None, help="Display interfaces for specific namespace")
-def eeprom(port, dump_dom, namespace):
+@click.option('-w', '--workers', type=click.IntRange(1, 64), default=EEPROM_READ_WORKERS, show_default=True,
+              help="Number of ports read concurrently")
+@click.option('--bus-limit', type=click.IntRange(1, 64), default=EEPROM_READ_BUS_LIMIT, show_default=True,
+              help="Number of ports read concurrently on the same I2C bus")
+@click.option('-t', '--timeout', type=click.IntRange(1, None), default=EEPROM_READ_TIMEOUT, show_default=True,
+              help="Time in seconds to read a port before reporting it as timed out")
+def eeprom(port, dump_dom, namespace, workers, bus_limit, timeout):
     """Display EEPROM data of SFP transceiver(s)"""
     logical_port_list = []
-    output = ""
+    physical_ports = []
 
     # Create a list containing the logical port names of all ports we're interested in
     if port is None:
@@ -658,67 +768,23 @@ def eeprom(port, dump_dom, namespace):
             ganged = True
 
         for physical_port in physical_port_list:
-            port_name = get_physical_port_name(logical_port_name, i, ganged)
-
-            if is_port_type_rj45(port_name):
-                output += "{}: SFP EEPROM is not applicable for RJ45 port\n".format(port_name)
-                output += '\n'
-                continue
-
-            try:
-                presence = platform_chassis.get_sfp(physical_port).get_presence()
-            except NotImplementedError:
-                click.echo("Sfp.get_presence() is currently not implemented for this platform")
-                sys.exit(ERROR_NOT_IMPLEMENTED)
+            physical_ports.append((get_physical_port_name(logical_port_name, i, ganged), physical_port))
 
-            if not presence:
-                output += "{}: SFP EEPROM not detected\n".format(port_name)
-            else:
-                output += "{}: SFP EEPROM detected\n".format(port_name)
+    # The ports are read concurrently, their output is displayed in order as soon as it is available
+    runner = PortRunner(workers, bus_limit=bus_limit, bus_of=lambda item: get_sfp_i2c_bus(item[1]),
+                        timeout=timeout)
+    for (port_name, _), output, error in runner.run(
+            lambda item: read_port_eeprom(item[0], item[1], dump_dom), physical_ports):
+        if isinstance(error, EepromReadError):
+            click.echo(error.output)
+            sys.exit(error.exit_code)
+        elif isinstance(error, PortTimeoutError):
+            output = "{}: Timed out reading SFP EEPROM\n\n".format(port_name)
+        elif error is not None:
+            raise error
+        click.echo(output, nl=False)
 
-                try:
-                    xcvr_info = platform_chassis.get_sfp(physical_port).get_transceiver_info()
-                except NotImplementedError:
-                    click.echo("Sfp.get_transceiver_info() is currently not implemented for this platform")
-                    sys.exit(ERROR_NOT_IMPLEMENTED)
-
-                output += convert_sfp_info_to_output_string(xcvr_info)
-
-                if dump_dom:
-                    try:
-                        api = platform_chassis.get_sfp(physical_port).get_xcvr_api()
-                    except NotImplementedError:
-                        output += "API is currently not implemented for this platform\n"
-                        click.echo(output)
-                        sys.exit(ERROR_NOT_IMPLEMENTED)
-                    if api is None:
-                        output += "API is none while getting DOM info!\n"
-                        click.echo(output)
-                        sys.exit(ERROR_NOT_IMPLEMENTED)
-                    else:
-                        if api.is_flat_memory():
-                            output += "DOM values not supported for flat memory module\n"
-                            continue
-                    try:
-                        xcvr_dom_info = platform_chassis.get_sfp(physical_port).get_transceiver_dom_real_value()
-                    except NotImplementedError:
-                        click.echo("Sfp.get_transceiver_dom_real_value() is currently not implemented "
-                                   "for this platform")
-                        sys.exit(ERROR_NOT_IMPLEMENTED)
-
-                    try:
-                        xcvr_dom_threshold_info = platform_chassis.get_sfp(physical_port).get_transceiver_threshold_info()
-                        if xcvr_dom_threshold_info:
-                            xcvr_dom_info.update(xcvr_dom_threshold_info)
-                    except NotImplementedError:
-                        click.echo("Sfp.get_transceiver_threshold_info() is currently not implemented for this platform")
-                        sys.exit(ERROR_NOT_IMPLEMENTED)
-
-                    output += convert_dom_to_output_string(xcvr_info['type'], xcvr_dom_info)
-
-            output += '\n'
-
-    click.echo(output)
+    click.echo()
 
 
 # 'eeprom-hexdump' subcommand
@@ -1520,85 +1586,266 @@ def commit_firmware(port_name):
 
     return status
 
-def download_firmware(port_name, filepath):
-    """Download firmware on the transceiver"""
-    try:
-        fd = open(filepath, 'rb')
-        fd.seek(0, 2)
-        file_size = fd.tell()
-        fd.seek(0, 0)
-    except FileNotFoundError:
-        click.echo("Firmware file {} NOT found".format(filepath))
-        sys.exit(EXIT_FAIL)
 
-    physical_port = logical_port_to_physical_port_index(port_name)
-    sfp = platform_chassis.get_sfp(physical_port)
-    try:
-        api = sfp.get_xcvr_api()
-    except NotImplementedError:
-        click.echo("This functionality is NOT applicable to this platform")
-        sys.exit(ERROR_NOT_IMPLEMENTED)
+class FirmwareDownloadError(Exception):
+    """Error downloading firmware to a port, message is displayed before exiting with exit_code"""
+    def __init__(self, message, exit_code):
+        super(FirmwareDownloadError, self).__init__(message)
+        self.message = message
+        self.exit_code = exit_code
 
-    try:
-        fwinfo = api.get_module_fw_mgmt_feature()
-        if fwinfo['status'] == True:
-            startLPLsize, maxblocksize, lplonly_flag, autopaging_flag, writelength = fwinfo['feature']
-        else:
-            click.echo("Failed to fetch CDB Firmware management features")
-            sys.exit(EXIT_FAIL)
-    except NotImplementedError:
-        click.echo("This functionality is NOT applicable for this transceiver")
-        sys.exit(ERROR_NOT_IMPLEMENTED)
 
-    click.echo('CDB: Starting firmware download')
-    startdata = fd.read(startLPLsize)
-    status = api.cdb_start_firmware_download(startLPLsize, startdata, file_size)
-    if status != 1:
-        click.echo('CDB: Start firmware download failed - status {}'.format(status))
-        sys.exit(EXIT_FAIL)
+class FirmwareImage(object):
+    """
+    Firmware file, memory mapped once and shared by all the ports it is
+    downloaded to
+    """
+    def __init__(self, filepath):
+        self.filepath = os.path.abspath(filepath)
+        self.fd = open(filepath, 'rb')
+        self.fd.seek(0, 2)
+        self.size = self.fd.tell()
+        self.fd.seek(0, 0)
+        # An empty file can't be memory mapped
+        self.data = mmap.mmap(self.fd.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+        self.digest = hashlib.sha256(self.data).hexdigest()
+
+    def read(self, offset, count):
+        return self.data[offset:offset + count]
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.fd.close()
+
+
+class FirmwareDownload(object):
+    """
+    CDB firmware download of an image to a port.
 
-    # Increase the optoe driver's write max to speed up firmware download
-    try:
-        sfp.set_optoe_write_max(SMBUS_BLOCK_WRITE_SIZE)
-    except NotImplementedError:
-        click.echo("Platform doesn't implement optoe write max change. Skipping value increase.")
+    The address of the last block acknowledged by the module is saved in a
+    checkpoint file every FIRMWARE_CHECKPOINT_INTERVAL bytes and when the
+    download fails or is interrupted. With resume, a download restarts from
+    the checkpoint of the same image instead of from the beginning.
+    Checkpoints are kept per physical port, as the download state is kept
+    by the module, whichever of its logical ports it is downloaded through.
+
+    Messages are displayed with echo, progress(count) is called for every
+    block written.
+    """
+    def __init__(self, port_name, image, resume=False, echo=click.echo, progress=None):
+        self.port_name = port_name
+        self.physical_port = logical_port_to_physical_port_index(port_name)
+        self.image = image
+        self.resume = resume
+        self.echo = echo
+        self.progress = progress
+
+    @property
+    def checkpoint_path(self):
+        return os.path.join(FIRMWARE_CHECKPOINT_DIR, 'port{}.json'.format(self.physical_port))
+
+    def checkpoint_id(self, start_lpl_size, block_size, lplonly_flag):
+        return {
+            'file': self.image.filepath,
+            'size': self.image.size,
+            'sha256': self.image.digest,
+            'start_lpl_size': start_lpl_size,
+            'block_size': block_size,
+            'lpl_only': bool(lplonly_flag)
+        }
+
+    def load_checkpoint(self, checkpoint_id):
+        """Returns the address to resume the download of the image from, or None"""
+        try:
+            with open(self.checkpoint_path) as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            return None
+        address = checkpoint.pop('address', None)
+        if checkpoint != checkpoint_id or not isinstance(address, int):
+            return None
+        if address < 0 or address > self.image.size - checkpoint_id['start_lpl_size']:
+            return None
+        return address
+
+    def save_checkpoint(self, checkpoint_id, address):
+        checkpoint = dict(checkpoint_id, address=address)
+        tmp_path = self.checkpoint_path + '.tmp'
+        try:
+            os.makedirs(FIRMWARE_CHECKPOINT_DIR, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(checkpoint, f)
+            os.replace(tmp_path, self.checkpoint_path)
+        except OSError as e:
+            log.log_warning("Failed to save firmware download checkpoint of {}: {}".format(self.port_name, e))
+
+    def remove_checkpoint(self):
+        try:
+            os.remove(self.checkpoint_path)
+        except OSError:
+            pass
+
+    def start(self, api, start_lpl_size):
+        self.echo('CDB: Starting firmware download')
+        startdata = self.image.read(0, start_lpl_size)
+        status = api.cdb_start_firmware_download(start_lpl_size, startdata, self.image.size)
+        if status != 1:
+            raise FirmwareDownloadError('CDB: Start firmware download failed - status {}'.format(status), EXIT_FAIL)
+
+    def run(self):
+        sfp = platform_chassis.get_sfp(self.physical_port)
+        try:
+            api = sfp.get_xcvr_api()
+        except NotImplementedError:
+            raise FirmwareDownloadError("This functionality is NOT applicable to this platform", ERROR_NOT_IMPLEMENTED)
+
+        try:
+            fwinfo = api.get_module_fw_mgmt_feature()
+            if fwinfo['status']:
+                startLPLsize, maxblocksize, lplonly_flag, autopaging_flag, writelength = fwinfo['feature']
+            else:
+                raise FirmwareDownloadError("Failed to fetch CDB Firmware management features", EXIT_FAIL)
+        except NotImplementedError:
+            raise FirmwareDownloadError("This functionality is NOT applicable for this transceiver",
+                                        ERROR_NOT_IMPLEMENTED)
 
-    with click.progressbar(length=file_size, label="Downloading ...") as bar:
-        address = 0
         if lplonly_flag:
             BLOCK_SIZE = min(MAX_LPL_FIRMWARE_BLOCK_SIZE, maxblocksize)
         else:
             BLOCK_SIZE = maxblocksize
-        remaining = file_size - startLPLsize
-        while remaining > 0:
-            count = BLOCK_SIZE if remaining >= BLOCK_SIZE else remaining
-            data = fd.read(count)
-            if len(data) != count:
-                click.echo("Firmware file read failed!")
-                sys.exit(EXIT_FAIL)
+        checkpoint_id = self.checkpoint_id(startLPLsize, BLOCK_SIZE, lplonly_flag)
+
+        resume_address = self.load_checkpoint(checkpoint_id) if self.resume else None
+        if resume_address is None:
+            self.start(api, startLPLsize)
+            address = 0
+        else:
+            self.echo('CDB: Resuming firmware download at {} of {} bytes'.format(
+                startLPLsize + resume_address, self.image.size))
+            address = resume_address
+
+        # Increase the optoe driver's write max to speed up firmware download
+        try:
+            sfp.set_optoe_write_max(SMBUS_BLOCK_WRITE_SIZE)
+        except NotImplementedError:
+            self.echo("Platform doesn't implement optoe write max change. Skipping value increase.")
+
+        if self.progress is not None and address:
+            self.progress(address)
+
+        remaining = self.image.size - startLPLsize - address
+        checkpointed = address
+        try:
+            while remaining > 0:
+                count = BLOCK_SIZE if remaining >= BLOCK_SIZE else remaining
+                data = self.image.read(startLPLsize + address, count)
+                if len(data) != count:
+                    raise FirmwareDownloadError("Firmware file read failed!", EXIT_FAIL)
+
+                if lplonly_flag:
+                    status = api.cdb_lpl_block_write(address, data)
+                else:
+                    status = api.cdb_epl_block_write(address, data, autopaging_flag, writelength)
+                if (status != 1):
+                    if resume_address is not None and address == resume_address:
+                        # The module did not keep the download state, start over
+                        self.echo('CDB: Resuming firmware download failed - status {}, restarting'.format(status))
+                        resume_address = None
+                        self.start(api, startLPLsize)
+                        if self.progress is not None:
+                            self.progress(-address)
+                        remaining += address
+                        address = checkpointed = 0
+                        continue
+                    raise FirmwareDownloadError("CDB: firmware download failed! - status {}".format(status), EXIT_FAIL)
+
+                if self.progress is not None:
+                    self.progress(count)
+                address += count
+                remaining -= count
+                if remaining > 0 and address - checkpointed >= FIRMWARE_CHECKPOINT_INTERVAL:
+                    self.save_checkpoint(checkpoint_id, address)
+                    checkpointed = address
+        except BaseException:
+            # Keep the last acknowledged block to resume from
+            if address:
+                self.save_checkpoint(checkpoint_id, address)
+            raise
+
+        # Restore the optoe driver's write max to '1' (default value)
+        try:
+            sfp.set_optoe_write_max(1)
+        except NotImplementedError:
+            self.echo("Platform doesn't implement optoe write max change. Skipping value restore!")
+
+        status = api.cdb_firmware_download_complete()
+        self.remove_checkpoint()
+        update_firmware_info_to_state_db(self.port_name)
+        self.echo('CDB: firmware download complete')
+        return status
 
-            if lplonly_flag:
-                status = api.cdb_lpl_block_write(address, data)
-            else:
-                status = api.cdb_epl_block_write(address, data, autopaging_flag, writelength)
-            if (status != 1):
-                click.echo("CDB: firmware download failed! - status {}".format(status))
-                sys.exit(EXIT_FAIL)
 
-            bar.update(count)
-            address += count
-            remaining -= count
+def download_firmware(port_name, filepath, resume=False):
+    """Download firmware on the transceiver"""
+    try:
+        image = FirmwareImage(filepath)
+    except FileNotFoundError:
+        click.echo("Firmware file {} NOT found".format(filepath))
+        sys.exit(EXIT_FAIL)
 
-    # Restore the optoe driver's write max to '1' (default value)
     try:
-        sfp.set_optoe_write_max(1)
-    except NotImplementedError:
-        click.echo("Platform doesn't implement optoe write max change. Skipping value restore!")
+        with click.progressbar(length=image.size, label="Downloading ...") as bar:
+            return FirmwareDownload(port_name, image, resume=resume, progress=bar.update).run()
+    except FirmwareDownloadError as e:
+        click.echo(e.message)
+        sys.exit(e.exit_code)
+    finally:
+        image.close()
 
-    status = api.cdb_firmware_download_complete()
-    update_firmware_info_to_state_db(port_name)
-    click.echo('CDB: firmware download complete')
-    return status
+
+def download_firmware_multi_port(port_names, filepath, resume, workers, bus_limit):
+    """
+    Download firmware on several transceivers concurrently, at most
+    bus_limit of them on the same I2C bus.
+
+    Returns the list of the ports on which the download failed.
+    """
+    try:
+        image = FirmwareImage(filepath)
+    except FileNotFoundError:
+        click.echo("Firmware file {} NOT found".format(filepath))
+        sys.exit(EXIT_FAIL)
+
+    def download_port(port_name):
+        start = time.time()
+        messages = []
+        status = FirmwareDownload(port_name, image, resume=resume, echo=messages.append).run()
+        return status, messages, time.time() - start
+
+    failed = []
+    runner = PortRunner(workers, bus_limit=bus_limit,
+                        bus_of=lambda port_name: get_sfp_i2c_bus(logical_port_to_physical_port_index(port_name)))
+    try:
+        for port_name, result, error in runner.run(download_port, port_names):
+            if isinstance(error, FirmwareDownloadError):
+                click.echo("{}: {}".format(port_name, error.message))
+                failed.append(port_name)
+                continue
+            elif error is not None:
+                raise error
+            status, messages, elapsed = result
+            for message in messages:
+                click.echo("{}: {}".format(port_name, message))
+            if status == 1:
+                click.echo("{}: Firmware download complete success, download Time: {}".format(
+                    port_name, str(datetime.timedelta(seconds=elapsed))))
+            else:
+                click.echo("{}: Firmware download complete failed! status = {}".format(port_name, status))
+                failed.append(port_name)
+    finally:
+        image.close()
+    return failed
 
 # 'run' subcommand
 @firmware.command()
@@ -1705,19 +1952,44 @@ def upgrade(port_name, filepath):
 @firmware.command()
 @click.argument('port_name', required=True, default=None)
 @click.argument('filepath', required=True, default=None)
-def download(port_name, filepath):
-    """Download firmware on the transceiver"""
+@click.option('--resume', is_flag=True, help="Resume an interrupted download of the same firmware file")
+@click.option('-w', '--workers', type=click.IntRange(1, 64), default=FIRMWARE_DOWNLOAD_WORKERS, show_default=True,
+              help="Number of ports downloaded concurrently")
+@click.option('--bus-limit', type=click.IntRange(1, 64), default=FIRMWARE_DOWNLOAD_BUS_LIMIT, show_default=True,
+              help="Number of ports downloaded concurrently on the same I2C bus")
+def download(port_name, filepath, resume, workers, bus_limit):
+    """Download firmware on the transceiver(s), PORT_NAME is a comma separated list of ports"""
+
+    port_names = [name.strip() for name in port_name.split(',') if name.strip()]
+    physical_port_names = {}
+    for port_name in port_names:
+        if is_port_type_rj45(port_name):
+            click.echo("This functionality is not applicable for RJ45 port {}.".format(port_name))
+            sys.exit(EXIT_FAIL)
 
-    if is_port_type_rj45(port_name):
-        click.echo("This functionality is not applicable for RJ45 port {}.".format(port_name))
-        sys.exit(EXIT_FAIL)
+        if not is_sfp_present(port_name):
+            click.echo("{}: SFP EEPROM not detected\n".format(port_name))
+            sys.exit(EXIT_FAIL)
 
-    if not is_sfp_present(port_name):
-       click.echo("{}: SFP EEPROM not detected\n".format(port_name))
-       sys.exit(EXIT_FAIL)
+        # Concurrent downloads to the same transceiver would interleave their CDB commands
+        physical_port = logical_port_to_physical_port_index(port_name)
+        if physical_port in physical_port_names:
+            click.echo("Error: {} and {} are on the same transceiver".format(
+                physical_port_names[physical_port], port_name))
+            sys.exit(EXIT_FAIL)
+        physical_port_names[physical_port] = port_name
 
     start = time.time()
-    status = download_firmware(port_name, filepath)
+    if len(port_names) > 1:
+        failed = download_firmware_multi_port(port_names, filepath, resume, workers, bus_limit)
+        end = time.time()
+        click.echo("Total download Time: {}".format(str(datetime.timedelta(seconds=end-start))))
+        if failed:
+            click.echo("Firmware download failed on {}".format(", ".join(failed)))
+            sys.exit(EXIT_FAIL)
+        return
+
+    status = download_firmware(port_name, filepath, resume=resume)
     if status == 1:
         click.echo("Firmware download complete success")
     else:
@@ -0,0 +1,32 @@
+"""
+Thin 'show' client.
+
+Forward the command to the resident 'show' server (see show/server.py) when
+one is listening, otherwise load the CLI and run the command in-process.
+"""
+
+import os
+import sys
+
+from utilities_common import cli_server
+
+SHOW_SERVER_SOCKET = '/var/run/sonic-utilities/show.sock'
+
+
+def get_socket_path():
+    return os.environ.get('SONIC_SHOW_SERVER_SOCKET', SHOW_SERVER_SOCKET)
+
+
+def main():
+    socket_path = get_socket_path()
+    if os.path.exists(socket_path):
+        exit_code = cli_server.run_client(socket_path, sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from show.main import cli
+    cli()
+
+
+if __name__ == '__main__':
+    main()
@@ -39,38 +39,11 @@ try:
 except KeyError:
     pass
 
-from . import acl
-from . import bgp_common
-from . import chassis_modules
-from . import dropcounters
-from . import fabric
-from . import feature
-from . import fgnhg
-from . import flow_counters
-from . import gearbox
-from . import interfaces
-from . import kdump
-from . import kube
-from . import muxcable
-from . import nat
-from . import platform
-from . import p4_table
-from . import processes
-from . import reboot_cause
-from . import sflow
-from . import vlan
-from . import vnet
-from . import vxlan
-from . import system_health
-from . import warm_restart
 from . import plugins
-from . import syslog
-from . import dns
-from . import bgp_cli
-from . import stp
-from . import srv6
-from . import icmp
-from . import copp
+
+# Submodules implementing show commands are imported on first use
+bgp_common = clicommon.lazy_import('show.bgp_common')
+platform = clicommon.lazy_import('show.platform')
 
 # Global Variables
 PLATFORM_JSON = 'platform.json'
@@ -296,46 +269,46 @@ def cli(ctx):
     load_db_config()
     ctx.obj = Db()
 
+
 # Add groups from other modules
-cli.add_command(acl.acl)
-cli.add_command(chassis_modules.chassis)
-cli.add_command(dropcounters.dropcounters)
-cli.add_command(fabric.fabric)
-cli.add_command(feature.feature)
-cli.add_command(fgnhg.fgnhg)
-cli.add_command(flow_counters.flowcnt_route)
-cli.add_command(flow_counters.flowcnt_trap)
-cli.add_command(kdump.kdump)
-cli.add_command(interfaces.interfaces)
-cli.add_command(kdump.kdump)
-cli.add_command(kube.kubernetes)
-cli.add_command(muxcable.muxcable)
-cli.add_command(nat.nat)
-cli.add_command(platform.platform)
-cli.add_command(p4_table.p4_table)
-cli.add_command(processes.processes)
-cli.add_command(reboot_cause.reboot_cause)
-cli.add_command(sflow.sflow)
-cli.add_command(vlan.vlan)
-cli.add_command(vnet.vnet)
-cli.add_command(vxlan.vxlan)
-cli.add_command(system_health.system_health)
-cli.add_command(warm_restart.warm_restart)
-cli.add_command(dns.dns)
-cli.add_command(stp.spanning_tree)
-cli.add_command(srv6.srv6)
-cli.add_command(icmp.icmp)
-cli.add_command(copp.copp)
-
-# syslog module
-cli.add_command(syslog.syslog)
+clicommon.add_lazy_commands(cli, {
+    'acl': ('show.acl', 'acl'),
+    'chassis': ('show.chassis_modules', 'chassis'),
+    'dropcounters': ('show.dropcounters', 'dropcounters'),
+    'fabric': ('show.fabric', 'fabric'),
+    'feature': ('show.feature', 'feature'),
+    'fgnhg': ('show.fgnhg', 'fgnhg'),
+    'flowcnt-route': ('show.flow_counters', 'flowcnt_route'),
+    'flowcnt-trap': ('show.flow_counters', 'flowcnt_trap'),
+    'kdump': ('show.kdump', 'kdump'),
+    'interfaces': ('show.interfaces', 'interfaces'),
+    'kubernetes': ('show.kube', 'kubernetes'),
+    'muxcable': ('show.muxcable', 'muxcable'),
+    'nat': ('show.nat', 'nat'),
+    'platform': ('show.platform', 'platform'),
+    'p4-table': ('show.p4_table', 'p4_table'),
+    'processes': ('show.processes', 'processes'),
+    'reboot-cause': ('show.reboot_cause', 'reboot_cause'),
+    'sflow': ('show.sflow', 'sflow'),
+    'vlan': ('show.vlan', 'vlan'),
+    'vnet': ('show.vnet', 'vnet'),
+    'vxlan': ('show.vxlan', 'vxlan'),
+    'system-health': ('show.system_health', 'system_health'),
+    'warm_restart': ('show.warm_restart', 'warm_restart'),
+    'dns': ('show.dns', 'dns'),
+    'spanning-tree': ('show.stp', 'spanning_tree'),
+    'srv6': ('show.srv6', 'srv6'),
+    'icmp': ('show.icmp', 'icmp'),
+    'copp': ('show.copp', 'copp'),
+    # syslog module
+    'syslog': ('show.syslog', 'syslog'),
+    # bgp module
+    'bgp': ('show.bgp_cli', 'BGP'),
+})
 
 # Add greabox commands only if GEARBOX is configured
 if is_gearbox_configured():
-    cli.add_command(gearbox.gearbox)
-
-# bgp module
-cli.add_command(bgp_cli.BGP)
+    clicommon.add_lazy_commands(cli, {'gearbox': ('show.gearbox', 'gearbox')})
 
 #
 # 'vrf' command ("show vrf")
@@ -2826,7 +2799,7 @@ def banner(db):
 
 # Load plugins and register them
 helper = util_base.UtilHelper()
-helper.load_and_register_plugins(plugins, cli)
+helper.load_and_register_plugins(plugins, cli, helper.get_plugins_manifest_path(plugins))
 
 if __name__ == '__main__':
     cli()
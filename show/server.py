@@ -0,0 +1,50 @@
+"""
+Resident 'show' server.
+
+Keeps the 'show' commands imported and runs the commands forwarded by the
+'show' client (see show/client.py), each in a fresh process forked from the
+server, so that a command doesn't pay for starting the interpreter and
+importing the CLI.
+"""
+
+import argparse
+import signal
+import sys
+
+from utilities_common import cli_server
+from utilities_common.general import load_db_config
+
+from .client import get_socket_path
+from .main import cli
+
+
+class ShowServer(cli_server.CliServer):
+    def __init__(self, socket_path, command_timeout=None):
+        super(ShowServer, self).__init__(socket_path, cli, 'show', command_timeout)
+
+    def preload(self):
+        # The database connections are opened by each command: redis
+        # connections can't be shared by the forked processes
+        load_db_config()
+        super(ShowServer, self).preload()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Resident server for the show command')
+    parser.add_argument('-s', '--socket', default=get_socket_path(),
+                        help='Unix socket to listen on (default: %(default)s)')
+    parser.add_argument('-t', '--timeout', type=float, default=None,
+                        help='Kill the commands which run for longer than TIMEOUT seconds (default: no timeout)')
+    args = parser.parse_args()
+
+    def on_sigterm(signum, frame):
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, on_sigterm)
+    with ShowServer(args.socket, args.timeout) as server:
+        server.preload()
+        server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
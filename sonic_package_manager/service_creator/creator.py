@@ -26,7 +26,7 @@ from sonic_package_manager.service_creator import (
     SONIC_CLI_COMMANDS,
 )
 from sonic_package_manager.service_creator.feature import FeatureRegistry
-from sonic_package_manager.service_creator.sonic_db import SonicDB
+from sonic_package_manager.service_creator.sonic_db import SonicDB, batch_updates
 from sonic_package_manager.service_creator.utils import in_chroot
 
 from sonic_py_common import device_info
@@ -553,11 +553,12 @@ class ServiceCreator:
                     conn.mod_entry(table, key, key_cfg)
 
         for conn in self.sonic_db.get_connectors():
-            cfg = conn.get_config()
-            new_cfg = init_cfg.copy()
-            utils.deep_update(new_cfg, cfg)
-            self.validate_config(new_cfg)
-            update_config_with_init_cfg(cfg, conn)
+            with batch_updates(conn):
+                cfg = conn.get_config()
+                new_cfg = init_cfg.copy()
+                utils.deep_update(new_cfg, cfg)
+                self.validate_config(new_cfg)
+                update_config_with_init_cfg(cfg, conn)
 
     def remove_config(self, package):
         """ Remove configuration based on package YANG module.
@@ -571,13 +572,16 @@ class ServiceCreator:
         if not package.metadata.yang_modules:
             return
 
+        tables = []
         for module in package.metadata.yang_modules:
             module_name = self.cfg_mgmt.get_module_name(module)
             for tablename, module in self.cfg_mgmt.sy.confDbYangMap.items():
-                if module.get('module') != module_name:
-                    continue
+                if module.get('module') == module_name:
+                    tables.append(tablename)
 
-                for conn in self.sonic_db.get_connectors():
+        for conn in self.sonic_db.get_connectors():
+            with batch_updates(conn):
+                for tablename in tables:
                     keys = conn.get_table(tablename).keys()
                     for key in keys:
                         conn.set_entry(tablename, key, None)
@@ -1,8 +1,11 @@
 #!/usr/bin/env python
 
 import contextlib
+import copy
 import json
 import os
+import shutil
+import tempfile
 
 from swsscommon import swsscommon
 
@@ -22,12 +25,31 @@ class PersistentConfigDbConnector:
 
     def __init__(self, filepath):
         self._filepath = filepath
+        # In-memory config while in batch mode, None otherwise.
+        self._config = None
+
+    @contextlib.contextmanager
+    def batch(self):
+        """ Batch mode context. The config is loaded once when entering
+        the context, updates are applied in memory and the config is
+        written once when leaving the context without an exception. """
+
+        if self._config is not None:
+            # Nested batch, the outer one writes the config.
+            yield self
+            return
+
+        self._config = self._read_config()
+        try:
+            yield self
+            self._write_config(self._config)
+        finally:
+            self._config = None
 
     def get_config(self):
-        with open(self._filepath) as stream:
-            config = json.load(stream)
-        config = sonic_cfggen.FormatConverter.to_deserialized(config)
-        return config
+        if self._config is not None:
+            return copy.deepcopy(self._config)
+        return self._read_config()
 
     def get_entry(self, table, key):
         table = table.upper()
@@ -41,33 +63,32 @@ class PersistentConfigDbConnector:
 
     def set_entry(self, table, key, data):
         table = table.upper()
-        config = self.get_config()
-        if data is None:
-            self._del_key(config, table, key)
-        else:
-            table_data = config.setdefault(table, {})
-            table_data[key] = data
-        self._write_config(config)
+        with self.batch():
+            if data is None:
+                self._del_key(self._config, table, key)
+            else:
+                table_data = self._config.setdefault(table, {})
+                table_data[key] = data
 
     def mod_entry(self, table, key, data):
         table = table.upper()
-        config = self.get_config()
-        if data is None:
-            self._del_key(config, table, key)
-        else:
-            table_data = config.setdefault(table, {})
-            curr_data = table_data.setdefault(key, {})
-            curr_data.update(data)
-        self._write_config(config)
+        with self.batch():
+            if data is None:
+                self._del_key(self._config, table, key)
+            else:
+                table_data = self._config.setdefault(table, {})
+                curr_data = table_data.setdefault(key, {})
+                curr_data.update(data)
 
     def mod_config(self, config):
-        for table_name in config:
-            table_data = config[table_name]
-            if table_data is None:
-                self._del_table(config, table_name)
-                continue
-            for key in table_data:
-                self.mod_entry(table_name, key, table_data[key])
+        with self.batch():
+            for table_name in config:
+                table_data = config[table_name]
+                if table_data is None:
+                    self._del_table(self._config, table_name.upper())
+                    continue
+                for key in table_data:
+                    self.mod_entry(table_name, key, table_data[key])
 
     def _del_table(self, config, table):
         with contextlib.suppress(KeyError):
@@ -80,10 +101,46 @@ class PersistentConfigDbConnector:
         if table in config and not config[table]:
             self._del_table(config, table)
 
+    def _read_config(self):
+        with open(self._filepath) as stream:
+            config = json.load(stream)
+        config = sonic_cfggen.FormatConverter.to_deserialized(config)
+        return config
+
     def _write_config(self, config):
+        """ Write the config to a temporary file in the same directory
+        and rename it over the original so that readers never see
+        a partially written file. """
+
         config = sonic_cfggen.FormatConverter.to_serialized(config)
-        with open(self._filepath, 'w') as stream:
-            json.dump(config, stream, indent=4)
+        dirname = os.path.dirname(os.path.abspath(self._filepath))
+        fd, tmp_path = tempfile.mkstemp(dir=dirname, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as stream:
+                json.dump(config, stream, indent=4)
+                stream.flush()
+                os.fsync(stream.fileno())
+            os.chmod(tmp_path, 0o644)
+            with contextlib.suppress(FileNotFoundError):
+                shutil.copymode(self._filepath, tmp_path)
+            os.replace(tmp_path, self._filepath)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+
+
+@contextlib.contextmanager
+def batch_updates(conn):
+    """ Group the updates made through conn inside the context into
+    a single write if conn is a persistent DB connector.
+    Other connectors are updated as usual. """
+
+    if isinstance(conn, PersistentConfigDbConnector):
+        with conn.batch():
+            yield conn
+    else:
+        yield conn
 
 
 class SonicDB:
@@ -1,6 +1,8 @@
 import importlib
+import json
 import sys
 import os
+import time
 import pytest
 from unittest import mock
 
@@ -10,6 +12,7 @@ sys.path.insert(0, modules_path)
 
 from acl_loader import *
 from acl_loader.main import *
+from acl_loader.main import AclLoader, AclLoaderException  # noqa: E402
 
 class TestAclLoader(object):
     @pytest.fixture(scope="class")
@@ -324,6 +327,135 @@ class TestAclLoader(object):
         acl_loader.incremental_update()
         assert acl_loader.rules_info[(('NTP_ACL', 'RULE_1'))]["PACKET_ACTION"] == "DROP"
 
+    @pytest.mark.parametrize('filename', ['acl1.json', 'acl_egress.json', 'icmp_bad_protocol_number.json',
+                                          'illegal_v4v6_rule_no_ethertype.json', 'incremental_1.json',
+                                          'tcp_bad_protocol_number.json', 'empty_acl.json'])
+    def test_native_parser(self, acl_loader, filename):
+        acl_loader.get_session_name = mock.MagicMock(return_value="everflow_session_mock")
+        acl_loader.rules_info = {}
+        acl_loader.load_rules_from_file(os.path.join(test_path, 'acl_input', filename))
+        pyangbind_rules = acl_loader.rules_info
+
+        acl_loader.rules_info = {}
+        acl_loader.load_rules_from_file(os.path.join(test_path, 'acl_input', filename), native_parser=True)
+        assert acl_loader.rules_info == pyangbind_rules
+
+    @pytest.mark.parametrize('filename', ['illegal_vlan_0.json', 'illegal_vlan_9000.json', 'illegal_vlan_nan.json',
+                                          'illegal_icmp_type_neg_1.json', 'illegal_icmp_type_300.json',
+                                          'illegal_icmp_type_nan.json', 'illegal_icmp_code_neg_1.json',
+                                          'illegal_icmp_code_300.json', 'illegal_icmp_code_nan.json'])
+    def test_native_parser_illegal_value(self, acl_loader, filename):
+        with pytest.raises(ValueError):
+            acl_loader.rules_info = {}
+            acl_loader.load_rules_from_file(os.path.join(test_path, 'acl_input', filename), native_parser=True)
+
+    def test_native_parser_invalid(self):
+        with pytest.raises(AclLoaderException):
+            AclLoader.parse_acl_json_native(os.path.join(test_path, 'acl_input/acl2.json'))
+
+    @staticmethod
+    def generate_acl_file(path, rule_count):
+        acl_entries = {}
+        for idx in range(1, rule_count + 1):
+            acl_entries[str(idx)] = {
+                "config": {"sequence-id": idx},
+                "actions": {"config": {"forwarding-action": "ACCEPT" if idx % 2 else "DROP"}},
+                "ip": {"config": {
+                    "protocol": "IP_TCP" if idx % 3 else "17",
+                    "source-ip-address": "10.{}.{}.0/24".format(idx // 256 % 256, idx % 256),
+                    "destination-ip-address": "20.0.0.{}/32".format(idx % 256)
+                }},
+                "transport": {"config": {"destination-port": str(idx % 65536) if idx % 5 else "1000..2000"}}
+            }
+        acl = {"acl": {"acl-sets": {"acl-set": {"DATAACL": {
+            "config": {"name": "DATAACL"},
+            "acl-entries": {"acl-entry": acl_entries}
+        }}}}}
+        with open(path, 'w') as f:
+            json.dump(acl, f)
+
+    def test_native_parser_generated(self, acl_loader, tmp_path):
+        filename = str(tmp_path / 'acl_generated.json')
+        self.generate_acl_file(filename, 200)
+
+        acl_loader.rules_info = {}
+        acl_loader.load_rules_from_file(filename)
+        pyangbind_rules = acl_loader.rules_info
+
+        acl_loader.rules_info = {}
+        acl_loader.load_rules_from_file(filename, native_parser=True)
+        assert acl_loader.rules_info == pyangbind_rules
+
+    def test_native_parser_faster_than_pyangbind(self, acl_loader, tmp_path):
+        filename = str(tmp_path / 'acl_2k.json')
+        self.generate_acl_file(filename, 2000)
+
+        durations = {}
+        rules = {}
+        for native_parser in (True, False):
+            acl_loader.rules_info = {}
+            start = time.monotonic()
+            acl_loader.load_rules_from_file(filename, native_parser=native_parser)
+            durations[native_parser] = time.monotonic() - start
+            rules[native_parser] = acl_loader.rules_info
+        # 2000 rules and the default deny rule
+        assert len(rules[True]) == 2001
+        assert rules[True] == rules[False]
+        assert durations[True] < durations[False]
+
+    def test_incremental_update_diff(self, acl_loader):
+        acl_loader.rules_info = {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'FORWARD', 'SRC_IP': '10.0.0.1/32'},
+            ('DATAACL', 'RULE_2'): {'PRIORITY': '9998', 'PACKET_ACTION': 'DROP'},
+            ('DATAACL', 'RULE_3'): {'PRIORITY': '9997', 'PACKET_ACTION': 'DROP', 'SRC_IP': '10.0.0.3/32'},
+            ('DATAACL', 'RULE_5'): {'PRIORITY': '9995', 'PACKET_ACTION': 'DROP'},
+        }
+        acl_loader.rules_db_info = {
+            ('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'FORWARD', 'SRC_IP': '10.0.0.1/32'},
+            ('DATAACL', 'RULE_2'): {'PRIORITY': '9998', 'PACKET_ACTION': 'DROP', 'SRC_IP': '10.0.0.2/32'},
+            ('DATAACL', 'RULE_3'): {'PRIORITY': '9997', 'PACKET_ACTION': 'FORWARD', 'SRC_IP': '10.0.0.3/32'},
+            ('DATAACL', 'RULE_4'): {'PRIORITY': '9996', 'PACKET_ACTION': 'DROP'},
+        }
+        acl_loader.configdb.mod_entry = mock.MagicMock(return_value=True)
+
+        added, changed, removed = acl_loader.get_rules_delta()
+        assert added == [('DATAACL', 'RULE_5')]
+        assert changed == [('DATAACL', 'RULE_2'), ('DATAACL', 'RULE_3')]
+        assert removed == [('DATAACL', 'RULE_4')]
+
+        configdb = mock.MagicMock()
+        with mock.patch('acl_loader.main.ConfigDBPipeConnector', return_value=configdb):
+            acl_loader.incremental_update(diff=True)
+
+        acl_loader.configdb.mod_entry.assert_not_called()
+        # RULE_2 no longer matches SRC_IP, it is replaced rather than merged
+        assert configdb.mod_config.call_args_list == [
+            mock.call({'ACL_RULE': {
+                ('DATAACL', 'RULE_5'): acl_loader.rules_info[('DATAACL', 'RULE_5')],
+                ('DATAACL', 'RULE_3'): acl_loader.rules_info[('DATAACL', 'RULE_3')]}}),
+            mock.call({'ACL_RULE': {('DATAACL', 'RULE_4'): None}})
+        ]
+        configdb.set_entry.assert_called_once_with('ACL_RULE', ('DATAACL', 'RULE_2'),
+                                                   acl_loader.rules_info[('DATAACL', 'RULE_2')])
+
+    def test_incremental_update_diff_unchanged_file(self, acl_loader):
+        acl_loader.rules_info = {}
+        acl_loader.load_rules_from_file(os.path.join(test_path, 'acl_input/acl1.json'))
+        # The same rules as Config DB returns them, with string values only
+        acl_loader.rules_db_info = {key: {field: str(value) for field, value in rule.items()}
+                                    for key, rule in acl_loader.rules_info.items()}
+        assert any(isinstance(value, int) for rule in acl_loader.rules_info.values() for value in rule.values())
+
+        added, changed, removed = acl_loader.get_rules_delta()
+        assert (added, changed, removed) == ([], [], [])
+
+    def test_incremental_update_diff_no_change(self, acl_loader):
+        acl_loader.rules_info = {('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'FORWARD'}}
+        acl_loader.rules_db_info = {('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'FORWARD'}}
+        with mock.patch('acl_loader.main.ConfigDBPipeConnector') as mock_connector:
+            acl_loader.incremental_update(diff=True)
+        mock_connector.assert_not_called()
+
 
 
 class TestMasicAclLoader(object):
@@ -363,3 +495,12 @@ class TestMasicAclLoader(object):
         acl_loader.load_rules_from_file(os.path.join(test_path, 'acl_input/incremental_2.json'))
         acl_loader.incremental_update()
         assert acl_loader.rules_info[(('NTP_ACL', 'RULE_1'))]["PACKET_ACTION"] == "DROP"
+
+    def test_incremental_update_diff(self, acl_loader):
+        acl_loader.rules_info = {('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'DROP'}}
+        acl_loader.rules_db_info = {('DATAACL', 'RULE_1'): {'PRIORITY': '9999', 'PACKET_ACTION': 'FORWARD'}}
+        with mock.patch('acl_loader.main.ConfigDBPipeConnector') as mock_connector:
+            acl_loader.incremental_update(diff=True)
+        assert mock_connector.call_args_list == [mock.call(), mock.call(namespace='asic0'),
+                                                 mock.call(namespace='asic1')]
+        assert mock_connector.return_value.mod_config.call_count == 3
@@ -1,5 +1,6 @@
 import json
 import os
+import threading
 
 import pytest
 import importlib
@@ -370,10 +371,10 @@ Total number of neighbors 23
 """
 SHOW_BGP_SUMMARY_V4_NO_EXT_NEIGHBORS_ON_ALL_ASIC = """
 IPv4 Unicast Summary:
-asic0: BGP router identifier 10.1.0.32, local AS number 65100 vrf-id 0
-BGP table version 8972
-asic1: BGP router identifier 10.1.0.32, local AS number 65100 vrf-id 0
-BGP table version 8972
+asic0: BGP router identifier 192.0.0.6, local AS number 65100 vrf-id 0
+BGP table version 59923
+asic1: BGP router identifier 192.0.0.8, local AS number 65100 vrf-id 0
+BGP table version 64918
 RIB entries 0, using 0 bytes of memory
 Peers 0, using 0 KiB of memory
 Peer groups 0, using 0 bytes of memory
@@ -389,8 +390,8 @@ SHOW_BGP_SUMMARY_V4_NO_EXT_NEIGHBORS_ON_ASIC1 = """
 IPv4 Unicast Summary:
 asic0: BGP router identifier 192.0.0.6, local AS number 65100 vrf-id 0
 BGP table version 59923
-asic1: BGP router identifier 10.1.0.32, local AS number 65100 vrf-id 0
-BGP table version 8972
+asic1: BGP router identifier 192.0.0.8, local AS number 65100 vrf-id 0
+BGP table version 64918
 RIB entries 3, using 3 bytes of memory
 Peers 3, using 3 KiB of memory
 Peer groups 3, using 3 bytes of memory
@@ -1116,6 +1117,28 @@ class TestBgpCommandsMultiAsic(object):
         assert result.exit_code == 0
         assert result.output == SHOW_BGP_SUMMARY_ALL_V4_NO_EXT_NEIGHBORS
 
+    def test_get_bgp_header_from_table(self):
+        with open(os.path.join(os.path.dirname(__file__), 'mock_tables', 'device_bgp_info.json')) as f:
+            output = f.read()
+        header = bgp_util.get_bgp_header_from_table(output)
+        assert header['routerId'] == '10.1.0.32'
+        assert header['localAS'] == 65100
+        assert header['vrfId'] == 0
+        assert header['tableVersion'] == 8972
+        assert header['routes'] == {}
+        assert bgp_util.get_bgp_header_from_table('{}') == {}
+
+    def test_run_bgp_show_commands(self):
+        # Every command waits for all of them to be running, which fails unless they run concurrently
+        barrier = threading.Barrier(4, timeout=10)
+
+        def run_bgp_show_command(vtysh_cmd, bgp_namespace):
+            barrier.wait()
+            return '{} {}'.format(vtysh_cmd, bgp_namespace)
+
+        with patch('utilities_common.bgp_util.run_bgp_show_command', side_effect=run_bgp_show_command):
+            outputs = bgp_util.run_bgp_show_commands([('show ip bgp json', 'asic{}'.format(idx)) for idx in range(4)])
+        assert outputs == ['show ip bgp json asic{}'.format(idx) for idx in range(4)]
 
     def teardown_class(cls):
         print("TEARDOWN")
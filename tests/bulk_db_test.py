@@ -0,0 +1,50 @@
+from unittest import mock
+
+from .mock_tables import dbconnector
+from utilities_common import bulk_db
+
+
+class TestBulkDb(object):
+    def setup_method(self):
+        self.db = dbconnector.SonicV2Connector()
+        self.db.connect(self.db.COUNTERS_DB)
+
+    def test_hgetall_many(self):
+        keys = ['COUNTERS:oid:0x1000000000012', 'COUNTERS:oid:0xdeadbeef', 'RATES:oid:0x1000000000012']
+        result = bulk_db.hgetall_many(self.db, self.db.COUNTERS_DB, keys, batch_size=2)
+        assert len(result) == 3
+        assert result[0]['SAI_PORT_STAT_IF_IN_UCAST_PKTS'] == '8'
+        assert result[1] == {}
+        assert result[2]['RX_BPS'] == '2.e9'
+
+    def test_hget_many(self):
+        keys = ['COUNTERS_PORT_NAME_MAP', 'COUNTERS:oid:0xdeadbeef']
+        result = bulk_db.hget_many(self.db, self.db.COUNTERS_DB, keys, 'Ethernet0')
+        assert result == ['oid:0x1000000000012', None]
+
+    def test_hmget_many(self):
+        keys = ['COUNTERS_PORT_NAME_MAP', 'COUNTERS:oid:0xdeadbeef']
+        result = bulk_db.hmget_many(self.db, self.db.COUNTERS_DB, keys, ['Ethernet0', 'Ethernet_unknown'])
+        assert result == [['oid:0x1000000000012', None], [None, None]]
+
+    def test_hmget(self):
+        result = bulk_db.hmget(self.db, self.db.COUNTERS_DB, 'COUNTERS_PORT_NAME_MAP',
+                               ['Ethernet0', 'Ethernet_unknown', 'Ethernet4'], batch_size=2)
+        assert result == ['oid:0x1000000000012', None, 'oid:0x1000000000013']
+
+    def test_scan_keys(self):
+        keys = set(bulk_db.scan_keys(self.db, self.db.COUNTERS_DB, 'RATES:oid:0x100000000001*'))
+        assert keys == set(self.db.keys(self.db.COUNTERS_DB, 'RATES:oid:0x100000000001*'))
+
+    def test_fallback_without_pipeline(self):
+        with mock.patch('utilities_common.bulk_db.get_pipeline_client', return_value=None):
+            result = bulk_db.hgetall_many(self.db, self.db.COUNTERS_DB,
+                                          ['COUNTERS:oid:0x1000000000012', 'COUNTERS:oid:0xdeadbeef'])
+            assert result[0]['SAI_PORT_STAT_IF_IN_UCAST_PKTS'] == '8'
+            assert result[1] == {}
+            assert bulk_db.hget_many(self.db, self.db.COUNTERS_DB,
+                                     ['COUNTERS_PORT_NAME_MAP'], 'Ethernet4') == ['oid:0x1000000000013']
+            assert bulk_db.hmget(self.db, self.db.COUNTERS_DB, 'COUNTERS_PORT_NAME_MAP',
+                                 ['Ethernet4']) == ['oid:0x1000000000013']
+            assert bulk_db.hmget_many(self.db, self.db.COUNTERS_DB, ['COUNTERS_PORT_NAME_MAP'],
+                                      ['Ethernet4', 'Ethernet_unknown']) == [['oid:0x1000000000013', None]]
@@ -0,0 +1,212 @@
+import importlib
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import click
+from click.testing import CliRunner
+
+import utilities_common.cli as clicommon
+from utilities_common import util_base
+
+test_path = os.path.dirname(os.path.abspath(__file__))
+modules_path = os.path.dirname(test_path)
+
+# Submodules which must not be imported to start the CLI
+SHOW_LAZY_MODULES = ['show.acl', 'show.muxcable', 'show.nat', 'show.vxlan', 'show.stp', 'show.platform']
+CONFIG_LAZY_MODULES = ['config.aaa', 'config.muxcable', 'config.nat', 'config.vxlan', 'config.mclag', 'config.vlan']
+
+
+def create_module(path, name, source):
+    with open(os.path.join(path, name), 'w') as module_file:
+        module_file.write(textwrap.dedent(source))
+
+
+def unload_modules(prefix):
+    for name in [name for name in sys.modules if name.startswith(prefix)]:
+        del sys.modules[name]
+
+
+class TestLazyCommands(object):
+    def test_add_lazy_commands(self, tmp_path, monkeypatch):
+        create_module(tmp_path, 'lazy_test_commands.py', '''
+            import click
+
+            @click.command()
+            def hello():
+                click.echo('hello')
+        ''')
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        @click.group(cls=clicommon.AliasedGroup)
+        def cli():
+            pass
+
+        clicommon.add_lazy_commands(cli, {'hello': ('lazy_test_commands', 'hello')})
+        assert 'lazy_test_commands' not in sys.modules
+        assert cli.list_commands(None) == ['hello']
+
+        result = CliRunner().invoke(cli, ['hel'])
+        assert result.exit_code == 0
+        assert result.output == 'hello\n'
+        assert 'lazy_test_commands' in sys.modules
+        unload_modules('lazy_test_commands')
+
+
+class TestPluginsManifest(object):
+    def create_plugins(self, tmp_path):
+        plugins_path = tmp_path / 'lazy_test_plugins'
+        plugins_path.mkdir()
+        create_module(plugins_path, '__init__.py', '')
+        create_module(plugins_path, 'hello.py', '''
+            import click
+
+            @click.command()
+            def hello():
+                click.echo('hello')
+
+            def register(cli):
+                cli.add_command(hello)
+        ''')
+        create_module(plugins_path, 'extend.py', '''
+            import click
+
+            @click.command()
+            def sub():
+                click.echo('sub')
+
+            def register(cli):
+                cli.commands['base'].add_command(sub)
+        ''')
+        create_module(plugins_path, 'noop.py', '''
+            def register(cli):
+                pass
+        ''')
+
+    def create_cli(self):
+        @click.group()
+        def cli():
+            pass
+
+        @cli.group()
+        def base():
+            pass
+
+        return cli
+
+    def load_plugins(self, manifest_path):
+        cli = self.create_cli()
+        plugins = importlib.import_module('lazy_test_plugins')
+        util_base.UtilHelper().load_and_register_plugins(plugins, cli, manifest_path)
+        return cli
+
+    def test_plugins_loaded_on_use(self, tmp_path, monkeypatch):
+        self.create_plugins(tmp_path)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        manifest_path = str(tmp_path / 'cache' / 'plugins.json')
+
+        # First run loads all the plugins and writes the manifest
+        cli = self.load_plugins(manifest_path)
+        assert 'lazy_test_plugins.hello' in sys.modules
+        assert sorted(cli.commands) == ['base', 'hello']
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)['plugins']
+        assert manifest['lazy_test_plugins.hello']['commands'] == ['hello']
+        assert manifest['lazy_test_plugins.extend']['commands'] == ['base']
+        assert manifest['lazy_test_plugins.noop']['commands'] == []
+
+        # Next runs import a plugin when one of its commands is used
+        unload_modules('lazy_test_plugins')
+        cli = self.load_plugins(manifest_path)
+        assert not [name for name in sys.modules if name.startswith('lazy_test_plugins.')]
+        assert sorted(cli.commands) == ['base', 'hello']
+
+        result = CliRunner().invoke(cli, ['hello'])
+        assert result.output == 'hello\n'
+        assert 'lazy_test_plugins.hello' in sys.modules
+        assert 'lazy_test_plugins.extend' not in sys.modules
+
+        result = CliRunner().invoke(cli, ['base', 'sub'])
+        assert result.output == 'sub\n'
+        assert 'lazy_test_plugins.noop' not in sys.modules
+        unload_modules('lazy_test_plugins')
+
+    def test_plugin_with_several_commands(self, tmp_path, monkeypatch):
+        self.create_plugins(tmp_path)
+        create_module(tmp_path / 'lazy_test_plugins', 'pair.py', '''
+            import click
+
+            @click.command()
+            def first():
+                click.echo('first')
+
+            @click.command()
+            def second():
+                click.echo('second')
+
+            def register(cli):
+                for command in (first, second):
+                    if command.name in cli.commands:
+                        raise Exception('{} already exists in CLI'.format(command.name))
+                    cli.add_command(command)
+        ''')
+        monkeypatch.syspath_prepend(str(tmp_path))
+        manifest_path = str(tmp_path / 'plugins.json')
+        self.load_plugins(manifest_path)
+        unload_modules('lazy_test_plugins')
+
+        cli = self.load_plugins(manifest_path)
+        assert sorted(cli.commands) == ['base', 'first', 'hello', 'second']
+        assert CliRunner().invoke(cli, ['second']).output == 'second\n'
+        assert CliRunner().invoke(cli, ['first']).output == 'first\n'
+        assert 'lazy_test_plugins.hello' not in sys.modules
+        unload_modules('lazy_test_plugins')
+
+    def test_modified_plugin_reloaded(self, tmp_path, monkeypatch):
+        self.create_plugins(tmp_path)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        manifest_path = str(tmp_path / 'plugins.json')
+        self.load_plugins(manifest_path)
+        unload_modules('lazy_test_plugins')
+
+        create_module(tmp_path / 'lazy_test_plugins', 'noop.py', '''
+            import click
+
+            @click.command()
+            def bye():
+                click.echo('bye')
+
+            def register(cli):
+                cli.add_command(bye)
+        ''')
+        cli = self.load_plugins(manifest_path)
+        assert 'lazy_test_plugins.noop' in sys.modules
+        assert 'lazy_test_plugins.hello' not in sys.modules
+        assert sorted(cli.commands) == ['base', 'bye', 'hello']
+        with open(manifest_path) as manifest_file:
+            assert json.load(manifest_file)['plugins']['lazy_test_plugins.noop']['commands'] == ['bye']
+        unload_modules('lazy_test_plugins')
+
+
+class TestStartupImports(object):
+    def import_cli(self, module, lazy_modules):
+        """ Import the CLI in a fresh interpreter, return the lazily loaded
+        submodules which got imported. """
+
+        env = dict(os.environ, UTILITIES_UNIT_TESTING='2')
+        env.pop('UTILITIES_UNIT_TESTING_TOPOLOGY', None)
+        code = textwrap.dedent('''
+            import json, sys
+            import {module}
+            print(json.dumps([name for name in {lazy_modules} if name in sys.modules]))
+        ''').format(module=module, lazy_modules=lazy_modules)
+        output = subprocess.check_output([sys.executable, '-c', code], cwd=modules_path, env=env, text=True)
+        return json.loads(output.splitlines()[-1])
+
+    def test_show_startup(self):
+        assert self.import_cli('show.main', SHOW_LAZY_MODULES) == []
+
+    def test_config_startup(self):
+        assert self.import_cli('config.main', CONFIG_LAZY_MODULES) == []
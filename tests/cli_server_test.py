@@ -0,0 +1,180 @@
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+
+import pytest
+
+from utilities_common import cli_server
+
+test_path = os.path.dirname(os.path.abspath(__file__))
+modules_path = os.path.dirname(test_path)
+
+SERVER_CODE = textwrap.dedent('''
+    import os, subprocess, sys, time
+    import click
+    from utilities_common import cli_server
+
+    COUNT = 0
+
+    class PidServer(cli_server.CliServer):
+        def get_obj(self):
+            return {'pid': os.getpid()}
+
+    @click.group()
+    @click.pass_context
+    def cli(ctx):
+        pass
+
+    @cli.command()
+    @click.argument('name')
+    @click.pass_obj
+    def hello(obj, name):
+        click.echo('hello {} from {}'.format(name, obj['pid']))
+        sys.stdout.flush()
+        subprocess.call(['echo', 'child output'])
+
+    @cli.command()
+    def env():
+        click.echo('{} {}'.format(os.environ.get('CLI_SERVER_TEST'), os.getcwd()))
+
+    @cli.command()
+    def fail():
+        raise ValueError('boom')
+
+    @cli.command()
+    def count():
+        global COUNT
+        COUNT += 1
+        click.echo(COUNT)
+
+    @cli.command()
+    def block():
+        click.echo(os.getpid())
+        sys.stdout.flush()
+        time.sleep(60)
+
+    timeout = float(sys.argv[2]) if len(sys.argv) > 2 else None
+    with PidServer(sys.argv[1], cli, 'test', timeout) as server:
+        server.preload()
+        print('ready', flush=True)
+        server.serve_forever()
+''')
+
+
+CLIENT_CODE = textwrap.dedent('''
+    import sys
+    from utilities_common import cli_server
+    sys.exit(cli_server.run_client(sys.argv[1], sys.argv[2:]))
+''')
+
+
+def start_server(socket_path, *args):
+    server = subprocess.Popen([sys.executable, '-c', SERVER_CODE, socket_path] + list(args), cwd=modules_path,
+                              stdout=subprocess.PIPE, text=True)
+    assert server.stdout.readline() == 'ready\n'
+    return server
+
+
+@pytest.fixture
+def server_socket(tmp_path):
+    socket_path = str(tmp_path / 'cli.sock')
+    server = start_server(socket_path)
+    yield socket_path, server.pid
+    server.terminate()
+    server.wait()
+
+
+def wait_process_exit(pid, timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def run_client(socket_path, argv):
+    with tempfile.TemporaryFile() as stdin, tempfile.TemporaryFile() as stdout, \
+            tempfile.TemporaryFile() as stderr:
+        exit_code = cli_server.run_client(socket_path, argv,
+                                          fds=(stdin.fileno(), stdout.fileno(), stderr.fileno()))
+        stdout.seek(0)
+        stderr.seek(0)
+        return exit_code, stdout.read().decode(), stderr.read().decode()
+
+
+class TestCliServer(object):
+    def test_command_output(self, server_socket):
+        socket_path, server_pid = server_socket
+        command_pids = set()
+        for _ in range(2):
+            exit_code, stdout, stderr = run_client(socket_path, ['hello', 'world'])
+            assert exit_code == 0
+            lines = stdout.splitlines()
+            assert lines[0].startswith('hello world from ')
+            assert lines[1:] == ['child output']
+            assert stderr == ''
+            command_pids.add(int(lines[0].split()[-1]))
+        # Every command runs in a new process
+        assert len(command_pids) == 2
+        assert server_pid not in command_pids
+
+    def test_no_state_kept(self, server_socket):
+        socket_path, _ = server_socket
+        for _ in range(2):
+            assert run_client(socket_path, ['count']) == (0, '1\n', '')
+
+    def test_client_gone(self, server_socket):
+        socket_path, _ = server_socket
+        client = subprocess.Popen([sys.executable, '-c', CLIENT_CODE, socket_path, 'block'], cwd=modules_path,
+                                  stdout=subprocess.PIPE, text=True)
+        try:
+            command_pid = int(client.stdout.readline())
+            # A long running command doesn't hold up the other commands
+            assert run_client(socket_path, ['count']) == (0, '1\n', '')
+        finally:
+            client.kill()
+            client.wait()
+        # The command is killed along with the client
+        assert wait_process_exit(command_pid)
+
+    def test_timeout(self, tmp_path):
+        socket_path = str(tmp_path / 'cli.sock')
+        server = start_server(socket_path, '0.5')
+        try:
+            exit_code, stdout, stderr = run_client(socket_path, ['block'])
+            assert exit_code == cli_server.TIMEOUT_EXIT_CODE
+            assert 'timed out' in stderr
+            assert wait_process_exit(int(stdout))
+        finally:
+            server.terminate()
+            server.wait()
+
+    def test_environment_forwarded(self, server_socket, monkeypatch, tmp_path):
+        socket_path, _ = server_socket
+        monkeypatch.setenv('CLI_SERVER_TEST', 'forwarded')
+        monkeypatch.chdir(tmp_path)
+        exit_code, stdout, _ = run_client(socket_path, ['env'])
+        assert exit_code == 0
+        assert stdout == 'forwarded {}\n'.format(os.path.realpath(str(tmp_path)))
+
+    def test_exit_codes(self, server_socket):
+        socket_path, _ = server_socket
+        exit_code, _, stderr = run_client(socket_path, ['fail'])
+        assert exit_code == 1
+        assert 'ValueError: boom' in stderr
+
+        exit_code, _, stderr = run_client(socket_path, ['unknown'])
+        assert exit_code == 2
+        assert 'No such command' in stderr
+
+        # The server keeps serving after failures
+        assert run_client(socket_path, ['hello', 'again'])[0] == 0
+
+    def test_no_server(self, tmp_path):
+        assert cli_server.run_client(str(tmp_path / 'missing.sock'), ['hello']) is None
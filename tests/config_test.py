@@ -240,23 +240,23 @@ Released lock on {0}
 """
 
 save_config_output = """\
-Running command: /usr/local/bin/sonic-cfggen -d --print-data > /etc/sonic/config_db.json
+Saving CONFIG_DB to /etc/sonic/config_db.json
 """
 
 save_config_filename_output = """\
-Running command: /usr/local/bin/sonic-cfggen -d --print-data > /tmp/config_db.json
+Saving CONFIG_DB to /tmp/config_db.json
 """
 
 save_config_masic_output = """\
-Running command: /usr/local/bin/sonic-cfggen -d --print-data > /etc/sonic/config_db.json
-Running command: /usr/local/bin/sonic-cfggen -n asic0 -d --print-data > /etc/sonic/config_db0.json
-Running command: /usr/local/bin/sonic-cfggen -n asic1 -d --print-data > /etc/sonic/config_db1.json
+Saving CONFIG_DB to /etc/sonic/config_db.json
+Saving CONFIG_DB of asic0 to /etc/sonic/config_db0.json
+Saving CONFIG_DB of asic1 to /etc/sonic/config_db1.json
 """
 
 save_config_filename_masic_output = """\
-Running command: /usr/local/bin/sonic-cfggen -d --print-data > config_db.json
-Running command: /usr/local/bin/sonic-cfggen -n asic0 -d --print-data > config_db0.json
-Running command: /usr/local/bin/sonic-cfggen -n asic1 -d --print-data > config_db1.json
+Saving CONFIG_DB to config_db.json
+Saving CONFIG_DB of asic0 to config_db0.json
+Saving CONFIG_DB of asic1 to config_db1.json
 """
 
 save_config_onefile_masic_output = """\
@@ -296,6 +296,30 @@ config_temp = {
         }
     }
 
+
+def mock_config_db_pipe_connector(use_unix_socket_path=False, namespace=None):
+    config_db = mock.MagicMock()
+    config_db.get_config.return_value = {
+        'PORT': {
+            'Ethernet8': {'alias': 'etp3'},
+            'Ethernet0': {'alias': 'etp1'},
+        },
+        'DEVICE_METADATA': {
+            'localhost': {'hostname': namespace or 'host'},
+        },
+    }
+    return config_db
+
+
+class ConfigDbFiles(object):
+    """Record the config files written by 'config save'"""
+    def __init__(self):
+        self.files = {}
+
+    def write(self, json_input, fileName):
+        self.files[fileName] = json_input
+
+
 def mock_run_command_side_effect(*args, **kwargs):
     command = args[0]
     if isinstance(command, str):
@@ -442,15 +466,11 @@ class TestConfigSave(object):
         importlib.reload(config.main)
 
     def test_config_save(self, get_cmd_module, setup_single_broadcom_asic):
-        def read_json_file_side_effect(filename):
-            return {}
-
-        with mock.patch("utilities_common.cli.run_command",
-                        mock.MagicMock(side_effect=mock_run_command_side_effect)),\
-            mock.patch('config.main.read_json_file',
-                       mock.MagicMock(side_effect=read_json_file_side_effect)),\
-            mock.patch('config.main.open',
-                       mock.MagicMock()):
+        config_db_files = ConfigDbFiles()
+        with mock.patch('config.main.ConfigDBPipeConnector',
+                        mock.MagicMock(side_effect=mock_config_db_pipe_connector)), \
+            mock.patch('config.main.write_json_file_atomic',
+                       mock.MagicMock(side_effect=config_db_files.write)):
             (config, show) = get_cmd_module
 
             runner = CliRunner()
@@ -464,16 +484,18 @@ class TestConfigSave(object):
             assert result.exit_code == 0
             assert "\n".join([li.rstrip() for li in result.output.split('\n')]) == save_config_output
 
-    def test_config_save_filename(self, get_cmd_module, setup_single_broadcom_asic):
-        def read_json_file_side_effect(filename):
-            return {}
+            # Tables and keys are sorted
+            saved_config = config_db_files.files['/etc/sonic/config_db.json']
+            assert list(saved_config) == ['DEVICE_METADATA', 'PORT']
+            assert list(saved_config['PORT']) == ['Ethernet0', 'Ethernet8']
+            assert saved_config['DEVICE_METADATA']['localhost']['hostname'] == 'host'
 
-        with mock.patch("utilities_common.cli.run_command",
-                        mock.MagicMock(side_effect=mock_run_command_side_effect)),\
-            mock.patch('config.main.read_json_file',
-                       mock.MagicMock(side_effect=read_json_file_side_effect)),\
-            mock.patch('config.main.open',
-                       mock.MagicMock()):
+    def test_config_save_filename(self, get_cmd_module, setup_single_broadcom_asic):
+        config_db_files = ConfigDbFiles()
+        with mock.patch('config.main.ConfigDBPipeConnector',
+                        mock.MagicMock(side_effect=mock_config_db_pipe_connector)), \
+            mock.patch('config.main.write_json_file_atomic',
+                       mock.MagicMock(side_effect=config_db_files.write)):
 
             (config, show) = get_cmd_module
 
@@ -488,6 +510,17 @@ class TestConfigSave(object):
 
             assert result.exit_code == 0
             assert "\n".join([li.rstrip() for li in result.output.split('\n')]) == save_config_filename_output
+            assert list(config_db_files.files) == [output_file]
+
+    def test_write_json_file_atomic(self, tmp_path):
+        config_file = tmp_path / 'config_db.json'
+        config_file.write_text('{"PORT": {}}')
+        os.chmod(str(config_file), 0o600)
+
+        config.write_json_file_atomic({'VLAN': {'Vlan1000': {}}}, str(config_file))
+        assert json.loads(config_file.read_text()) == {'VLAN': {'Vlan1000': {}}}
+        assert os.stat(str(config_file)).st_mode & 0o777 == 0o600
+        assert os.listdir(str(tmp_path)) == ['config_db.json']
 
     @classmethod
     def teardown_class(cls):
@@ -510,15 +543,11 @@ class TestConfigSaveMasic(object):
         dbconnector.load_namespace_config()
 
     def test_config_save_masic(self):
-        def read_json_file_side_effect(filename):
-            return {}
-
-        with mock.patch("utilities_common.cli.run_command",
-                        mock.MagicMock(side_effect=mock_run_command_side_effect)),\
-            mock.patch('config.main.read_json_file',
-                       mock.MagicMock(side_effect=read_json_file_side_effect)),\
-            mock.patch('config.main.open',
-                       mock.MagicMock()):
+        config_db_files = ConfigDbFiles()
+        with mock.patch('config.main.ConfigDBPipeConnector',
+                        mock.MagicMock(side_effect=mock_config_db_pipe_connector)), \
+            mock.patch('config.main.write_json_file_atomic',
+                       mock.MagicMock(side_effect=config_db_files.write)):
 
             runner = CliRunner()
 
@@ -530,17 +559,43 @@ class TestConfigSaveMasic(object):
 
             assert result.exit_code == 0
             assert "\n".join([li.rstrip() for li in result.output.split('\n')]) == save_config_masic_output
+            for namespace, file in [('host', '/etc/sonic/config_db.json'),
+                                    ('asic0', '/etc/sonic/config_db0.json'),
+                                    ('asic1', '/etc/sonic/config_db1.json')]:
+                assert config_db_files.files[file]['DEVICE_METADATA']['localhost']['hostname'] == namespace
+
+    def test_config_save_masic_failure(self):
+        def config_db_pipe_connector(use_unix_socket_path=False, namespace=None):
+            config_db = mock_config_db_pipe_connector(use_unix_socket_path, namespace)
+            if namespace == 'asic0':
+                config_db.get_config.side_effect = Exception('connection refused')
+            return config_db
+
+        config_db_files = ConfigDbFiles()
+        with mock.patch('config.main.ConfigDBPipeConnector',
+                        mock.MagicMock(side_effect=config_db_pipe_connector)), \
+            mock.patch('config.main.write_json_file_atomic',
+                       mock.MagicMock(side_effect=config_db_files.write)):
 
-    def test_config_save_filename_masic(self):
-        def read_json_file_side_effect(filename):
-            return {}
+            runner = CliRunner()
 
-        with mock.patch("utilities_common.cli.run_command",
-                        mock.MagicMock(side_effect=mock_run_command_side_effect)),\
-            mock.patch('config.main.read_json_file',
-                       mock.MagicMock(side_effect=read_json_file_side_effect)),\
-            mock.patch('config.main.open',
-                       mock.MagicMock()):
+            result = runner.invoke(config.config.commands["save"], ["-y"])
+
+            print(result.exit_code)
+            print(result.output)
+
+            assert result.exit_code == 1
+            assert "Failed to save CONFIG_DB of asic0 to /etc/sonic/config_db0.json: connection refused" in \
+                result.output
+            # The other namespaces are still saved
+            assert sorted(config_db_files.files) == ['/etc/sonic/config_db.json', '/etc/sonic/config_db1.json']
+
+    def test_config_save_filename_masic(self):
+        config_db_files = ConfigDbFiles()
+        with mock.patch('config.main.ConfigDBPipeConnector',
+                        mock.MagicMock(side_effect=mock_config_db_pipe_connector)), \
+            mock.patch('config.main.write_json_file_atomic',
+                       mock.MagicMock(side_effect=config_db_files.write)):
 
             runner = CliRunner()
 
@@ -555,6 +610,7 @@ class TestConfigSaveMasic(object):
 
             assert result.exit_code == 0
             assert "\n".join([li.rstrip() for li in result.output.split('\n')]) == save_config_filename_masic_output
+            assert sorted(config_db_files.files) == ['config_db.json', 'config_db0.json', 'config_db1.json']
 
     def test_config_save_filename_wrong_cnt_masic(self):
         def read_json_file_side_effect(filename):
@@ -1559,6 +1615,67 @@ class TestReloadConfig(object):
         print("TEARDOWN")
 
 
+class TestRunNamespaceReloads(object):
+    namespaces = ['', 'asic0', 'asic1']
+
+    def test_parallel_reload_host_first(self):
+        done = []
+
+        def reload_func(reload):
+            with reload.stage('load'):
+                reload.output.append("loaded {}".format(reload.name))
+                done.append(reload.namespace)
+
+        runner = CliRunner()
+        with runner.isolation() as (out, _):
+            config.run_namespace_reloads('reload', self.namespaces, reload_func, parallel=True)
+        output = out.getvalue().decode()
+
+        assert done[0] == ''
+        assert sorted(done[1:]) == ['asic0', 'asic1']
+        assert output.index("loaded localhost") < output.index("loaded asic0") < output.index("loaded asic1")
+        assert "'reload' stage timing:" in output
+        assert "  asic1: load " in output
+
+    def test_parallel_reload_aggregates_errors(self):
+        def reload_func(reload):
+            with reload.stage('load'):
+                pass
+            with reload.stage('migrate'):
+                if reload.namespace != '':
+                    raise config.NamespaceReloadError("{} failed".format(reload.namespace))
+
+        runner = CliRunner(mix_stderr=False)
+        with pytest.raises(SystemExit) as e, runner.isolation() as (_, err):
+            config.run_namespace_reloads('reload', self.namespaces, reload_func, parallel=True)
+        assert e.value.code == 1
+        errors = err.getvalue().decode()
+        assert "'reload' of asic0 failed at stage migrate: asic0 failed" in errors
+        assert "'reload' of asic1 failed at stage migrate: asic1 failed" in errors
+
+    def test_parallel_reload_host_failure_skips_asics(self):
+        done = []
+
+        def reload_func(reload):
+            with reload.stage('flush'):
+                done.append(reload.namespace)
+                if reload.namespace == '':
+                    sys.exit(1)
+
+        runner = CliRunner(mix_stderr=False)
+        with pytest.raises(SystemExit), runner.isolation() as (_, err):
+            config.run_namespace_reloads('reload', self.namespaces, reload_func, parallel=True)
+        assert done == ['']
+        assert "Skipping the ASIC namespaces" in err.getvalue().decode()
+
+    def test_serial_reload_raises(self):
+        def reload_func(reload):
+            raise config.NamespaceReloadError("failed")
+
+        with pytest.raises(config.NamespaceReloadError):
+            config.run_namespace_reloads('reload', self.namespaces, reload_func)
+
+
 class TestConfigCbf(object):
     @classmethod
     def setup_class(cls):
@@ -1666,16 +1783,16 @@ class TestConfigQos(object):
         import config.main
         importlib.reload(config.main)
 
-    def _keys(args, kwargs):
+    def _keys(*args, **kwargs):
         if not TestConfigQos._keys_counter:
-            return []
+            return iter([])
         TestConfigQos._keys_counter-=1
-        return ["BUFFER_POOL_TABLE:egress_lossy_pool"]
+        return iter(["BUFFER_POOL_TABLE:egress_lossy_pool"])
 
     def test_qos_wait_until_clear_empty(self):
         from config.main import _wait_until_clear
 
-        with mock.patch('swsscommon.swsscommon.SonicV2Connector.keys',  side_effect=TestConfigQos._keys):
+        with mock.patch('utilities_common.bulk_db.scan_keys',  side_effect=TestConfigQos._keys):
             TestConfigQos._keys_counter = 1
             empty = _wait_until_clear(["BUFFER_POOL_TABLE:*"], 0.5,2)
         assert empty
@@ -1683,13 +1800,13 @@ class TestConfigQos(object):
     def test_qos_wait_until_clear_not_empty(self):
         from config.main import _wait_until_clear
 
-        with mock.patch('swsscommon.swsscommon.SonicV2Connector.keys', side_effect=TestConfigQos._keys):
+        with mock.patch('utilities_common.bulk_db.scan_keys', side_effect=TestConfigQos._keys):
             TestConfigQos._keys_counter = 10
             empty = _wait_until_clear(["BUFFER_POOL_TABLE:*"], 0.5,2)
         assert not empty
 
     @patch('click.echo')
-    @patch('swsscommon.swsscommon.SonicV2Connector.keys')
+    @patch('utilities_common.bulk_db.scan_keys')
     def test_qos_wait_until_clear_no_timeout(self, mock_keys, mock_echo):
         from config.main import _wait_until_clear
         assert _wait_until_clear(["BUFFER_POOL_TABLE:*"], 0.5, 0)
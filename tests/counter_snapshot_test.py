@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+from utilities_common import counter_snapshot
+from utilities_common.counter_snapshot import NA, Snapshot, SnapshotError, load_snapshot, write_snapshot
+
+
+class TestCounterSnapshot(object):
+    def test_write_load(self, tmp_path):
+        path = str(tmp_path / 'counters.snapshot')
+        rows = [
+            ('Ethernet0:0', [1, 2, 3]),
+            ('Ethernet0:1', [None, 0, NA - 1]),
+            ('Ethernet4:0', [4, 'N/A', 6]),
+        ]
+        write_snapshot(path, '2026-01-01T00:00:00', ['pkts', 'bytes', 'drops'], rows)
+        assert not os.path.exists(path + '.tmp')
+
+        with load_snapshot(path) as snapshot:
+            assert snapshot.time == '2026-01-01T00:00:00'
+            assert snapshot.columns == ['pkts', 'bytes', 'drops']
+            assert snapshot.rows == ['Ethernet0:0', 'Ethernet0:1', 'Ethernet4:0']
+            assert 'Ethernet4:0' in snapshot
+            assert 'Ethernet8:0' not in snapshot
+            assert snapshot.row('Ethernet0:0') == {'pkts': 1, 'bytes': 2, 'drops': 3}
+            assert snapshot.row('Ethernet0:1') == {'pkts': None, 'bytes': 0, 'drops': NA - 1}
+            assert snapshot.row('Ethernet8:0') is None
+            assert snapshot.get('Ethernet4:0', 'bytes') is None
+            assert snapshot.get('Ethernet4:0', 'drops') == 6
+
+    def test_columnar_layout(self, tmp_path):
+        path = str(tmp_path / 'counters.snapshot')
+        write_snapshot(path, None, ['a', 'b'], [('x', [1, 2]), ('y', [3, 4])])
+        with open(path, 'rb') as f:
+            data = f.read()
+        assert len(data) % counter_snapshot.VALUE_SIZE == 0
+        values = [int.from_bytes(data[offset:offset + 8], 'little') for offset in range(len(data) - 32, len(data), 8)]
+        assert values == [1, 3, 2, 4]
+
+    def test_empty(self, tmp_path):
+        path = str(tmp_path / 'counters.snapshot')
+        write_snapshot(path, None, ['a'], [])
+        with load_snapshot(path) as snapshot:
+            assert snapshot.rows == []
+            assert snapshot.row('x') is None
+
+    def test_missing(self, tmp_path):
+        assert load_snapshot(str(tmp_path / 'counters.snapshot')) is None
+
+    def test_invalid(self, tmp_path):
+        path = tmp_path / 'counters.snapshot'
+        path.write_bytes(b'')
+        with pytest.raises(SnapshotError):
+            Snapshot(str(path))
+        path.write_text('{"time": "2026-01-01T00:00:00"}')
+        with pytest.raises(SnapshotError):
+            Snapshot(str(path))
+
+        write_snapshot(str(path), None, ['a'], [('x', [1])])
+        path.write_bytes(path.read_bytes()[:-1])
+        with pytest.raises(SnapshotError):
+            Snapshot(str(path))
@@ -0,0 +1,58 @@
+from unittest import mock
+
+from .mock_tables import dbconnector
+from utilities_common import db_waiter
+
+
+class TestDbWaiter(object):
+    def setup_method(self):
+        self.db = dbconnector.SonicV2Connector()
+        self.db.connect(self.db.COUNTERS_DB)
+
+    def test_first_key(self):
+        assert db_waiter.first_key(self.db, self.db.COUNTERS_DB, 'COUNTERS_PORT_NAME_MAP') == 'COUNTERS_PORT_NAME_MAP'
+        assert db_waiter.first_key(self.db, self.db.COUNTERS_DB, 'NO_SUCH_TABLE:*') is None
+
+    def test_wait_until_clear_empty(self):
+        on_pending = mock.MagicMock()
+        assert db_waiter.wait_until_clear(self.db, self.db.COUNTERS_DB, ['NO_SUCH_TABLE:*'], 1,
+                                          on_pending=on_pending)
+        on_pending.assert_not_called()
+
+    def test_wait_until_clear_timeout(self):
+        on_pending = mock.MagicMock()
+        assert not db_waiter.wait_until_clear(self.db, self.db.COUNTERS_DB,
+                                              ['NO_SUCH_TABLE:*', 'COUNTERS_PORT_NAME_MAP'], 0.2,
+                                              interval=0.1, on_pending=on_pending)
+        on_pending.assert_called_with('COUNTERS_PORT_NAME_MAP', 'COUNTERS_PORT_NAME_MAP')
+
+    def test_wait_until_clear_on_notification(self):
+        pubsub = mock.MagicMock()
+        # A keyspace notification is received on the first wait
+        pubsub.get_message.side_effect = [{'type': 'pmessage', 'data': 'del'}, None]
+        self.db.get_redis_client(self.db.COUNTERS_DB).pubsub = mock.MagicMock(return_value=pubsub)
+        with mock.patch('utilities_common.bulk_db.scan_keys',
+                        side_effect=[iter(['BUFFER_POOL_TABLE:pool']), iter([])]), \
+                mock.patch('time.sleep') as mock_sleep:
+            assert db_waiter.wait_until_clear(self.db, self.db.COUNTERS_DB, ['BUFFER_POOL_TABLE:*'], 10,
+                                              interval=5)
+        pubsub.psubscribe.assert_called_once_with('__keyspace@2__:BUFFER_POOL_TABLE:*')
+        pubsub.get_message.assert_called_with(ignore_subscribe_messages=True, timeout=0)
+        mock_sleep.assert_not_called()
+        pubsub.punsubscribe.assert_called_once()
+
+    def test_wait_until_clear_without_client(self):
+        with mock.patch('utilities_common.bulk_db.get_pipeline_client', return_value=None):
+            assert db_waiter.wait_until_clear(self.db, self.db.COUNTERS_DB, ['NO_SUCH_TABLE:*'], 1)
+            assert not db_waiter.wait_until_clear(self.db, self.db.COUNTERS_DB, ['COUNTERS_PORT_NAME_MAP'], 0.1,
+                                                  interval=0.05)
+
+    def test_wait_until(self):
+        condition = mock.MagicMock(side_effect=[False, False, True])
+        with mock.patch('time.sleep') as mock_sleep:
+            assert db_waiter.wait_until(condition, 10, interval=1)
+        assert condition.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    def test_wait_until_timeout(self):
+        assert not db_waiter.wait_until(lambda: False, 0.1, interval=0.05)
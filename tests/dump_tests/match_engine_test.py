@@ -2,10 +2,11 @@ import os
 import sys
 import unittest
 import pytest
-from dump.match_infra import MatchEngine, EXCEP_DICT, MatchRequest, MatchRequestOptimizer, ConnectionPool, CONN
+from dump.match_infra import MatchEngine, EXCEP_DICT, MatchRequest, MatchRequestOptimizer, ConnectionPool, CONN, \
+    RedisSource
 from utilities_common.constants import DEFAULT_NAMESPACE
 from dump.helper import populate_mock
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from deepdiff import DeepDiff
 from importlib import reload
 
@@ -203,6 +204,21 @@ class TestMatchEngine:
         assert "1.1.1.1" == ret["return_values"]["VXLAN_TUNNEL_TABLE|EVPN_25.25.25.26"]["src_ip"]
         assert "1.1.1.1" == ret["return_values"]["VXLAN_TUNNEL_TABLE|EVPN_25.25.25.27"]["src_ip"]
 
+    def test_keys_read_in_bulk(self, match_engine):
+        req = MatchRequest(db="STATE_DB", table="VXLAN_TUNNEL_TABLE", key_pattern="EVPN_25.25.25.2*",
+                           field="operstatus", value="down", return_fields=["src_ip"])
+        with patch.object(RedisSource, "hget", side_effect=AssertionError("hget called per key")), \
+                patch.object(RedisSource, "get", side_effect=AssertionError("get called per key")):
+            ret = match_engine.fetch(req)
+            assert ret["error"] == ""
+            assert len(ret["keys"]) == 3
+            assert "1.1.1.1" == ret["return_values"]["VXLAN_TUNNEL_TABLE|EVPN_25.25.25.27"]["src_ip"]
+
+            req = MatchRequest(db="CONFIG_DB", table="SFLOW", key_pattern="global", just_keys=False)
+            ret = match_engine.fetch(req)
+            assert ret["error"] == ""
+            assert ret["keys"] == [{"SFLOW|global": {"admin_state": "up", "polling_interval": "0"}}]
+
     def test_just_keys_false(self, match_engine):
         req = MatchRequest(db="CONFIG_DB", table="SFLOW", key_pattern="global", just_keys=False)
         ret = match_engine.fetch(req)
@@ -519,6 +519,17 @@ class TestFdbshow():
         assert return_code == 1
         assert "Failed to get Vlan id for bvid oid:0x260000000007c7" in output
 
+    def test_show_mac_address_skips_unresolved_bvid(self):
+        # The address filter is applied on the FDB key, so the entries
+        # with an unresolvable bvid are never looked up
+        self.set_mock_variant("5")
+
+        return_code, result = get_result_and_return_code(['fdbshow', '-a', '11:22:33:44:55:66'])
+        print("return_code: {}".format(return_code))
+        print("result = {}".format(result))
+        assert return_code == 0
+        assert result == show_mac__port_vlan_output
+
     def test_show_mac_invalid_namespace(self):
         self.set_mock_variant("1")
 
@@ -72,27 +72,10 @@ DB_HANDLE = "config_db"
 def debug_print(msg):
     print(msg)
 
-# Mimics os.system call for `sonic-cfggen -d --print-data` output
-def subprocess_Popen_cfggen(cmd, *args, **kwargs):
-    global running_config
 
-    stdout = kwargs.get('stdout', None)
-
-    if stdout is None:
-        output = json.dumps(running_config, indent=4)
-    elif isinstance(stdout, int) and stdout == -1:
-        output = json.dumps(running_config, indent=4)
-    else:
-        raise ValueError("stdout must be set to subprocess.PIPE or omitted for capturing output")
-
-    class MockPopen:
-        def __init__(self):
-            self.returncode = 0
-
-        def communicate(self):
-            return output.encode(), "".encode()
-
-    return MockPopen()
+# Mimics get_config_db_as_json, which reads the running config from CONFIG_DB
+def get_running_config(scope=None):
+    return copy.deepcopy(running_config)
 
 
 # mimics config_db.set_entry
@@ -222,14 +205,14 @@ def vlan_validate(old_cfg, new_cfg, keys):
 
 class TestChangeApplier(unittest.TestCase):
 
-    @patch("generic_config_updater.gu_common.subprocess.Popen")
+    @patch("generic_config_updater.change_applier.get_config_db_as_json")
     @patch("generic_config_updater.change_applier.get_config_db")
     @patch("generic_config_updater.change_applier.set_config")
-    def test_change_apply(self, mock_set, mock_db, mock_subprocess_Popen):
+    def test_change_apply(self, mock_set, mock_db, mock_get_running_config):
         global read_data, running_config, json_changes, json_change_index
         global start_running_config
 
-        mock_subprocess_Popen.side_effect = subprocess_Popen_cfggen
+        mock_get_running_config.side_effect = get_running_config
         mock_db.return_value = DB_HANDLE
         mock_set.side_effect = set_entry
 
@@ -281,6 +264,32 @@ class TestChangeApplier(unittest.TestCase):
 
         debug_print("all good for applier")
 
+    @patch.object(generic_config_updater.change_applier.ChangeApplier, "updater_conf",
+                  {"tables": {}, "services": {}})
+    @patch("generic_config_updater.change_applier.get_config_db_as_json")
+    @patch("generic_config_updater.change_applier.get_config_db")
+    @patch("generic_config_updater.change_applier.set_config")
+    def test_change_apply__reuses_verified_config(self, mock_set, mock_db, mock_get_running_config):
+        config = {"VLAN": {"Vlan1000": {"vlanid": "1000"}}}
+        mock_get_running_config.side_effect = lambda scope: copy.deepcopy(config)
+        change = Mock()
+        change.apply.side_effect = lambda data: data
+
+        applier = generic_config_updater.change_applier.ChangeApplier()
+
+        # One initial read, then only the verification read per change
+        assert applier.apply(change) == 0
+        assert applier.apply(change) == 0
+        assert mock_get_running_config.call_count == 3
+
+        # A failed verification drops the cached config
+        config["VLAN"]["Vlan1000"]["vlanid"] = "1001"
+        assert applier.apply(change) == -1
+        assert mock_get_running_config.call_count == 4
+        assert applier.apply(change) == 0
+        assert mock_get_running_config.call_count == 6
+        mock_set.assert_not_called()
+
 
 class TestDryRunChangeApplier(unittest.TestCase):
     def test_apply__calls_apply_change_to_config_db(self):
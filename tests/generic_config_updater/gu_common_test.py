@@ -1,7 +1,10 @@
 import copy
 import json
 import jsonpatch
+import os
 import sonic_yang
+import tempfile
+import threading
 import unittest
 import mock
 
@@ -11,17 +14,27 @@ from .gutest_helpers import create_side_effect_dict, Files
 import generic_config_updater.gu_common as gu_common
 
 class TestDryRunConfigWrapper(unittest.TestCase):
-    @patch('generic_config_updater.gu_common.subprocess.Popen')
-    def test_get_config_db_as_json(self, mock_popen):
+    @patch('generic_config_updater.gu_common.ConfigDBPipeConnector')
+    def test_get_config_db_as_json(self, mock_config_db_connector):
         config_wrapper = gu_common.DryRunConfigWrapper()
-        mock_proc = MagicMock()
-        mock_proc.communicate = MagicMock(
-            return_value=('{"PORT": {}, "bgpraw": ""}', None))
-        mock_proc.returncode = 0
-        mock_popen.return_value = mock_proc
+        mock_config_db = MagicMock()
+        mock_config_db.get_config.return_value = {
+            "PORT": {"Ethernet0": {"alias": "etp1"}},
+            "VLAN_MEMBER": {("Vlan1000", "Ethernet0"): {"tagging_mode": "untagged"}},
+            "bgpraw": ""}
+        mock_config_db.serialize_key.side_effect = lambda key: "|".join(key) if isinstance(key, tuple) else key
+        mock_config_db_connector.return_value = mock_config_db
         actual = config_wrapper.get_config_db_as_json()
-        expected = {"PORT": {}}
+        expected = {"PORT": {"Ethernet0": {"alias": "etp1"}},
+                    "VLAN_MEMBER": {"Vlan1000|Ethernet0": {"tagging_mode": "untagged"}}}
         self.assertDictEqual(actual, expected)
+        mock_config_db_connector.assert_called_once_with(use_unix_socket_path=True, namespace="")
+
+    @patch('generic_config_updater.gu_common.ConfigDBPipeConnector')
+    def test_get_config_db_as_json__read_failure(self, mock_config_db_connector):
+        mock_config_db_connector.return_value.get_config.side_effect = Exception("connection refused")
+        with self.assertRaises(gu_common.GenericConfigUpdaterError):
+            gu_common.get_config_db_as_json("asic0")
 
     def test_get_config_db_as_json__returns_imitated_config_db(self):
         # Arrange
@@ -494,6 +507,97 @@ class TestConfigWrapper(unittest.TestCase):
         check(sy1, config_wrapper.sonic_yang_with_loaded_models)
         check(sy2, config_wrapper.sonic_yang_with_loaded_models)
 
+
+class TestYangModelCache(unittest.TestCase):
+    def test_get_yang_dir_hash__changes_with_yang_models_only(self):
+        with tempfile.TemporaryDirectory() as yang_dir:
+            with open(os.path.join(yang_dir, "sonic-port.yang"), "w") as fh:
+                fh.write("module sonic-port {}")
+            initial_hash = gu_common.get_yang_dir_hash(yang_dir)
+
+            with open(os.path.join(yang_dir, "README"), "w") as fh:
+                fh.write("not a yang model")
+            self.assertEqual(initial_hash, gu_common.get_yang_dir_hash(yang_dir))
+
+            with open(os.path.join(yang_dir, "sonic-port.yang"), "w") as fh:
+                fh.write("module sonic-port { }")
+            self.assertNotEqual(initial_hash, gu_common.get_yang_dir_hash(yang_dir))
+
+    def test_get_yang_table_references(self):
+        sy = Mock()
+        sy.confDbYangMap = {
+            "sonic-types": {"@name": "sonic-types"},
+            "PORT": {"container": {"@name": "PORT"}, "yangModule": {"@name": "sonic-port"}},
+            "VLAN": {"container": {"@name": "VLAN"}, "yangModule": {"@name": "sonic-vlan"}},
+            "VLAN_MEMBER": {
+                "container": {"@name": "VLAN_MEMBER", "list": {"uses": {"@name": "vlan:vlan-member-keys"}}},
+                "yangModule": {"@name": "sonic-vlan"}},
+        }
+        sy.preProcessedYang = {"grouping": {"sonic-vlan": {"vlan-member-keys": [
+            {"@name": "name", "type": {"@name": "leafref",
+                                       "path": {"@value": "/vlan:sonic-vlan/vlan:VLAN/vlan:VLAN_LIST/vlan:name"}}},
+            {"@name": "port", "type": {"@name": "leafref",
+                                       "path": {"@value": "/port:sonic-port/port:PORT/port:PORT_LIST/port:name"}}}]}}}
+        sy._findYangModuleFromPrefix.return_value = "sonic-vlan"
+
+        references = gu_common.get_yang_table_references(sy)
+
+        self.assertDictEqual({"PORT": set(), "VLAN": set(), "VLAN_MEMBER": {"PORT", "VLAN"}}, references)
+
+    def test_get_tables_to_validate(self):
+        config_wrapper = gu_common.ConfigWrapper()
+        config_wrapper.sonic_yang_with_loaded_models = Mock()
+        config_wrapper.yang_dir_hash = "any_hash"
+        references = {
+            "PORT": set(),
+            "VLAN": set(),
+            "VLAN_MEMBER": {"VLAN", "PORT"},
+            "VLAN_INTERFACE": {"VLAN"},
+            "ACL_TABLE": {"PORT"},
+            "ACL_RULE": {"ACL_TABLE"},
+            "LOOPBACK_INTERFACE": set(),
+        }
+        with patch.dict(gu_common._yang_table_references_cache, {"any_hash": references}):
+            self.assertSetEqual({"VLAN", "VLAN_MEMBER", "VLAN_INTERFACE", "PORT"},
+                                config_wrapper.get_tables_to_validate(["VLAN"]))
+            self.assertSetEqual({"ACL_TABLE", "ACL_RULE", "PORT"},
+                                config_wrapper.get_tables_to_validate(["ACL_TABLE"]))
+            self.assertSetEqual({"LOOPBACK_INTERFACE"},
+                                config_wrapper.get_tables_to_validate(["LOOPBACK_INTERFACE"]))
+
+    @patch('generic_config_updater.gu_common.get_yang_dir_hash', MagicMock(return_value="any_hash"))
+    @patch('generic_config_updater.gu_common.sonic_yang.SonicYang')
+    def test_create_sonic_yang_with_loaded_models__models_loaded_once_per_process(self, mock_sonic_yang):
+        with patch.dict(gu_common._loaded_sonic_yang_cache, {}, clear=True):
+            gu_common.ConfigWrapper().create_sonic_yang_with_loaded_models()
+            gu_common.ConfigWrapper().create_sonic_yang_with_loaded_models()
+            gu_common.PatchWrapper().config_wrapper.create_sonic_yang_with_loaded_models()
+
+        mock_sonic_yang.assert_called_once()
+        mock_sonic_yang.return_value.loadYangModel.assert_called_once()
+
+    @patch('generic_config_updater.gu_common.get_yang_dir_hash', MagicMock(return_value="any_hash"))
+    @patch('generic_config_updater.gu_common.sonic_yang.SonicYang')
+    def test_create_sonic_yang_with_loaded_models__models_loaded_once_per_thread(self, mock_sonic_yang):
+        mock_sonic_yang.side_effect = lambda *args, **kwargs: MagicMock()
+        loaded = []
+
+        def load_models():
+            config_wrapper = gu_common.ConfigWrapper()
+            config_wrapper.create_sonic_yang_with_loaded_models()
+            loaded.append(config_wrapper.sonic_yang_with_loaded_models)
+
+        with patch.dict(gu_common._loaded_sonic_yang_cache, {}, clear=True):
+            load_models()
+            load_models()
+            thread = threading.Thread(target=load_models)
+            thread.start()
+            thread.join()
+
+        self.assertIs(loaded[0], loaded[1])
+        self.assertIsNot(loaded[0], loaded[2])
+        self.assertEqual(2, mock_sonic_yang.call_count)
+
 class TestPatchWrapper(unittest.TestCase):
     def setUp(self):
         self.config_wrapper_mock = gu_common.ConfigWrapper()
@@ -933,6 +933,29 @@ class TestFullConfigMoveValidator(unittest.TestCase):
         # Act and assert
         self.assertTrue(validator.validate(self.any_move, self.any_diff))
 
+    def test_validate__move_on_valid_config__validates_touched_tables_only(self):
+        # Arrange
+        current_config = {"VLAN": {"Vlan1000": {"vlanid": "1000"}}, "PORT": {"Ethernet0": {}}}
+        target_config = {"VLAN": {"Vlan1000": {"vlanid": "1000"}, "Vlan1001": {"vlanid": "1001"}},
+                         "PORT": {"Ethernet0": {}}}
+        diff = ps.Diff(current_config, target_config)
+        move = ps.JsonMove(diff, OperationType.ADD, ["VLAN", "Vlan1001"], ["VLAN", "Vlan1001"])
+        config_wrapper = Mock()
+        config_wrapper.validate_config_db_config.return_value = (True, None)
+        validator = ps.FullConfigMoveValidator(config_wrapper)
+
+        # Act and assert
+        # The current config is not known to be valid yet, full validation
+        self.assertTrue(validator.validate(move, diff))
+        config_wrapper.validate_config_db_config.assert_called_once_with(target_config)
+
+        # The config resulting from a validated move is a base for incremental validation
+        next_diff = diff.apply_move(move)
+        next_move = ps.JsonMove(next_diff, OperationType.REMOVE, ["PORT", "Ethernet0"])
+        self.assertTrue(validator.validate(next_move, next_diff))
+        config_wrapper.validate_config_db_config.assert_called_with({"VLAN": target_config["VLAN"], "PORT": {}},
+                                                                    touched_tables={"PORT"})
+
 class TestCreateOnlyMoveValidator(unittest.TestCase):
     def setUp(self):
         self.validator = ps.CreateOnlyMoveValidator(ps.PathAddressing())
@@ -3245,6 +3268,113 @@ class DeleteRefsMoveExtender(unittest.TestCase):
         moves_ops = [list(move.patch)[0] for move in moves]
         self.assertCountEqual(ex_ops, moves_ops)
 
+
+class TestDependencySorter(unittest.TestCase):
+    def setUp(self):
+        self.move_wrapper = ps.MoveWrapper([], [], [], [])
+        self.path_addressing = PathAddressing()
+
+    def test_sort__no_diff__no_moves(self):
+        # Arrange
+        sorter = ps.DependencySorter(self.move_wrapper, self.path_addressing)
+        diff = ps.Diff({"A": {"k1": {}}}, {"A": {"k1": {}}})
+
+        # Act and Assert
+        self.assertListEqual([], sorter.sort(diff))
+
+    def test_sort__removed_keys__referencing_keys_removed_first(self):
+        # Arrange
+        current_config = {"A": {"k1": {"ref": "k2"}}, "B": {"k2": {}, "k3": {}}}
+        target_config = {"B": {"k3": {}}}
+        self.set_ref_paths({"/A/k1": [], "/B/k2": ["/A/k1/ref"]}, current_config)
+        sorter = ps.DependencySorter(self.move_wrapper, self.path_addressing)
+
+        # Act
+        moves = sorter.sort(ps.Diff(current_config, target_config))
+
+        # Assert
+        self.verify_moves([{"op": "remove", "path": "/A"},
+                           {"op": "remove", "path": "/B/k2"}], moves)
+
+    def test_sort__added_keys__referenced_keys_added_first(self):
+        # Arrange
+        current_config = {"B": {"k3": {}}}
+        target_config = {"A": {"k1": {"ref": "k2"}}, "B": {"k2": {}, "k3": {}}}
+        self.set_ref_paths({"/A/k1": [], "/B/k2": ["/A/k1/ref"]}, target_config)
+        sorter = ps.DependencySorter(self.move_wrapper, self.path_addressing)
+
+        # Act
+        moves = sorter.sort(ps.Diff(current_config, target_config))
+
+        # Assert
+        self.verify_moves([{"op": "add", "path": "/B/k2", "value": {}},
+                           {"op": "add", "path": "/A", "value": {"k1": {"ref": "k2"}}}], moves)
+
+    def test_sort__replaced_key__ordered_between_removed_and_added_keys(self):
+        # Arrange
+        current_config = {"A": {"k1": {"ref": "k2"}}, "B": {"k2": {}}}
+        target_config = {"A": {"k1": {"ref": "k3"}}, "B": {"k3": {}}}
+        self.path_addressing.find_ref_paths_many = MagicMock(
+            side_effect=lambda paths, config: {path: ["/A/k1/ref"] for path in paths})
+        sorter = ps.DependencySorter(self.move_wrapper, self.path_addressing)
+
+        # Act
+        moves = sorter.sort(ps.Diff(current_config, target_config))
+
+        # Assert
+        self.verify_moves([{"op": "add", "path": "/B/k3", "value": {}},
+                           {"op": "replace", "path": "/A/k1", "value": {"ref": "k3"}},
+                           {"op": "remove", "path": "/B/k2"}], moves)
+
+    def test_sort__invalid_move__remaining_diff_sorted_by_fallback(self):
+        # Arrange
+        current_config = {"A": {"k1": {"ref": "k2"}}, "B": {"k2": {}, "k3": {}}}
+        target_config = {"B": {"k3": {}}}
+        self.set_ref_paths({"/A/k1": [], "/B/k2": ["/A/k1/ref"]}, current_config)
+        validator = Mock()
+        validator.validate.side_effect = lambda move, diff: move.path != "/A"
+        self.move_wrapper.move_validators = [validator]
+        fallback_move = Mock()
+        fallback_sorter = Mock()
+        fallback_sorter.sort.side_effect = lambda diff: [fallback_move]
+        sorter = ps.DependencySorter(self.move_wrapper, self.path_addressing, fallback_sorter)
+
+        # Act
+        moves = sorter.sort(ps.Diff(current_config, target_config))
+
+        # Assert
+        self.assertListEqual([fallback_move], moves)
+        fallback_sorter.sort.assert_called_once_with(ps.Diff(current_config, target_config))
+
+    def test_sort__fallback_fails_on_remaining_diff__fallback_sorts_whole_diff(self):
+        # Arrange
+        current_config = {"A": {"k1": {}}, "B": {"k2": {}}}
+        target_config = {}
+        self.set_ref_paths({"/A/k1": [], "/B/k2": []}, current_config)
+        validator = Mock()
+        validator.validate.side_effect = lambda move, diff: move.path != "/B"
+        self.move_wrapper.move_validators = [validator]
+        fallback_moves = [Mock()]
+        fallback_sorter = Mock()
+        fallback_sorter.sort.side_effect = [None, fallback_moves]
+        sorter = ps.DependencySorter(self.move_wrapper, self.path_addressing, fallback_sorter)
+        diff = ps.Diff(current_config, target_config)
+
+        # Act
+        moves = sorter.sort(diff)
+
+        # Assert
+        self.assertIs(fallback_moves, moves)
+        self.assertEqual(diff, fallback_sorter.sort.call_args_list[1][0][0])
+
+    def set_ref_paths(self, ref_paths, config):
+        self.path_addressing.find_ref_paths_many = MagicMock(
+            side_effect=lambda paths, actual_config:
+                {path: ref_paths[path] for path in paths} if actual_config == config else {})
+
+    def verify_moves(self, expected_ops, moves):
+        self.assertListEqual(expected_ops, [list(move.patch)[0] for move in moves])
+
 class TestSortAlgorithmFactory(unittest.TestCase):
     def test_dfs_sorter(self):
         self.verify(ps.Algorithm.DFS, ps.DfsSorter)
@@ -3255,6 +3385,9 @@ class TestSortAlgorithmFactory(unittest.TestCase):
     def test_memoization_sorter(self):
         self.verify(ps.Algorithm.MEMOIZATION, ps.MemoizationSorter)
 
+    def test_dependency_sorter(self):
+        self.verify(ps.Algorithm.DEPENDENCY, ps.DependencySorter)
+
     def verify(self, algo, algo_class):
         # Arrange
         config_wrapper = ConfigWrapper()
@@ -3312,7 +3445,13 @@ class TestPatchSorter(unittest.TestCase):
             with self.subTest(name=test_case_name):
                 self.run_single_success_case(data[test_case_name], skip_exact_change_list_match)
 
-    def run_single_success_case(self, data, skip_exact_change_list_match):
+    def test_patch_sorter_success__dependency_sorter(self):
+        data = Files.PATCH_SORTER_TEST_SUCCESS
+        for test_case_name in data:
+            with self.subTest(name=test_case_name):
+                self.run_single_success_case(data[test_case_name], True, ps.Algorithm.DEPENDENCY)
+
+    def run_single_success_case(self, data, skip_exact_change_list_match, algorithm=ps.Algorithm.DFS):
         current_config = data["current_config"]
         patch = jsonpatch.JsonPatch(data["patch"])
         expected_changes = []
@@ -3321,7 +3460,7 @@ class TestPatchSorter(unittest.TestCase):
 
         sorter = self.create_patch_sorter(current_config)
 
-        actual_changes = sorter.sort(patch)
+        actual_changes = sorter.sort(patch, algorithm)
 
         if not skip_exact_change_list_match:
             self.assertEqual(expected_changes, actual_changes)
@@ -3388,6 +3527,21 @@ class TestPatchSorter(unittest.TestCase):
         # Assert
         self.assertEqual(expected, actual)
 
+    def test_sort__large_patch__dependency_sorter_used(self):
+        # Arrange
+        current_config = Files.CROPPED_CONFIG_DB_AS_JSON
+        patch = jsonpatch.JsonPatch([{"op": "add", "path": f"/VLAN/Vlan{vlan_id}", "value": {"vlanid": str(vlan_id)}}
+                                     for vlan_id in range(2, 2 + ps.PatchSorter.DEPENDENCY_SORT_MIN_OPERATIONS)])
+        sort_algorithm = Mock()
+        sort_algorithm.sort.return_value = []
+        patch_sorter = self.create_patch_sorter(current_config, sort_algorithm)
+
+        # Act
+        patch_sorter.sort(patch)
+
+        # Assert
+        patch_sorter.sort_algorithm_factory.create.assert_called_once_with(ps.Algorithm.DEPENDENCY)
+
     def create_patch_sorter(self, config=None, sort_algorithm=None):
         if config is None:
             config=Files.CROPPED_CONFIG_DB_AS_JSON
@@ -0,0 +1,61 @@
+import json
+from unittest import mock
+
+import utilities_common.cli as clicommon
+
+PORT_TABLE = {
+    'Ethernet0': {'alias': 'etp1'},
+    'Ethernet4': {'alias': 'etp2'},
+    'Ethernet1': {'alias': 'etp3'},
+    'Ethernet10': {'alias': 'etp4'},
+}
+
+
+def create_converter(port_table=PORT_TABLE):
+    db = mock.MagicMock()
+    db.cfgdb.get_table.return_value = port_table
+    return clicommon.InterfaceAliasConverter(db)
+
+
+class TestInterfaceAliasConverter(object):
+    def test_name_to_alias(self):
+        converter = create_converter()
+        assert converter.name_to_alias('Ethernet4') == 'etp2'
+        assert converter.name_to_alias('Ethernet4.10') == 'etp2.10'
+        assert converter.name_to_alias('Ethernet8') == 'Ethernet8'
+        assert converter.name_to_alias_map() == {name: port['alias'] for name, port in PORT_TABLE.items()}
+
+    def test_translate_names(self):
+        converter = create_converter()
+        assert converter.translate_names('Ethernet0 Ethernet4, Ethernet10 Ethernet1\n') == 'etp1 etp2, etp4 etp3\n'
+        assert converter.translate_names('  Ethernet1   up') == '  etp3   up'
+        # Only whole words are replaced
+        assert converter.translate_names('Ethernet100 xEthernet0 Ethernet0.10 Ethernet4,x') == \
+            'Ethernet100 xEthernet0 Ethernet0.10 Ethernet4,x'
+        assert create_converter({}).translate_names('Ethernet0') == 'Ethernet0'
+
+    def test_translate_json_interface_names(self):
+        converter = create_converter()
+        routes = {
+            '10.0.0.0/24': [{
+                'prefix': '10.0.0.0/24',
+                'nexthops': [
+                    {'ip': '10.0.0.1', 'interfaceName': 'Ethernet0'},
+                    {'ip': '10.0.0.5', 'interfaceName': 'Ethernet10.20'},
+                    {'ip': '10.0.0.9', 'interfaceName': 'PortChannel0001'},
+                    {'ip': '10.0.0.13', 'interfaceName': 'Ethernet1'},
+                ]
+            }]
+        }
+        text = json.dumps(routes, indent=2)
+        expected = json.loads(text)
+        nexthops = expected['10.0.0.0/24'][0]['nexthops']
+        for nexthop, alias in zip(nexthops, ['etp1', 'etp4.20', 'PortChannel0001', 'etp3']):
+            nexthop['interfaceName'] = alias
+
+        assert json.loads(''.join(converter.translate_json_interface_names([text]))) == expected
+        # Members split across chunks are translated
+        for size in (1, 7, 64):
+            chunks = [text[idx:idx + size] for idx in range(0, len(text), size)]
+            assert json.loads(''.join(converter.translate_json_interface_names(chunks))) == expected
+        assert ''.join(converter.translate_json_interface_names([])) == ''
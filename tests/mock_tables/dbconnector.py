@@ -94,7 +94,7 @@ class MockPubSub:
         print("Channel:", key, "accessed in namespace:", self.namespace)
         return self.channels[key]
 
-    def get_message(self):
+    def get_message(self, *args, **kwargs):
         return None
 
     def psubscribe(self, *args, **kwargs):
@@ -0,0 +1,46 @@
+import threading
+import time
+from unittest import mock
+
+from utilities_common import multi_asic as multi_asic_util
+
+
+class NsCollector(object):
+    def __init__(self, ns_list, max_workers):
+        self.multi_asic = mock.MagicMock()
+        self.multi_asic.db = None
+        self.multi_asic.max_workers = max_workers
+        self.multi_asic.get_ns_list_based_on_options.return_value = ns_list
+        self.threads = set()
+
+    @multi_asic_util.run_on_multi_asic_concurrently
+    def collect(self, delay):
+        self.threads.add(threading.current_thread().name)
+        # Make the first namespaces the slowest ones
+        time.sleep(delay * (3 - int(self.multi_asic.current_namespace[-1])))
+        return (self.multi_asic.current_namespace, self.db)
+
+
+@mock.patch('utilities_common.multi_asic.multi_asic.connect_config_db_for_ns', side_effect=lambda ns: 'cfg_' + ns)
+@mock.patch('utilities_common.multi_asic.multi_asic.connect_to_all_dbs_for_ns', side_effect=lambda ns: 'db_' + ns)
+class TestRunOnMultiAsicConcurrently(object):
+    def test_results_in_namespace_order(self, mock_dbs, mock_cfgdb):
+        collector = NsCollector(['asic0', 'asic1', 'asic2'], max_workers=3)
+        results = collector.collect(0.05)
+        assert results == [('asic0', 'db_asic0'), ('asic1', 'db_asic1'), ('asic2', 'db_asic2')]
+        # The instance is left connected to the last namespace
+        assert collector.db == 'db_asic2'
+        assert collector.config_db == 'cfg_asic2'
+        assert collector.multi_asic.current_namespace == 'asic2'
+        assert len(collector.threads) == 3
+
+    def test_workers_bounded(self, mock_dbs, mock_cfgdb):
+        collector = NsCollector(['asic0', 'asic1', 'asic2'], max_workers=2)
+        results = collector.collect(0)
+        assert [ns for ns, _ in results] == ['asic0', 'asic1', 'asic2']
+        assert len(collector.threads) <= 2
+
+    def test_single_namespace_runs_inline(self, mock_dbs, mock_cfgdb):
+        collector = NsCollector(['asic0'], max_workers=8)
+        assert collector.collect(0) == [('asic0', 'db_asic0')]
+        assert collector.threads == {threading.current_thread().name}
@@ -85,6 +85,71 @@ Ethernet4:3  operational                        2/2       100/100       100/100
 Ethernet8:4      stormed                        3/2       100/300       100/300              0/200              0/200
 """
 
+pfcwd_show_stats_empty_output = """\
+       QUEUE       STATUS    STORM DETECTED/RESTORED    TX OK/DROP    RX OK/DROP    TX LAST OK/DROP    RX LAST OK/DROP
+------------  -----------  -------------------------  ------------  ------------  -----------------  -----------------
+ Ethernet0:0          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet0:1          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet0:2          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet0:3      stormed                        1/0       100/300       100/300              0/200              0/200
+ Ethernet0:4          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet0:5          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet0:6          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet0:7          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet0:8          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet0:9          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet0:10          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet0:11          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet0:12          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet0:13          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet0:14          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet0:15          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet0:16          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet0:17          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet0:18          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet0:19          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet4:0          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet4:1          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet4:2          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet4:3  operational                        2/2       100/100       100/100                0/0                0/0
+ Ethernet4:4          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet4:5          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet4:6          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet4:7          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet4:8          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet4:9          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet4:10          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet4:11          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet4:12          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet4:13          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet4:14          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet4:15          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet4:16          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet4:17          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet4:18          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet4:19          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet8:0          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet8:1          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet8:2          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet8:3          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet8:4      stormed                        3/2       100/300       100/300              0/200              0/200
+ Ethernet8:5          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet8:6          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet8:7          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet8:8          N/A                        0/0           0/0           0/0                0/0                0/0
+ Ethernet8:9          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet8:10          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet8:11          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet8:12          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet8:13          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet8:14          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet8:15          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet8:16          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet8:17          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet8:18          N/A                        0/0           0/0           0/0                0/0                0/0
+Ethernet8:19          N/A                        0/0           0/0           0/0                0/0                0/0
+"""
+
 pfcwd_show_stats_single_queue_output="""\
       QUEUE    STATUS    STORM DETECTED/RESTORED    TX OK/DROP    RX OK/DROP    TX LAST OK/DROP    RX LAST OK/DROP
 -----------  --------  -------------------------  ------------  ------------  -----------------  -----------------
@@ -137,6 +202,10 @@ testData = {
                                       'rc_output': pfcwd_show_stats_output
                                       }
                                     ],
+             'pfcwd_show_stats_empty': [{'cmd': ['show', 'stats'],
+                                         'args': ['-e'],
+                                         'rc': 0,
+                                         'rc_output': pfcwd_show_stats_empty_output}],
              'pfcwd_show_stats_single_queue' :  [ {'cmd' : ['show', 'stats'],
                                                    'args': ['Ethernet0:3'],
                                                    'rc': 0,
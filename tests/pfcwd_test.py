@@ -8,6 +8,7 @@ from click.testing import CliRunner
 from utilities_common.db import Db
 
 from .pfcwd_input.pfcwd_test_vectors import *
+from .pfcwd_input.pfcwd_test_vectors import testData
 
 test_path = os.path.dirname(os.path.abspath(__file__))
 modules_path = os.path.dirname(test_path)
@@ -38,6 +39,9 @@ class TestPfcwd(object):
     def test_pfcwd_show_stats(self):
         self.executor(testData['pfcwd_show_stats'])
 
+    def test_pfcwd_show_stats_empty(self):
+        self.executor(testData['pfcwd_show_stats_empty'])
+
     def test_pfcwd_show_stats_single_queue(self):
         self.executor(testData['pfcwd_show_stats_single_queue'])
 
@@ -0,0 +1,71 @@
+import threading
+import time
+
+from utilities_common.port_runner import PortRunner, PortTimeoutError
+
+
+class TestPortRunner(object):
+    def test_run_in_order(self):
+        delays = {'Ethernet0': 0.2, 'Ethernet4': 0, 'Ethernet8': 0.1}
+        runner = PortRunner(3)
+
+        def func(port):
+            time.sleep(delays[port])
+            if port == 'Ethernet8':
+                raise ValueError(port)
+            return port.lower()
+
+        results = list(runner.run(func, delays))
+        assert [(port, result) for port, result, _ in results] == \
+            [('Ethernet0', 'ethernet0'), ('Ethernet4', 'ethernet4'), ('Ethernet8', None)]
+        assert results[0][2] is None and results[1][2] is None
+        assert isinstance(results[2][2], ValueError)
+
+    def test_timed_out_port_keeps_bus_busy(self):
+        release = threading.Event()
+        lock = threading.Lock()
+        active = []
+        concurrent = []
+
+        def func(port):
+            with lock:
+                active.append(port)
+                concurrent.append(list(active))
+            if port == 'Ethernet0':
+                release.wait(5)
+            with lock:
+                active.remove(port)
+            return port
+
+        timer = threading.Timer(0.7, release.set)
+        timer.start()
+        try:
+            runner = PortRunner(2, bus_limit=1, bus_of=lambda port: 0, timeout=0.5)
+            results = list(runner.run(func, ['Ethernet0', 'Ethernet4']))
+        finally:
+            timer.cancel()
+            release.set()
+        assert isinstance(results[0][2], PortTimeoutError)
+        assert results[1] == ('Ethernet4', 'Ethernet4', None)
+        # Ethernet4 was only started once the timed out access on its bus returned
+        assert concurrent == [['Ethernet0'], ['Ethernet4']]
+
+    def test_pending_port_times_out_on_hung_bus(self):
+        release = threading.Event()
+        called = []
+
+        def func(port):
+            called.append(port)
+            if port == 'Ethernet0':
+                release.wait(5)
+            return port
+
+        try:
+            runner = PortRunner(2, bus_limit=1, bus_of=lambda port: 0 if port != 'Ethernet8' else 1, timeout=0.2)
+            results = list(runner.run(func, ['Ethernet0', 'Ethernet4', 'Ethernet8']))
+        finally:
+            release.set()
+        assert isinstance(results[0][2], PortTimeoutError)
+        assert isinstance(results[1][2], PortTimeoutError)
+        assert results[2] == ('Ethernet8', 'Ethernet8', None)
+        assert 'Ethernet4' not in called
@@ -3,6 +3,8 @@ import logging
 
 import os
 import shutil
+import time
+from unittest import mock
 
 from click.testing import CliRunner
 
@@ -11,6 +13,7 @@ import show.main as show
 from .utils import get_result_and_return_code
 from .portstat_input import assert_show_output
 from utilities_common.cli import UserCache
+from utilities_common.portstat import Portstat
 
 test_path = os.path.dirname(os.path.abspath(__file__))
 modules_path = os.path.dirname(test_path)
@@ -711,6 +714,67 @@ class TestPortStat(object):
         os.system("cp /tmp/chassis_state_db.json {}"
                   .format(os.path.join(test_path, "mock_tables/chassis_state_db.json")))
 
+    def test_pull_linecard_counters_returns_on_publish(self):
+        portstat = Portstat(None, 'all', lc_pull_timeout=10)
+        portstat.db = mock.MagicMock()
+        portstat.db.keys.side_effect = [[], ['LINECARD_PORT_STAT_MARK_TABLE|LC1'],
+                                        ['LINECARD_PORT_STAT_MARK_TABLE|LC1', 'LINECARD_PORT_STAT_MARK_TABLE|LC2']]
+        client = mock.MagicMock()
+        with mock.patch('utilities_common.portstat.bulk_db.get_pipeline_client', return_value=client):
+            start = time.monotonic()
+            portstat.pull_linecard_counters(2)
+            assert time.monotonic() - start < 5
+        portstat.db.set.assert_called_once_with(portstat.db.CHASSIS_STATE_DB, "GET_LINECARD_COUNTER|pull",
+                                                "enable", "true")
+        pubsub = client.pubsub.return_value
+        pubsub.psubscribe.assert_called_once()
+        assert pubsub.get_message.call_count == 2
+        pubsub.punsubscribe.assert_called_once()
+
+    def test_pull_linecard_counters_waits_for_notification(self):
+        portstat = Portstat(None, 'all', lc_pull_timeout=0.3)
+        portstat.db = mock.MagicMock()
+        portstat.db.keys.return_value = ['LINECARD_PORT_STAT_MARK_TABLE|LC1']
+        client = mock.MagicMock()
+        # No linecard publishes: get_message times out
+        client.pubsub.return_value.get_message.side_effect = lambda **kwargs: time.sleep(kwargs['timeout'])
+        with mock.patch('utilities_common.portstat.bulk_db.get_pipeline_client', return_value=client):
+            portstat.pull_linecard_counters(2)
+        # The linecards are only counted before waiting and when the timeout expires
+        assert portstat.db.keys.call_count == 2
+
+    def test_collect_stat_unsupported_wred_counters(self):
+        portstat = Portstat(None, 'all')
+        portstat.db = mock.MagicMock()
+        portstat.db.get.return_value = 'false'
+        portstat.db.get_all.return_value = {'Ethernet0': 'oid:0x1'}
+        counters = {'SAI_PORT_STAT_GREEN_WRED_DROPPED_PACKETS': '5'}
+        with mock.patch.object(Portstat, 'is_gearbox_configured', return_value=False), \
+                mock.patch('utilities_common.portstat.bulk_db.hgetall_many', side_effect=[[{}], [counters]]):
+            cnstat_dict, _, wred_capable = Portstat.collect_stat.__wrapped__(portstat)
+        assert list(wred_capable.values()) == ['false'] * 4
+        # The WRED counters are read whether they are supported or not
+        assert cnstat_dict['Ethernet0']['wred_grn_drp_pkt'] == '5'
+        assert cnstat_dict['Ethernet0']['wred_ylw_drp_pkt'] == 'N/A'
+        assert cnstat_dict['Ethernet0']['wred_tot_drp_pkt'] == 'N/A'
+
+    def test_is_gearbox_configured_scanned_once(self):
+        portstat = Portstat(None, 'all')
+        portstat.db = mock.MagicMock()
+        with mock.patch('utilities_common.portstat.bulk_db.scan_keys', return_value=iter([])) as scan_keys:
+            assert not portstat.is_gearbox_configured()
+            assert not portstat.is_gearbox_configured()
+        scan_keys.assert_called_once()
+
+    def test_pull_linecard_counters_timeout(self):
+        portstat = Portstat(None, 'all', lc_pull_timeout=0.3)
+        portstat.db = mock.MagicMock()
+        portstat.db.keys.return_value = ['LINECARD_PORT_STAT_MARK_TABLE|LC1']
+        with mock.patch('utilities_common.portstat.bulk_db.get_pipeline_client', return_value=None):
+            start = time.monotonic()
+            portstat.pull_linecard_counters(2)
+            assert time.monotonic() - start >= 0.3
+
     def test_show_intf_counters_nonzero(self):
         runner = CliRunner()
         result = runner.invoke(
@@ -20,6 +20,9 @@ logger = logging.getLogger(__name__)
 sys.path.append("scripts")
 import route_check
 
+# Only the test cases with a scan interval run in incremental mode
+INCREMENTAL_TEST_NUMS = [num for num, data in TEST_DATA.items() if " -i " in data[ARGS]]
+
 current_test_data = None
 selector_returned = None
 subscribers_returned = {}
@@ -239,6 +242,49 @@ class TestRouteCheck(object):
         set_test_case_data(ct_data)
         self.run_test(ct_data)
 
+    @pytest.mark.parametrize("test_num", INCREMENTAL_TEST_NUMS)
+    def test_route_check_incremental(self, mock_dbs, test_num):
+        logger.debug("test_route_check_incremental: test_num={}".format(test_num))
+        self.init()
+        ct_data = copy.deepcopy(TEST_DATA[test_num])
+        ct_data[ARGS] += " --incremental"
+        set_test_case_data(ct_data)
+        self.run_test(ct_data)
+
+    def test_route_snapshot_updates(self, mock_dbs):
+        self.init()
+        ct_data = TEST_DATA['1']
+        set_test_case_data(ct_data)
+        init_db_conns(ct_data[NAMESPACE])
+        with patch('route_check.subprocess.check_output', return_value='{}'):
+            snapshot = route_check.RouteSnapshot(DEFAULTNS)
+            assert snapshot.get_misses() == (['10.10.196.12/31', '10.10.196.30/31'],
+                                             ['10.10.10.10/32', '10.10.196.24/32', '2603:10b0:503:df4::5d/128'])
+            adds, deletes = snapshot.wait_for_updates()
+            assert adds == ['10.10.196.12/31']
+            assert deletes == ['10.10.10.10/32']
+            assert snapshot.get_misses() == (['10.10.196.30/31'],
+                                             ['10.10.196.24/32', '2603:10b0:503:df4::5d/128'])
+
+            # No update since the last scan, nothing to rediff
+            with patch.object(snapshot, 'rediff') as rediff:
+                snapshot.refresh()
+            rediff.assert_not_called()
+
+            # FRR is checked on every scan, even without route update
+            with patch('route_check.check_frr_pending_routes', return_value=[]) as check_frr_pending_routes, \
+                    patch.object(snapshot, 'wait_for_updates', return_value=([], [])):
+                route_check.check_routes_for_namespace_incremental(snapshot)
+                route_check.check_routes_for_namespace_incremental(snapshot)
+            assert check_frr_pending_routes.call_count == 2
+
+            # A full resync rebuilds the same route sets from new subscribers
+            set_test_case_data(ct_data)
+            snapshot.resync_interval = 0
+            snapshot.refresh()
+            assert snapshot.get_misses() == (['10.10.196.30/31'],
+                                             ['10.10.196.24/32', '2603:10b0:503:df4::5d/128'])
+
     def run_test(self, ct_data):
         with patch('sys.argv', ct_data[ARGS].split()), \
             patch('sonic_py_common.multi_asic.get_namespace_list', return_value= ct_data[NAMESPACE]), \
@@ -286,6 +332,32 @@ class TestRouteCheck(object):
             assert ex_str == expect, "{} != {}".format(ex_str, expect)
         assert ex_raised, "Exception expected"
 
+    def test_prefix_set(self):
+        for prefix in ['10.10.196.12/31', '0.0.0.0/0', '2603:10b0:503:df4::5d/128', '::/0', 'fc00::/64']:
+            assert route_check.format_prefix(route_check.pack_prefix(prefix)) == prefix
+        assert route_check.pack_prefix('10.1.1.1') == route_check.pack_prefix('10.1.1.1/32')
+        assert route_check.pack_prefix('::a00:0/104') != route_check.pack_prefix('10.0.0.0/8')
+        # Host bits are kept
+        assert route_check.pack_prefix('10.0.0.1/24') != route_check.pack_prefix('10.0.0.0/24')
+        assert route_check.format_prefix(route_check.pack_prefix('10.0.0.1/24')) == '10.0.0.1/24'
+
+        # Invalid keys are skipped
+        assert route_check.checkout_appl_rt_entry('Vrf1:10.0.0.0/24') == (True, route_check.pack_prefix('10.0.0.0/24'))
+        assert route_check.checkout_appl_rt_entry('not-a-prefix') == (False, None)
+        assert route_check.checkout_rt_entry(route_check.ASIC_KEY_PREFIX + '{"dest":"10.0.0.0/33"}') == (False, None)
+
+        appl = route_check.PrefixSet(route_check.pack_prefix(p) for p in
+                                     ['10.0.0.0/24', '10.0.0.0/24', '10.0.1.0/24', '2000::/64'])
+        asic = route_check.PrefixSet(route_check.pack_prefix(p) for p in
+                                     ['10.0.0.0/24', '10.0.2.0/24', '2000::/64'])
+        assert len(appl) == 4
+        assert appl.count(route_check.pack_prefix('10.0.0.0/24')) == 2
+        assert route_check.diff_prefix_sets(appl, asic) == (['10.0.0.0/24', '10.0.1.0/24'], ['10.0.2.0/24'])
+
+        appl.remove(route_check.pack_prefix('10.0.0.0/24'))
+        appl.remove(route_check.pack_prefix('10.0.1.0/24'))
+        assert route_check.diff_prefix_sets(appl, asic) == ([], ['10.0.2.0/24'])
+
     def test_logging(self):
         # Test print_msg
         route_check.PRINT_MSG_LEN_MAX = 5
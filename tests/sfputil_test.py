@@ -1,5 +1,7 @@
 import sys
 import os
+import json
+import time
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
@@ -727,6 +729,46 @@ Ethernet0  N/A
         assert result.output == "Sfp.get_transceiver_dom_real_value() is currently not implemented for this platform\n"
         assert result.exit_code == ERROR_NOT_IMPLEMENTED
 
+    @patch('sfputil.main.platform_sfputil', MagicMock(logical=['Ethernet0', 'Ethernet4', 'Ethernet8', 'Ethernet12']))
+    @patch('sfputil.main.logical_port_name_to_physical_port_list',
+           MagicMock(side_effect=lambda port: [int(port[len('Ethernet'):]) // 4 + 1]))
+    @patch('sfputil.main.is_port_type_rj45', MagicMock(return_value=False))
+    @patch('sfputil.main.platform_chassis')
+    def test_show_eeprom_concurrent(self, mock_chassis):
+        def get_sfp(physical_port):
+            mock_sfp = MagicMock()
+            mock_sfp.get_eeprom_path.return_value = \
+                '/sys/bus/i2c/devices/i2c-{0}/{0}-0050/eeprom'.format(physical_port % 2)
+
+            def get_presence():
+                # Ports complete out of order, port 3 hangs
+                time.sleep({1: 0.3, 2: 0.1, 3: 10, 4: 0}[physical_port])
+                return physical_port != 2
+            mock_sfp.get_presence = MagicMock(side_effect=get_presence)
+            mock_sfp.get_transceiver_info.return_value = FLAT_MEMORY_MODULE_EEPROM_SFP_INFO_DICT
+            return mock_sfp
+        mock_chassis.get_sfp = MagicMock(side_effect=get_sfp)
+
+        runner = CliRunner()
+        result = runner.invoke(sfputil.cli.commands['show'].commands['eeprom'], ['--timeout', '1'])
+        assert result.exit_code == 0
+        eeprom = FLAT_MEMORY_MODULE_EEPROM[len('Ethernet16: SFP EEPROM detected\n'):]
+        assert result.output == \
+            'Ethernet0: SFP EEPROM detected\n' + eeprom + '\n' + \
+            'Ethernet4: SFP EEPROM not detected\n\n' + \
+            'Ethernet8: Timed out reading SFP EEPROM\n\n' + \
+            'Ethernet12: SFP EEPROM detected\n' + eeprom + '\n\n'
+
+    @patch('sfputil.main.platform_chassis')
+    def test_get_sfp_i2c_bus(self, mock_chassis):
+        mock_sfp = mock_chassis.get_sfp.return_value
+        mock_sfp.get_eeprom_path.return_value = '/sys/bus/i2c/devices/i2c-23/23-0050/eeprom'
+        assert sfputil.get_sfp_i2c_bus(1) == 23
+        mock_sfp.get_eeprom_path.return_value = '/dev/optoe1'
+        assert sfputil.get_sfp_i2c_bus(1) is None
+        mock_sfp.get_eeprom_path.side_effect = NotImplementedError
+        assert sfputil.get_sfp_i2c_bus(1) is None
+
     @patch('sfputil.main.platform_chassis')
     @patch('sfputil.main.platform_sfputil', MagicMock(is_logical_port=MagicMock(return_value=0)))
     def test_show_eeprom_hexdump_invalid_port(self, mock_chassis):
@@ -1219,6 +1261,119 @@ EEPROM hexdump for port Ethernet4
         status = sfputil.download_firmware("Ethernet0", "test.bin")
         assert status == 1
 
+    @patch('sfputil.main.platform_chassis')
+    @patch('sfputil.main.logical_port_to_physical_port_index', MagicMock(return_value=1))
+    @patch('sfputil.main.update_firmware_info_to_state_db', MagicMock())
+    def test_download_firmware_resume(self, mock_chassis, tmp_path):
+        firmware = bytes(range(256)) + bytes(44)
+        filepath = tmp_path / 'firmware.bin'
+        filepath.write_bytes(firmware)
+        mock_sfp = MagicMock()
+        mock_api = MagicMock()
+        mock_sfp.get_xcvr_api = MagicMock(return_value=mock_api)
+        mock_chassis.get_sfp = MagicMock(return_value=mock_sfp)
+        mock_api.get_module_fw_mgmt_feature.return_value = {'status': True, 'feature': (10, 64, True, False, 0)}
+        mock_api.cdb_start_firmware_download.return_value = 1
+        mock_api.cdb_firmware_download_complete.return_value = 1
+        written = {}
+
+        def block_write(fail_at):
+            def write(address, data):
+                if address == fail_at:
+                    return 0
+                written[address] = data
+                return 1
+            return write
+
+        checkpoint_dir = str(tmp_path / 'checkpoints')
+        checkpoint_path = os.path.join(checkpoint_dir, 'port1.json')
+        with patch('sfputil.main.FIRMWARE_CHECKPOINT_DIR', checkpoint_dir):
+            # The download fails at the third block, the acknowledged blocks are checkpointed
+            mock_api.cdb_lpl_block_write = MagicMock(side_effect=block_write(128))
+            with pytest.raises(SystemExit) as e:
+                sfputil.download_firmware("Ethernet0", str(filepath))
+            assert e.value.code == EXIT_FAIL
+            with open(checkpoint_path) as f:
+                assert json.load(f)['address'] == 128
+
+            # The download is resumed from the third block
+            mock_api.cdb_start_firmware_download.reset_mock()
+            mock_api.cdb_lpl_block_write = MagicMock(side_effect=block_write(None))
+            assert sfputil.download_firmware("Ethernet0", str(filepath), resume=True) == 1
+            mock_api.cdb_start_firmware_download.assert_not_called()
+            assert [call[0][0] for call in mock_api.cdb_lpl_block_write.call_args_list] == [128, 192, 256]
+            assert b''.join(written[address] for address in sorted(written)) == firmware[10:]
+            assert not os.path.exists(checkpoint_path)
+
+            # Without checkpoint, the download starts over
+            written.clear()
+            assert sfputil.download_firmware("Ethernet0", str(filepath), resume=True) == 1
+            mock_api.cdb_start_firmware_download.assert_called_once_with(10, firmware[:10], len(firmware))
+            assert sorted(written) == [0, 64, 128, 192, 256]
+
+            # The module rejects the resumed block, the download starts over
+            image = sfputil.FirmwareImage(str(filepath))
+            download = sfputil.FirmwareDownload("Ethernet0", image)
+            download.save_checkpoint(download.checkpoint_id(10, 64, True), 192)
+            image.close()
+            mock_api.cdb_start_firmware_download.reset_mock()
+            mock_api.cdb_lpl_block_write = MagicMock(side_effect=block_write(192))
+            with pytest.raises(SystemExit):
+                sfputil.download_firmware("Ethernet0", str(filepath), resume=True)
+            mock_api.cdb_start_firmware_download.assert_called_once()
+            assert [call[0][0] for call in mock_api.cdb_lpl_block_write.call_args_list] == [192, 0, 64, 128, 192]
+
+    @patch('sfputil.main.is_sfp_present', MagicMock(return_value=True))
+    @patch('sfputil.main.is_port_type_rj45', MagicMock(return_value=False))
+    @patch('sfputil.main.logical_port_to_physical_port_index',
+           MagicMock(side_effect=lambda port: int(port[len('Ethernet'):]) // 4 + 1))
+    @patch('sfputil.main.update_firmware_info_to_state_db', MagicMock())
+    @patch('sfputil.main.platform_chassis')
+    def test_firmware_download_multi_port(self, mock_chassis, tmp_path):
+        filepath = tmp_path / 'firmware.bin'
+        filepath.write_bytes(bytes(200))
+
+        def get_sfp(physical_port):
+            mock_sfp = MagicMock()
+            mock_sfp.get_eeprom_path.return_value = \
+                '/sys/bus/i2c/devices/i2c-{0}/{0}-0050/eeprom'.format(physical_port % 2)
+            mock_api = MagicMock()
+            mock_api.get_module_fw_mgmt_feature.return_value = {'status': True, 'feature': (0, 64, True, False, 0)}
+            mock_api.cdb_start_firmware_download.return_value = 1 if physical_port != 2 else 0
+            mock_api.cdb_lpl_block_write.return_value = 1
+            mock_api.cdb_firmware_download_complete.return_value = 1
+            mock_sfp.get_xcvr_api = MagicMock(return_value=mock_api)
+            mock_sfp.set_optoe_write_max = MagicMock(side_effect=NotImplementedError)
+            return mock_sfp
+        mock_chassis.get_sfp = MagicMock(side_effect=get_sfp)
+
+        runner = CliRunner()
+        with patch('sfputil.main.FIRMWARE_CHECKPOINT_DIR', str(tmp_path)):
+            result = runner.invoke(sfputil.cli.commands['firmware'].commands['download'],
+                                   ["Ethernet0,Ethernet4,Ethernet8", str(filepath)])
+        assert result.exit_code == EXIT_FAIL
+        lines = result.output.splitlines()
+        assert "Ethernet0: CDB: firmware download complete" in lines
+        assert "Ethernet4: CDB: Start firmware download failed - status 0" in lines
+        assert "Ethernet8: CDB: firmware download complete" in lines
+        assert lines[-1] == "Firmware download failed on Ethernet4"
+
+    @patch('sfputil.main.is_sfp_present', MagicMock(return_value=True))
+    @patch('sfputil.main.is_port_type_rj45', MagicMock(return_value=False))
+    @patch('sfputil.main.logical_port_to_physical_port_index',
+           MagicMock(side_effect=lambda port: int(port[len('Ethernet'):]) // 4 + 1))
+    @patch('sfputil.main.download_firmware_multi_port')
+    @pytest.mark.parametrize("port_names, error", [
+        ("Ethernet0,Ethernet0", "Error: Ethernet0 and Ethernet0 are on the same transceiver"),
+        ("Ethernet4,Ethernet0,Ethernet2", "Error: Ethernet0 and Ethernet2 are on the same transceiver"),
+    ])
+    def test_firmware_download_same_transceiver(self, mock_download, port_names, error):
+        runner = CliRunner()
+        result = runner.invoke(sfputil.cli.commands['firmware'].commands['download'], [port_names, "a.b"])
+        assert result.output == error + '\n'
+        assert result.exit_code == EXIT_FAIL
+        mock_download.assert_not_called()
+
     @patch('sfputil.main.platform_chassis')
     @patch('sfputil.main.logical_port_to_physical_port_index', MagicMock(return_value=1))
     def test_run_firmwre(self, mock_chassis):
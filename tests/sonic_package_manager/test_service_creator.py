@@ -3,6 +3,7 @@
 import os
 import sys
 import copy
+import json
 from unittest.mock import Mock, MagicMock, call, patch
 
 import pytest
@@ -12,8 +13,9 @@ from sonic_package_manager.manifest import Manifest
 from sonic_package_manager.metadata import Metadata
 from sonic_package_manager.package import Package
 from sonic_package_manager.service_creator.creator import *
-from sonic_package_manager.service_creator.creator import ETC_SYSTEMD_LOCATION
+from sonic_package_manager.service_creator.creator import ETC_SONIC_PATH, ETC_SYSTEMD_LOCATION
 from sonic_package_manager.service_creator.feature import FeatureRegistry
+from sonic_package_manager.service_creator.sonic_db import PersistentConfigDbConnector
 
 
 @pytest.fixture
@@ -235,6 +237,46 @@ def test_service_creator_multi_yang(sonic_fs, manifest, mock_config_mgmt, servic
     )
 
 
+def test_persistent_config_db_batch(sonic_fs):
+    filepath = os.path.join(ETC_SONIC_PATH, 'test_cfg.json')
+    sonic_fs.create_file(filepath, contents=json.dumps({
+        'TABLE_A': {'key_a': {'field_1': 'value_1'}},
+        'TABLE_B': {'key_b': {'field_1': 'value_1'}},
+    }))
+    conn = PersistentConfigDbConnector(filepath)
+
+    with patch.object(conn, '_write_config', wraps=conn._write_config) as write_config:
+        with conn.batch():
+            conn.mod_entry('TABLE_A', 'key_a', {'field_2': 'value_2'})
+            conn.set_entry('TABLE_B', 'key_b', None)
+            conn.mod_config({'TABLE_C': {'key_c': {'field_1': 'value_1'}}})
+            assert conn.get_entry('TABLE_A', 'key_a') == {'field_1': 'value_1', 'field_2': 'value_2'}
+            with open(filepath) as stream:
+                assert 'TABLE_B' in json.load(stream)
+
+        write_config.assert_called_once()
+
+    with open(filepath) as stream:
+        assert json.load(stream) == {
+            'TABLE_A': {'key_a': {'field_1': 'value_1', 'field_2': 'value_2'}},
+            'TABLE_C': {'key_c': {'field_1': 'value_1'}},
+        }
+    assert not [name for name in os.listdir(ETC_SONIC_PATH) if name.endswith('.tmp')]
+
+
+def test_persistent_config_db_batch_not_written_on_error(sonic_fs):
+    filepath = os.path.join(ETC_SONIC_PATH, 'test_cfg.json')
+    sonic_fs.create_file(filepath, contents=json.dumps({'TABLE_A': {'key_a': {'field_1': 'value_1'}}}))
+    conn = PersistentConfigDbConnector(filepath)
+
+    with pytest.raises(ValueError):
+        with conn.batch():
+            conn.set_entry('TABLE_A', 'key_a', None)
+            raise ValueError('failure')
+
+    assert conn.get_config() == {'TABLE_A': {'key_a': {'field_1': 'value_1'}}}
+
+
 def test_service_creator_autocli(sonic_fs, manifest, mock_cli_gen,
                                  mock_config_mgmt, service_creator):
     test_yang = 'TEST YANG'
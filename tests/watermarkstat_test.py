@@ -1,9 +1,11 @@
+import json
 import os
 import sys
 import pytest
 import show.main as show
 from click.testing import CliRunner
 from wm_input.wm_test_vectors import testData
+from .utils import get_result_and_return_code
 
 test_path = os.path.dirname(os.path.abspath(__file__))
 modules_path = os.path.dirname(test_path)
@@ -73,6 +75,23 @@ class TestWatermarkstat(object):
     def test_show_headroom_pool_persistent_wm(self):
         self.executor(testData['show_hdrm_pool_pwm'])
 
+    def test_pg_shared_wm_json(self):
+        return_code, result = get_result_and_return_code(['watermarkstat', '-t', 'pg_shared', '-j'])
+        assert return_code == 0
+        assert json.loads(result) == {
+            port: {"PG{}".format(idx): str(base + idx) for idx in range(8)}
+            for port, base in [("Ethernet0", 100), ("Ethernet4", 400), ("Ethernet8", 800)]
+        }
+
+    def test_buffer_pool_wm_json(self):
+        return_code, result = get_result_and_return_code(['watermarkstat', '-t', 'buffer_pool', '-j'])
+        assert return_code == 0
+        assert json.loads(result) == {
+            "egress_lossless_pool": "1000",
+            "egress_lossy_pool": "2000",
+            "ingress_lossless_pool": "3000"
+        }
+
     def executor(self, testcase):
         runner = CliRunner()
 
@@ -1,9 +1,11 @@
+import concurrent.futures
 import ipaddress
 import json
 import re
 import sys
 
 import click
+from click.globals import pop_context, push_context
 import utilities_common.cli as clicommon
 import utilities_common.multi_asic as multi_asic_util
 from natsort import natsorted
@@ -246,22 +248,66 @@ def run_bgp_show_command(vtysh_cmd, bgp_namespace=multi_asic.DEFAULT_NAMESPACE,
     # handle the the alias mode in the following code
     if output is not None:
         if clicommon.get_interface_naming_mode() == "alias" and re.search("show ip|ipv6 route", vtysh_cmd):
+            # Rewrite the interface names in the text, without decoding the whole routing table
             iface_alias_converter = clicommon.InterfaceAliasConverter()
-            route_info =json.loads(output)
-            for route, info in route_info.items():
-                for i in range(0, len(info)):
-                    if 'nexthops' in info[i]:
-                        for j in range(0, len(info[i]['nexthops'])):
-                            intf_name = ""
-                            if 'interfaceName' in info[i]['nexthops'][j]:
-                                intf_name  = info[i]['nexthops'][j]['interfaceName']
-                                alias = iface_alias_converter.name_to_alias(intf_name)
-                                if alias is not None:
-                                    info[i]['nexthops'][j]['interfaceName'] = alias 
-            output= json.dumps(route_info)
+            output = ''.join(iface_alias_converter.translate_json_interface_names([output]))
     return output
 
 
+def run_bgp_show_commands(vtysh_cmds, max_workers=constants.MULTI_ASIC_MAX_WORKERS):
+    """
+    Run vtysh show commands concurrently, so that collecting the output of
+    all the BGP instances takes as long as the slowest one.
+    :param vtysh_cmds: list of (vtysh command, namespace)
+    :return: list of the command outputs, in the same order
+    """
+    ctx = click.get_current_context(silent=True)
+
+    def run(vtysh_cmd_ns):
+        # Failures are reported through the click context of the CLI command
+        if ctx is not None:
+            push_context(ctx)
+        try:
+            return run_bgp_show_command(*vtysh_cmd_ns)
+        finally:
+            if ctx is not None:
+                pop_context()
+
+    if len(vtysh_cmds) <= 1 or max_workers <= 1:
+        return [run_bgp_show_command(*vtysh_cmd_ns) for vtysh_cmd_ns in vtysh_cmds]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(vtysh_cmds), max_workers)) as executor:
+        return list(executor.map(run, vtysh_cmds))
+
+
+def get_bgp_header_from_summary(summary):
+    """
+    Returns the BGP instance header fields, as displayed by 'show ip bgp json',
+    from the 'show ip bgp summary json' output of an address family
+    """
+    return {
+        'routerId': summary['routerId'],
+        'vrfId': summary['vrfId'],
+        'localAS': summary['as'],
+        'tableVersion': summary['tableVersion']
+    }
+
+
+def get_bgp_header_from_table(output):
+    """
+    Returns the BGP instance header fields from the 'show ip bgp json'
+    output, without decoding the routes which follow them.
+    """
+    routes = output.find('"routes"')
+    if routes != -1:
+        try:
+            # The header fields are printed first, the routes are replaced by an empty object
+            return json.loads(output[:routes] + '"routes": {}}')
+        except ValueError:
+            pass
+    return json.loads(output)
+
+
 def get_bgp_summary_from_all_bgp_instances(af, namespace, display, vrf):
 
     device = multi_asic_util.MultiAsic(display, namespace)
@@ -272,19 +318,33 @@ def get_bgp_summary_from_all_bgp_instances(af, namespace, display, vrf):
             vtysh_cmd += ' vrf {}'.format(vrf)
         vtysh_cmd += " summary json"
         key = 'ipv4Unicast'
+        vtysh_bgp_json_cmd = "show ip bgp"
+        if vrf is not None:
+            vtysh_bgp_json_cmd += " vrf {}".format(vrf)
+        vtysh_bgp_json_cmd += " json"
     else:
         vtysh_cmd = "show bgp"
         if vrf is not None:
             vtysh_cmd += ' vrf {}'.format(vrf)
         vtysh_cmd += " ipv6 summary json"
         key = 'ipv6Unicast'
+        vtysh_bgp_json_cmd = "show bgp"
+        if vrf is not None:
+            vtysh_bgp_json_cmd += " vrf {}".format(vrf)
+        vtysh_bgp_json_cmd += " ipv6 json"
 
     bgp_summary = {}
     cmd_output_json = {}
 
-    for ns in device.get_ns_list_based_on_options():
+    # The BGP instances of all the namespaces are queried concurrently
+    ns_list = device.get_ns_list_based_on_options()
+    cmd_outputs = run_bgp_show_commands([(vtysh_cmd, ns) for ns in ns_list])
+
+    # (namespace, output, has_bgp_neighbors) of every namespace, None when
+    # the output is the BGP instance header, still to be fetched
+    ns_outputs = []
+    for ns, cmd_output in zip(ns_list, cmd_outputs):
         has_bgp_neighbors = True
-        cmd_output = run_bgp_show_command(vtysh_cmd, ns)
         device.current_namespace = ns
         try:
             cmd_output_json = json.loads(cmd_output)
@@ -293,31 +353,43 @@ def get_bgp_summary_from_all_bgp_instances(af, namespace, display, vrf):
 
         # no bgp neighbors found so print basic device bgp info
         if key not in cmd_output_json:
-            has_bgp_neighbors = False
-        else:
-            # for multi asic devices or chassis linecards, the output of 'show ip bgp summary json'
-            # will have both internal and external bgp neighbors
-            # So, check if the current namespace has external bgp neighbors.
-            # If not, treat it as no bgp neighbors
-            if (device.get_display_option() == constants.DISPLAY_EXTERNAL and
+            ns_outputs.append((ns, None, False))
+            continue
+
+        # for multi asic devices or chassis linecards, the output of 'show ip bgp summary json'
+        # will have both internal and external bgp neighbors
+        # So, check if the current namespace has external bgp neighbors.
+        # If not, treat it as no bgp neighbors
+        if (device.get_display_option() == constants.DISPLAY_EXTERNAL and
                 (device_info.is_chassis() or multi_asic.is_multi_asic())):
-                external_peers_list_in_cfg_db = get_external_bgp_neighbors_dict(
-                    device.current_namespace).keys()
-                if not external_peers_list_in_cfg_db:
-                    has_bgp_neighbors = False
-
-        if not has_bgp_neighbors:
-            vtysh_bgp_json_cmd = "show ip bgp"
-            if vrf is not None:
-                vtysh_bgp_json_cmd += " vrf {}".format(vrf)
-            vtysh_bgp_json_cmd += " json"
-            no_neigh_cmd_output = run_bgp_show_command(vtysh_bgp_json_cmd, ns)
+            external_peers_list_in_cfg_db = get_external_bgp_neighbors_dict(
+                device.current_namespace).keys()
+            if not external_peers_list_in_cfg_db:
+                has_bgp_neighbors = False
+
+        if has_bgp_neighbors:
+            ns_outputs.append((ns, cmd_output_json[key], True))
+        else:
+            # The summary of the internal neighbors already has the header
+            # fields, no need to dump the BGP table for them
             try:
-                no_neigh_cmd_output_json = json.loads(no_neigh_cmd_output)
+                ns_outputs.append((ns, get_bgp_header_from_summary(cmd_output_json[key]), False))
+            except KeyError as e:
+                ctx.fail("{} missing in the bgp_summary".format(e.args[0]))
+
+    # The BGP instances without neighbors only have locally originated
+    # routes, their header is taken from the address family table
+    no_neigh_ns_list = [ns for ns, out_cmd, _ in ns_outputs if out_cmd is None]
+    no_neigh_cmd_outputs = dict(zip(no_neigh_ns_list, run_bgp_show_commands(
+        [(vtysh_bgp_json_cmd, ns) for ns in no_neigh_ns_list])))
+
+    for ns, out_cmd, has_bgp_neighbors in ns_outputs:
+        device.current_namespace = ns
+        if out_cmd is None:
+            try:
+                out_cmd = get_bgp_header_from_table(no_neigh_cmd_outputs[ns])
             except ValueError:
                 ctx.fail("bgp summary from bgp container not in json format")
-
-        out_cmd = cmd_output_json[key] if has_bgp_neighbors else no_neigh_cmd_output_json
         process_bgp_summary_json(bgp_summary, out_cmd, device, has_bgp_neighbors=has_bgp_neighbors)
 
     return bgp_summary
@@ -0,0 +1,153 @@
+"""
+Bulk redis read helpers.
+
+The CLI utilities traditionally read redis one field or one hash at a time,
+which costs one round-trip per call. The helpers below batch HGETALL/HGET
+requests through a redis pipeline so that reading N hashes costs
+ceil(N / batch_size) round-trips instead of N.
+
+The swsscommon DBConnector returned by SonicV2Connector.get_redis_client()
+does not expose pipelines, so a redis-py client bound to the same database
+instance is opened (and cached) when needed. If redis-py is not available
+the helpers fall back to one request per key through the SonicV2Connector.
+"""
+
+import os
+
+from swsscommon.swsscommon import SonicDBConfig
+
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_SCAN_COUNT = 1000
+
+# Cache of redis-py clients, keyed by (namespace, db_name)
+_pipeline_clients = {}
+
+
+def _open_pipeline_client(db, db_name):
+    try:
+        import redis
+    except ImportError:
+        return None
+
+    namespace = getattr(db, 'namespace', '') or ''
+    try:
+        db_id = SonicDBConfig.getDbId(db_name, namespace)
+        sock = SonicDBConfig.getDbSock(db_name, namespace)
+        if sock and os.path.exists(sock):
+            return redis.Redis(unix_socket_path=sock, db=db_id, decode_responses=True)
+        return redis.Redis(host=SonicDBConfig.getDbHostname(db_name, namespace),
+                           port=SonicDBConfig.getDbPort(db_name, namespace),
+                           db=db_id, decode_responses=True)
+    except Exception:
+        return None
+
+
+def get_pipeline_client(db, db_name):
+    """
+    Return a redis client supporting pipeline() for db_name, or None
+    if pipelining is not possible.
+
+    db is a connected SonicV2Connector.
+    """
+    client = db.get_redis_client(db_name)
+    if hasattr(client, 'pipeline'):
+        return client
+
+    cache_key = (getattr(db, 'namespace', '') or '', db_name)
+    if cache_key not in _pipeline_clients:
+        _pipeline_clients[cache_key] = _open_pipeline_client(db, db_name)
+    return _pipeline_clients[cache_key]
+
+
+def _run_batched(client, keys, queue_cmd, batch_size):
+    results = []
+    for start in range(0, len(keys), batch_size):
+        pipe = client.pipeline(transaction=False)
+        for key in keys[start:start + batch_size]:
+            queue_cmd(pipe, key)
+        results.extend(pipe.execute())
+    return results
+
+
+def hgetall_many(db, db_name, keys, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Read the hashes stored at keys.
+
+    Returns a list of dicts in the same order as keys; a missing key
+    yields an empty dict.
+    """
+    keys = list(keys)
+    client = get_pipeline_client(db, db_name)
+    if client is None:
+        return [db.get_all(db_name, key) or {} for key in keys]
+
+    results = _run_batched(client, keys, lambda pipe, key: pipe.hgetall(key), batch_size)
+    return [fvs or {} for fvs in results]
+
+
+def hget_many(db, db_name, keys, field, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Read a single field from each of the hashes stored at keys.
+
+    Returns a list of values in the same order as keys; a missing key or
+    field yields None.
+    """
+    keys = list(keys)
+    client = get_pipeline_client(db, db_name)
+    if client is None:
+        return [db.get(db_name, key, field) for key in keys]
+
+    return _run_batched(client, keys, lambda pipe, key: pipe.hget(key, field), batch_size)
+
+
+def hmget_many(db, db_name, keys, fields, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Read the same fields from each of the hashes stored at keys.
+
+    Returns a list of value lists in the same order as keys, each aligned
+    with fields; a missing key or field yields None.
+    """
+    keys = list(keys)
+    fields = list(fields)
+    client = get_pipeline_client(db, db_name)
+    if client is None:
+        results = []
+        for key in keys:
+            fvs = db.get_all(db_name, key) or {}
+            results.append([fvs.get(field) for field in fields])
+        return results
+
+    return _run_batched(client, keys, lambda pipe, key: pipe.hmget(key, fields), batch_size)
+
+
+def hmget(db, db_name, key, fields, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Read many fields of the hash stored at key.
+
+    Returns a list of values in the same order as fields; a missing key or
+    field yields None.
+    """
+    fields = list(fields)
+    client = get_pipeline_client(db, db_name)
+    if client is None:
+        return [db.get(db_name, key, field) for field in fields]
+
+    results = []
+    for start in range(0, len(fields), batch_size):
+        results.extend(client.hmget(key, fields[start:start + batch_size]))
+    return results
+
+
+def scan_keys(db, db_name, pattern, count=DEFAULT_SCAN_COUNT):
+    """
+    Iterate over the keys matching pattern using SCAN instead of the
+    blocking KEYS command.
+    """
+    client = get_pipeline_client(db, db_name)
+    if client is None or not hasattr(client, 'scan_iter'):
+        for key in db.keys(db_name, pattern) or []:
+            yield key
+        return
+
+    for key in client.scan_iter(match=pattern, count=count):
+        yield key
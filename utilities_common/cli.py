@@ -1,5 +1,6 @@
 import configparser
 import datetime
+import importlib
 import os
 import re
 import subprocess
@@ -17,6 +18,12 @@ from utilities_common.db import Db
 from utilities_common.general import load_db_config
 VLAN_SUB_INTERFACE_SEPARATOR = '.'
 
+# "interfaceName" member of a JSON document, the interface name is group 1
+INTERFACE_NAME_JSON_RE = re.compile(r'"interfaceName"\s*:\s*"([^"\\]*)"')
+# Longest text held back between chunks by translate_json_interface_names,
+# a member which doesn't fit in it can't hold an interface name
+INTERFACE_NAME_JSON_MAX_LEN = 256
+
 pass_db = click.make_pass_decorator(Db, ensure=True)
 
 
@@ -132,6 +139,8 @@ class InterfaceAliasConverter(object):
             self.config_db = db.cfgdb
             self.port_dict = self.config_db.get_table('PORT')
         self.alias_max_length = 0
+        self._name_to_alias_map = None
+        self._name_re = None
 
         if not self.port_dict:
             self.port_dict = {}
@@ -158,14 +167,68 @@ class InterfaceAliasConverter(object):
                 # interface_name holds the parent port name
                 interface_name = interface_name[:sub_intf_sep_idx]
 
-            for port_name in self.port_dict:
-                if interface_name == port_name:
-                    return self.port_dict[port_name]['alias'] if sub_intf_sep_idx == -1 \
-                            else self.port_dict[port_name]['alias'] + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
+            if interface_name in self.port_dict:
+                return self.port_dict[interface_name]['alias'] if sub_intf_sep_idx == -1 \
+                        else self.port_dict[interface_name]['alias'] + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
 
         # interface_name not in port_dict. Just return interface_name
         return interface_name if sub_intf_sep_idx == -1 else interface_name + VLAN_SUB_INTERFACE_SEPARATOR + vlan_id
 
+    def name_to_alias_map(self):
+        """Return a dict of the SONiC interface names to their
+           vendor interface alias, built once
+        """
+        if self._name_to_alias_map is None:
+            self._name_to_alias_map = {port_name: port['alias'] for port_name, port in self.port_dict.items()
+                                       if 'alias' in port}
+        return self._name_to_alias_map
+
+    def translate_names(self, text):
+        """Replace the SONiC interface names of text with their vendor
+           alias. A name is replaced if it is at the start of text or
+           preceded by whitespace, and followed by the end of text,
+           whitespace or a comma and whitespace.
+        """
+        name_map = self.name_to_alias_map()
+        if not name_map:
+            return text
+        if self._name_re is None:
+            # Longest names first, so that Ethernet1 is not tried before Ethernet10
+            names = sorted(name_map, key=len, reverse=True)
+            self._name_re = re.compile(r"(?:^|(?<=\s))({})(?=$|,?\s)".format("|".join(map(re.escape, names))))
+        return self._name_re.sub(lambda match: name_map[match.group(1)], text)
+
+    def translate_json_interface_names(self, chunks):
+        """Replace the SONiC interface names with their vendor alias in
+           the "interfaceName" members of a JSON document given as an
+           iterable of text chunks, and yield the translated text.
+
+           The document is not decoded: the members are rewritten in place
+           and the text is yielded as it is read, except for the end of the
+           chunk which may hold a member continued in the next chunk.
+        """
+        aliases = dict(self.name_to_alias_map())
+        buf = ''
+        for chunk in chunks:
+            buf += chunk
+            out = []
+            pos = 0
+            for match in INTERFACE_NAME_JSON_RE.finditer(buf):
+                name = match.group(1)
+                alias = aliases.get(name)
+                if alias is None:
+                    # Sub interface or unknown interface
+                    alias = aliases[name] = self.name_to_alias(name)
+                out.append(buf[pos:match.start(1)])
+                out.append(alias)
+                pos = match.end(1)
+            held = max(pos, len(buf) - INTERFACE_NAME_JSON_MAX_LEN)
+            out.append(buf[pos:held])
+            buf = buf[held:]
+            yield ''.join(out)
+        if buf:
+            yield buf
+
     def alias_to_name(self, interface_alias):
         """Return SONiC interface name if vendor
            port alias is given as argument
@@ -191,6 +254,28 @@ class InterfaceAliasConverter(object):
 iface_alias_converter = lazy_object_proxy.Proxy(lambda: InterfaceAliasConverter())
 
 
+def lazy_import(module_name, attr=None):
+    """Return a proxy to the module module_name, or to its attribute attr,
+    which imports the module on first use.
+    """
+    def load():
+        module = importlib.import_module(module_name)
+        return getattr(module, attr) if attr else module
+
+    return lazy_object_proxy.Proxy(load)
+
+
+def add_lazy_commands(group, commands):
+    """Register subcommands of group by name without importing the modules
+    implementing them. A module is imported when its command is first used,
+    e.g. invoked or listed in the help.
+
+    commands maps a command name to a (module name, attribute name) pair.
+    """
+    for name, (module_name, attr) in commands.items():
+        group.add_command(lazy_import(module_name, attr), name=name)
+
+
 def get_interface_naming_mode():
     mode = os.getenv('SONIC_CLI_IFACE_MODE')
     if mode is None:
@@ -723,11 +808,7 @@ def run_command_in_alias_mode(command, shell=False):
                 whitespace and followed immediately by either the end of a line or whitespace
                 or a comma followed by whitespace
                 """
-                converted_output = raw_output
-                for port_name in iface_alias_converter.port_dict:
-                    converted_output = re.sub(r"(^|\s){}($|,{{0,1}}\s)".format(port_name),
-                                              r"\1{}\2".format(iface_alias_converter.name_to_alias(port_name)),
-                                              converted_output)
+                converted_output = iface_alias_converter.translate_names(raw_output)
                 click.echo(converted_output.rstrip('\n'))
 
     rc = process.poll()
@@ -0,0 +1,327 @@
+"""
+Resident CLI server.
+
+Every CLI invocation starts a new interpreter, imports click, swsscommon and
+the command modules, loads the database config and connects to redis before
+doing any work. CliServer keeps a click group loaded in a long running
+process and runs the commands forwarded by run_client() over a Unix socket.
+
+The client passes its stdin, stdout and stderr file descriptors along with
+argv, environment and working directory. The server runs the command with
+those descriptors in place of its own, so the output (including the output
+of the subprocesses spawned by the command) goes straight to the caller's
+terminal or pipe, then replies with the exit code.
+
+Every request is served in a forked process, and the command runs in a
+fresh process forked from the server, in a process group of its own: the
+modules stay imported, but no state is kept from one command to the next
+and long running commands (e.g. follow modes) don't hold up the others. The
+command and its subprocesses are killed when the client goes away (e.g. on
+Ctrl-C) or, optionally, when the command doesn't complete in time.
+
+Only clients running with the same user id as the server are served, other
+clients are told to run the command themselves.
+
+This module only depends on the standard library, so that the client stays
+cheap to start.
+"""
+
+import array
+import json
+import os
+import select
+import signal
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
+import traceback
+
+HEADER_FORMAT = '!I'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+STDIO_FDS = (0, 1, 2)
+MAX_REQUEST_SIZE = 1024 * 1024
+# Exit code of the commands which did not complete in time, like timeout(1)
+TIMEOUT_EXIT_CODE = 124
+
+
+def _recv_exactly(sock, size):
+    data = b''
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError('connection closed by peer')
+        data += chunk
+    return data
+
+
+def _send_message(sock, message, fds=None):
+    payload = json.dumps(message).encode()
+    data = struct.pack(HEADER_FORMAT, len(payload)) + payload
+    if fds:
+        ancillary = [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array('i', fds))]
+        sent = sock.sendmsg([data], ancillary)
+        data = data[sent:]
+    if data:
+        sock.sendall(data)
+
+
+def _recv_message(sock, maxfds=0):
+    """ Receive a message, return it with the file descriptors passed along """
+
+    fds = array.array('i')
+    data, ancdata, _, _ = sock.recvmsg(HEADER_SIZE, socket.CMSG_SPACE(maxfds * fds.itemsize))
+    for level, kind, cmsg_data in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(cmsg_data[:len(cmsg_data) - (len(cmsg_data) % fds.itemsize)])
+    try:
+        if not data:
+            raise ConnectionError('connection closed by peer')
+        data += _recv_exactly(sock, HEADER_SIZE - len(data))
+        size, = struct.unpack(HEADER_FORMAT, data)
+        if size > MAX_REQUEST_SIZE:
+            raise ValueError('message too large: {} bytes'.format(size))
+        return json.loads(_recv_exactly(sock, size).decode()), list(fds)
+    except Exception:
+        for fd in fds:
+            os.close(fd)
+        raise
+
+
+def get_peer_uid(sock):
+    """ Return the user id of the process connected to Unix socket sock """
+
+    creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+    _, uid, _ = struct.unpack('3i', creds)
+    return uid
+
+
+class CliRequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        try:
+            request, fds = _recv_message(self.request, maxfds=len(STDIO_FDS))
+        except (ConnectionError, OSError, ValueError):
+            return
+
+        try:
+            if get_peer_uid(self.request) != os.geteuid():
+                _send_message(self.request, {'fallback': 'user mismatch'})
+                return
+            if len(fds) != len(STDIO_FDS):
+                _send_message(self.request, {'fallback': 'missing file descriptors'})
+                return
+            exit_code = self.server.run_command(request['argv'], request['env'], request['cwd'], fds,
+                                                self.request)
+            if exit_code is not None:
+                _send_message(self.request, {'exit_code': exit_code})
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+
+class CliServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """
+    Serve the commands of click group cli on Unix socket socket_path.
+
+    The commands are killed if they don't complete within command_timeout
+    seconds, if it is set.
+
+    get_obj() is called in the command process before the command runs and
+    its result passed as the context object of the group.
+    """
+
+    # Don't wait for the running commands (e.g. in follow mode) on shutdown
+    block_on_close = False
+
+    def __init__(self, socket_path, cli, prog_name, command_timeout=None):
+        self.cli = cli
+        self.prog_name = prog_name
+        self.command_timeout = command_timeout
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        socket_dir = os.path.dirname(socket_path)
+        if socket_dir:
+            os.makedirs(socket_dir, exist_ok=True)
+        old_umask = os.umask(0o177)
+        try:
+            super(CliServer, self).__init__(socket_path, CliRequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def server_close(self):
+        super(CliServer, self).server_close()
+        try:
+            os.unlink(self.server_address)
+        except OSError:
+            pass
+
+    def get_obj(self):
+        return None
+
+    def preload(self):
+        """ Import the commands loaded on first use, so that the first
+        forwarded command doesn't pay for them """
+
+        ctx = self.cli.make_context(self.prog_name, [], resilient_parsing=True)
+        for name in self.cli.list_commands(ctx):
+            command = self.cli.get_command(ctx, name)
+            # Accessing any attribute of a lazy command resolves it
+            getattr(command, 'name', None)
+
+    def run_command(self, argv, env, cwd, fds, sock):
+        """ Run the command with arguments argv in a new process, using the
+        file descriptors fds as stdin, stdout and stderr. Return its exit
+        code, or None if the client connected on sock went away, in which
+        case the command is killed. """
+
+        self._flush_stdio()
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                exit_code = self._run_child(argv, env, cwd, fds, sock)
+            finally:
+                os._exit(exit_code)
+
+        try:
+            os.setpgid(pid, pid)
+        except OSError:
+            # The child already did it, or is already gone
+            pass
+        return self._wait_command(pid, fds, sock)
+
+    def _run_child(self, argv, env, cwd, fds, sock):
+        try:
+            # In a process group of its own, so that the command is killed
+            # along with its subprocesses
+            os.setpgid(0, 0)
+            for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+                signal.signal(signum, signal.SIG_DFL)
+            self.socket.close()
+            sock.close()
+            for fd, target in zip(fds, STDIO_FDS):
+                os.dup2(fd, target)
+            os.environ.clear()
+            os.environ.update(env)
+            os.chdir(cwd)
+            sys.argv = [self.prog_name] + argv
+        except BaseException:
+            traceback.print_exc()
+            return 1
+
+        exit_code = self._invoke(argv)
+        self._flush_stdio()
+        return exit_code
+
+    def _wait_command(self, pid, fds, sock):
+        """ Wait until the command process pid exits, the client goes away
+        or the command times out """
+
+        read_fd, write_fd = os.pipe()
+        statuses = []
+
+        def wait():
+            statuses.append(os.waitpid(pid, 0)[1])
+            os.write(write_fd, b'\0')
+
+        waiter = threading.Thread(target=wait)
+        waiter.daemon = True
+        waiter.start()
+
+        deadline = None if self.command_timeout is None else time.monotonic() + self.command_timeout
+        try:
+            while True:
+                timeout = None if deadline is None else max(0, deadline - time.monotonic())
+                readable, _, _ = select.select([read_fd, sock], [], [], timeout)
+                if read_fd in readable:
+                    waiter.join()
+                    return self._exit_code(statuses[0])
+                if sock in readable:
+                    # The client only waits for the reply, it closed the connection
+                    self._kill(pid, waiter)
+                    return None
+                if deadline is not None and time.monotonic() >= deadline:
+                    os.write(fds[2], 'Error: command timed out after {} seconds\n'.format(
+                        self.command_timeout).encode())
+                    self._kill(pid, waiter)
+                    return TIMEOUT_EXIT_CODE
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    @staticmethod
+    def _kill(pid, waiter):
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except OSError:
+            pass
+        waiter.join()
+
+    @staticmethod
+    def _exit_code(status):
+        if os.WIFSIGNALED(status):
+            return 128 + os.WTERMSIG(status)
+        return os.WEXITSTATUS(status)
+
+    def _invoke(self, argv):
+        try:
+            self.cli.main(args=argv, prog_name=self.prog_name, obj=self.get_obj())
+        except SystemExit as e:
+            if e.code is None:
+                return 0
+            if isinstance(e.code, int):
+                return e.code
+            sys.stderr.write('{}\n'.format(e.code))
+            return 1
+        except BaseException:
+            traceback.print_exc()
+            return 1
+        return 0
+
+    @staticmethod
+    def _flush_stdio():
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+
+
+def run_client(socket_path, argv, fds=STDIO_FDS):
+    """
+    Forward the command with arguments argv to the server listening on
+    socket_path, the server using the file descriptors fds as stdin, stdout
+    and stderr.
+
+    Return the exit code of the command, or None if no server could run it
+    and the caller has to run the command itself.
+    """
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            sock.connect(socket_path)
+            _send_message(sock, {'argv': list(argv), 'env': dict(os.environ), 'cwd': os.getcwd()},
+                          fds=list(fds))
+        except OSError:
+            return None
+
+        try:
+            reply, _ = _recv_message(sock)
+        except KeyboardInterrupt:
+            # Closing the connection kills the command
+            return 128 + signal.SIGINT
+        except (ConnectionError, OSError, ValueError):
+            # The command may have run, it is not safe to run it again
+            os.write(fds[2], b'Error: connection to the CLI server lost\n')
+            return 1
+    finally:
+        sock.close()
+
+    if 'exit_code' in reply:
+        return reply['exit_code']
+    return None
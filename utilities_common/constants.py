@@ -11,3 +11,5 @@ IPV4 = 'v4'
 IPV6 = 'v6'
 VTYSH_COMMAND = 'vtysh'
 RVTYSH_COMMAND = 'rvtysh'
+# Upper bound of the worker threads used to collect from namespaces concurrently
+MULTI_ASIC_MAX_WORKERS = 8
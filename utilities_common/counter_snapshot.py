@@ -0,0 +1,149 @@
+"""
+Compact columnar snapshots of counters.
+
+The counters saved by the clear commands used to be written as one JSON
+file per port, each re-reading and re-encoding every counter as text. A
+snapshot holds the counters of all the rows (e.g. all the queues of all
+the ports) in a single file:
+
+- a fixed header: magic, format version and length of the metadata,
+- the metadata, in JSON: the time of the snapshot, the column and the row
+  names,
+- padding to an 8 bytes boundary,
+- the counter values, as little endian unsigned 64 bits integers, one
+  column after the other. N/A counters are stored as NA.
+
+The file is memory mapped when it is read: the values are accessed in
+place, so that displaying the rows of one port doesn't decode the others.
+"""
+
+import array
+import json
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b'CSNP'
+VERSION = 1
+HEADER = struct.Struct('<4sHxxI')
+VALUE_SIZE = 8
+NA = 0xFFFFFFFFFFFFFFFF
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def _padding(offset):
+    return -offset % VALUE_SIZE
+
+
+def write_snapshot(path, time, columns, rows):
+    """
+    Save a snapshot to path.
+
+    rows is an iterable of (row name, values) where values are aligned with
+    columns, a None or non integer value is saved as N/A. time is saved as
+    is and must be JSON serializable.
+    """
+    columns = list(columns)
+    names = []
+    values = [array.array('Q') for _ in columns]
+    for name, row in rows:
+        names.append(name)
+        for column, value in zip(values, row):
+            column.append(value if isinstance(value, int) and 0 <= value < NA else NA)
+
+    meta = json.dumps({'time': time, 'columns': columns, 'rows': names}).encode()
+    data = array.array('Q')
+    for column in values:
+        data.extend(column)
+    if sys.byteorder != 'little':
+        data.byteswap()
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(meta)))
+        f.write(meta)
+        f.write(b'\0' * _padding(HEADER.size + len(meta)))
+        f.write(data.tobytes())
+    os.replace(tmp_path, path)
+
+
+class Snapshot(object):
+    """
+    Snapshot read from a file, values are read from the memory mapped file
+    """
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise SnapshotError("{} is empty".format(path))
+
+        try:
+            magic, version, meta_len = HEADER.unpack_from(self._mmap, 0)
+            if magic != MAGIC or version != VERSION:
+                raise SnapshotError("{} is not a counter snapshot".format(path))
+            meta = json.loads(self._mmap[HEADER.size:HEADER.size + meta_len].decode())
+            self.time = meta['time']
+            self.columns = meta['columns']
+            self.rows = meta['rows']
+        except (struct.error, ValueError, KeyError, TypeError) as e:
+            self._mmap.close()
+            raise SnapshotError("Invalid counter snapshot {}: {}".format(path, e))
+
+        offset = HEADER.size + meta_len
+        offset += _padding(offset)
+        size = len(self.columns) * len(self.rows) * VALUE_SIZE
+        if len(self._mmap) != offset + size:
+            self._mmap.close()
+            raise SnapshotError("Invalid counter snapshot {}: truncated".format(path))
+
+        if sys.byteorder == 'little':
+            self._values = memoryview(self._mmap)[offset:].cast('Q')
+        else:
+            self._values = array.array('Q', self._mmap[offset:])
+            self._values.byteswap()
+
+        self._row_index = {name: idx for idx, name in enumerate(self.rows)}
+        self._column_index = {name: idx for idx, name in enumerate(self.columns)}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if isinstance(self._values, memoryview):
+            self._values.release()
+        self._mmap.close()
+
+    def __contains__(self, row):
+        return row in self._row_index
+
+    def get(self, row, column):
+        """Returns the value of column in row, None if it is N/A"""
+        value = self._values[self._column_index[column] * len(self.rows) + self._row_index[row]]
+        return None if value == NA else value
+
+    def row(self, row):
+        """Returns the values of row as a dict, None if the row is not in the snapshot"""
+        idx = self._row_index.get(row)
+        if idx is None:
+            return None
+        nrows = len(self.rows)
+        values = {}
+        for column, col_idx in self._column_index.items():
+            value = self._values[col_idx * nrows + idx]
+            values[column] = None if value == NA else value
+        return values
+
+
+def load_snapshot(path):
+    """Returns the Snapshot saved at path, None if there is none"""
+    if not os.path.isfile(path):
+        return None
+    return Snapshot(path)
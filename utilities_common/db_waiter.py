@@ -0,0 +1,136 @@
+"""
+Event driven waiting on redis keys.
+
+Waiting for a daemon to act on the database used to poll it with KEYS and
+a fixed sleep, which blocks a busy redis on every poll and adds up to a
+full sleep of latency once the condition holds. KeyspaceWaiter subscribes
+to the keyspace notifications of the watched key patterns and checks its
+condition again as soon as one of the keys changes. The condition is also
+checked every interval, so that the wait still completes if keyspace
+notifications are disabled or the redis client is not available.
+
+Key patterns are matched with SCAN (utilities_common.bulk_db.scan_keys)
+instead of KEYS.
+"""
+
+import time
+
+from utilities_common import bulk_db
+
+KEYSPACE_CHANNEL = "__keyspace@{}__:{}"
+
+
+def wait_until(condition, timeout, interval=1.0):
+    """
+    Wait until condition() returns True, checking it every interval
+    seconds, for at most timeout seconds.
+
+    Returns the last result of condition().
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if condition():
+            return True
+        now = time.monotonic()
+        if now >= deadline:
+            return False
+        time.sleep(min(interval, deadline - now))
+
+
+class KeyspaceWaiter(object):
+    """
+    Wait for a condition on the keys of db_name matching patterns.
+
+    db is a connected SonicV2Connector. The waiter should be used as a
+    context manager, so that it is subscribed before the condition is first
+    checked and no change is missed.
+    """
+    def __init__(self, db, db_name, patterns, interval=1.0):
+        self.db = db
+        self.db_name = db_name
+        self.patterns = list(patterns)
+        self.interval = interval
+        self.pubsub = None
+
+    def __enter__(self):
+        client = bulk_db.get_pipeline_client(self.db, self.db_name)
+        if client is None or not hasattr(client, 'pubsub'):
+            return self
+        try:
+            db_id = self.db.get_dbid(self.db_name)
+            self.pubsub = client.pubsub()
+            self.pubsub.psubscribe(*[KEYSPACE_CHANNEL.format(db_id, pattern) for pattern in self.patterns])
+        except Exception:
+            # Fall back to polling
+            self.pubsub = None
+        return self
+
+    def __exit__(self, *args):
+        if self.pubsub is not None:
+            try:
+                self.pubsub.punsubscribe()
+                self.pubsub.close()
+            except Exception:
+                pass
+            self.pubsub = None
+
+    def _wait_for_change(self, timeout):
+        """Wait for timeout seconds or until a watched key changes."""
+        deadline = time.monotonic() + timeout
+        if self.pubsub is not None:
+            message = self.pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+            if message is not None:
+                # Drain the notifications of a burst of changes, the
+                # condition is checked once for all of them
+                while self.pubsub.get_message(ignore_subscribe_messages=True, timeout=0) is not None:
+                    pass
+                return
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def wait_for(self, condition, timeout):
+        """
+        Wait until condition() returns True, for at most timeout seconds.
+
+        Returns the last result of condition().
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if condition():
+                return True
+            now = time.monotonic()
+            if now >= deadline:
+                return False
+            self._wait_for_change(min(self.interval, deadline - now))
+
+
+def first_key(db, db_name, pattern):
+    """Return a key of db_name matching pattern, or None if there is none."""
+    return next(bulk_db.scan_keys(db, db_name, pattern), None)
+
+
+def wait_until_clear(db, db_name, patterns, timeout, interval=1.0, on_pending=None):
+    """
+    Wait until no key of db_name matches any of patterns, for at most
+    timeout seconds.
+
+    on_pending(pattern, key) is called with a remaining key of every
+    pattern still matching whenever the keys are checked.
+
+    Returns True if the keys were cleared.
+    """
+    patterns = list(patterns)
+
+    def cleared():
+        clear = True
+        for pattern in patterns:
+            key = first_key(db, db_name, pattern)
+            if key is not None:
+                clear = False
+                if on_pending is not None:
+                    on_pending(pattern, key)
+        return clear
+
+    with KeyspaceWaiter(db, db_name, patterns, interval=interval) as waiter:
+        return waiter.wait_for(cleared, timeout)
@@ -1,4 +1,6 @@
 import argparse
+import concurrent.futures
+import copy
 import functools
 
 import click
@@ -13,7 +15,7 @@ class MultiAsic(object):
 
     def __init__(
         self, display_option=constants.DISPLAY_ALL, namespace_option=None,
-        db=None
+        db=None, max_workers=constants.MULTI_ASIC_MAX_WORKERS
     ):
         # Load database config files
         load_db_config()
@@ -22,6 +24,7 @@ class MultiAsic(object):
         self.current_namespace = None
         self.is_multi_asic = multi_asic.is_multi_asic()
         self.db = db
+        self.max_workers = max_workers
 
     def get_display_option(self):
         return self.display_option
@@ -125,6 +128,21 @@ def multi_asic_click_option_namespace(func):
    func = _multi_asic_click_option_namespace(func)
    return func
 
+
+def _connect_namespace(self, ns):
+    self.multi_asic.current_namespace = ns
+    # if object instance already has db connections, use them
+    if self.multi_asic.db and self.multi_asic.db.cfgdb_clients.get(ns):
+        self.config_db = self.multi_asic.db.cfgdb_clients[ns]
+    else:
+        self.config_db = multi_asic.connect_config_db_for_ns(ns)
+
+    if self.multi_asic.db and self.multi_asic.db.db_clients.get(ns):
+        self.db = self.multi_asic.db.db_clients[ns]
+    else:
+        self.db = multi_asic.connect_to_all_dbs_for_ns(ns)
+
+
 def run_on_multi_asic(func):
     '''
     This decorator is used on the CLI functions which needs to be
@@ -138,22 +156,52 @@ def run_on_multi_asic(func):
     def wrapped_run_on_all_asics(self, *args, **kwargs):
         ns_list = self.multi_asic.get_ns_list_based_on_options()
         for ns in ns_list:
-            self.multi_asic.current_namespace = ns
-            # if object instance already has db connections, use them
-            if self.multi_asic.db and self.multi_asic.db.cfgdb_clients.get(ns):
-                self.config_db = self.multi_asic.db.cfgdb_clients[ns]
-            else:
-                self.config_db = multi_asic.connect_config_db_for_ns(ns)
-
-            if self.multi_asic.db and self.multi_asic.db.db_clients.get(ns):
-                self.db = self.multi_asic.db.db_clients[ns]
-            else:
-                self.db = multi_asic.connect_to_all_dbs_for_ns(ns)
-
+            _connect_namespace(self, ns)
             func(self,  *args, **kwargs)
     return wrapped_run_on_all_asics
 
 
+def run_on_multi_asic_concurrently(func):
+    '''
+    Concurrent flavour of run_on_multi_asic.
+    Every namespace is handled in a worker thread, which connects to all
+    the DBs of its namespace and runs the wrapped function on a shallow
+    copy of the instance. The wrapped function must therefore return its
+    per namespace result instead of storing it on self. The decorated
+    function returns the list of results in namespace order.
+
+    The number of worker threads is bounded by self.multi_asic.max_workers.
+    '''
+    @functools.wraps(func)
+    def wrapped_run_on_all_asics_concurrently(self, *args, **kwargs):
+        ns_list = self.multi_asic.get_ns_list_based_on_options()
+        if len(ns_list) <= 1 or self.multi_asic.max_workers <= 1:
+            results = []
+            for ns in ns_list:
+                _connect_namespace(self, ns)
+                results.append(func(self, *args, **kwargs))
+            return results
+
+        def run_on_ns(ns):
+            instance = copy.copy(self)
+            instance.multi_asic = copy.copy(self.multi_asic)
+            _connect_namespace(instance, ns)
+            return instance, func(instance, *args, **kwargs)
+
+        max_workers = min(len(ns_list), self.multi_asic.max_workers)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run_on_ns, ns) for ns in ns_list]
+            outcomes = [future.result() for future in futures]
+
+        # Leave the instance connected to the last namespace, like run_on_multi_asic does
+        last_instance = outcomes[-1][0]
+        self.multi_asic.current_namespace = last_instance.multi_asic.current_namespace
+        self.config_db = last_instance.config_db
+        self.db = last_instance.db
+        return [result for _, result in outcomes]
+    return wrapped_run_on_all_asics_concurrently
+
+
 def multi_asic_args(parser=None):
     if parser is None:
         parser = argparse.ArgumentParser(
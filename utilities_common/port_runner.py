@@ -0,0 +1,146 @@
+"""
+Run a per-port operation on many transceivers concurrently.
+
+Transceiver accesses (EEPROM reads, CDB commands...) are slow I2C
+transactions. PortRunner runs them on several ports at once, with:
+
+- at most max_workers ports being accessed at the same time,
+- at most bus_limit ports being accessed at the same time on the same bus,
+  bus_of(port) telling which bus a port is on,
+- an optional per-port timeout, after which the port is reported as timed
+  out and its worker slot is released, so that a hung module doesn't stall
+  the other ports. The hung access can't be interrupted and is left running
+  in a daemon thread; its bus stays busy until it returns, so no other
+  access is started on a bus which is still in use. The ports waiting for
+  such a bus are reported as timed out if it isn't released within the
+  timeout.
+
+The results are returned in the order of the ports, as soon as the result
+of every preceding port is available.
+"""
+
+import threading
+import time
+
+
+class PortTimeoutError(Exception):
+    pass
+
+
+class PortRunner(object):
+    def __init__(self, max_workers, bus_limit=1, bus_of=None, timeout=None):
+        self.max_workers = max(1, max_workers)
+        self.bus_limit = max(1, bus_limit)
+        self.bus_of = bus_of
+        self.timeout = timeout
+
+    def _bus(self, port):
+        if self.bus_of is None:
+            return port
+        try:
+            bus = self.bus_of(port)
+        except Exception:
+            bus = None
+        # Ports on an unknown bus are only limited by max_workers
+        return port if bus is None else bus
+
+    def run(self, func, ports):
+        """
+        Run func(port) for every port.
+
+        Yields (port, result, error) in the order of ports: error is None if
+        func returned result, else the exception it raised, or a
+        PortTimeoutError if it did not complete within the timeout.
+        """
+        ports = list(ports)
+        buses = [self._bus(port) for port in ports]
+        cond = threading.Condition()
+        results = {}
+        running = {}
+        bus_running = {}
+        # Ports which timed out but whose access is still running, and the
+        # time at which the last of them timed out, per bus
+        expired = set()
+        bus_expired = {}
+        started = set()
+        next_start = 0
+
+        def worker(idx):
+            try:
+                outcome = (func(ports[idx]), None)
+            except BaseException as e:
+                outcome = (None, e)
+            with cond:
+                if idx in running:
+                    del running[idx]
+                    results[idx] = outcome
+                elif idx in expired:
+                    expired.remove(idx)
+                    if not any(buses[other] == buses[idx] for other in expired):
+                        bus_expired.pop(buses[idx], None)
+                bus_running[buses[idx]] -= 1
+                cond.notify()
+
+        def start_ready():
+            # Start the pending ports in order, skipping the ones whose bus is busy
+            nonlocal next_start
+            for idx in range(next_start, len(ports)):
+                if len(running) >= self.max_workers:
+                    break
+                if idx in started:
+                    continue
+                if bus_running.get(buses[idx], 0) >= self.bus_limit:
+                    continue
+                started.add(idx)
+                running[idx] = time.monotonic()
+                bus_running[buses[idx]] = bus_running.get(buses[idx], 0) + 1
+                thread = threading.Thread(target=worker, args=(idx,))
+                thread.daemon = True
+                thread.start()
+            while next_start in started:
+                next_start += 1
+
+        def expire():
+            # Report the ports which did not complete in time, return the time to the next expiry
+            if self.timeout is None:
+                return None
+            now = time.monotonic()
+            wait = None
+            for idx, start in list(running.items()):
+                remaining = start + self.timeout - now
+                if remaining <= 0:
+                    del running[idx]
+                    expired.add(idx)
+                    bus_expired[buses[idx]] = now
+                    results[idx] = (None, PortTimeoutError(
+                        "Timed out after {} seconds".format(self.timeout)))
+                elif wait is None or remaining < wait:
+                    wait = remaining
+            # The pending ports can't wait forever for a bus held by a hung access
+            for idx in range(next_start, len(ports)):
+                if idx in started or buses[idx] not in bus_expired:
+                    continue
+                remaining = bus_expired[buses[idx]] + self.timeout - now
+                if remaining <= 0:
+                    started.add(idx)
+                    results[idx] = (None, PortTimeoutError(
+                        "Timed out after {} seconds waiting for the bus".format(self.timeout)))
+                elif wait is None or remaining < wait:
+                    wait = remaining
+            return wait
+
+        with cond:
+            for idx in range(len(ports)):
+                while idx not in results:
+                    start_ready()
+                    wait = expire()
+                    if idx in results:
+                        break
+                    cond.wait(wait)
+                    expire()
+                result, error = results.pop(idx)
+                cond.release()
+                try:
+                    yield ports[idx], result, error
+                finally:
+                    cond.acquire()
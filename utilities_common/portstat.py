@@ -9,6 +9,7 @@ from sonic_py_common import device_info
 from swsscommon.swsscommon import SonicV2Connector, CounterTable, PortCounter
 
 from utilities_common import constants
+from utilities_common import bulk_db
 import utilities_common.multi_asic as multi_asic_util
 from utilities_common.netstat import ns_diff, table_as_json, format_brate, format_prate, \
                                      format_util, format_number_with_comma, format_util_directly, \
@@ -49,12 +50,16 @@ So, any fields added/deleted in here should be reflected in portstat script also
 """
 BUCKET_NUM = 50
 
-wred_green_pkt_stat_capable = "false"
-wred_yellow_pkt_stat_capable = "false"
-wred_red_pkt_stat_capable = "false"
-wred_total_pkt_stat_capable = "false"
 is_wred_stats_reqd = True
 
+# WRED drop counters: key of their capability in PORT_COUNTER_CAPABILITIES
+WRED_DROP_COUNTERS = OrderedDict([
+    ('green', 'WRED_ECN_PORT_WRED_GREEN_DROP_COUNTER'),
+    ('yellow', 'WRED_ECN_PORT_WRED_YELLOW_DROP_COUNTER'),
+    ('red', 'WRED_ECN_PORT_WRED_RED_DROP_COUNTER'),
+    ('total', 'WRED_ECN_PORT_WRED_TOTAL_DROP_COUNTER'),
+])
+
 
 counter_bucket_dict = {
         0: ['SAI_PORT_STAT_IF_IN_UCAST_PKTS', 'SAI_PORT_STAT_IF_IN_NON_UCAST_PKTS'],
@@ -134,6 +139,12 @@ LINECARD_PORT_STAT_TABLE = 'LINECARD_PORT_STAT_TABLE'
 LINECARD_PORT_STAT_MARK_TABLE = 'LINECARD_PORT_STAT_MARK_TABLE'
 CHASSIS_MIDPLANE_INFO_TABLE = 'CHASSIS_MIDPLANE_TABLE'
 
+GEARBOX_TABLE_PHY_PATTERN = "_GEARBOX_TABLE:phy:*"
+
+# Seconds to wait for the linecards to publish their counters
+LINECARD_COUNTER_PULL_TIMEOUT = 2
+LINECARD_PULL_POLL_INTERVAL = 0.1
+
 
 def intfsorted(intf_list):
     """
@@ -158,11 +169,16 @@ def is_non_zero(value):
 
 
 class Portstat(object):
-    def __init__(self, namespace, display_option):
+    def __init__(self, namespace, display_option, lc_pull_timeout=LINECARD_COUNTER_PULL_TIMEOUT):
         self.db = None
+        self.lc_pull_timeout = lc_pull_timeout
         self.namespace = namespace
         self.display_option = display_option
         self.multi_asic = multi_asic_util.MultiAsic(display_option, namespace)
+        self.wred_capable = dict.fromkeys(WRED_DROP_COUNTERS, "false")
+        # Whether gearbox PHYs are present, per namespace. The dict is shared
+        # with the per namespace copies of the instance
+        self.gearbox_configured = {}
         if device_info.is_supervisor():
             self.db = SonicV2Connector(use_unix_socket_path=False)
             self.db.connect(self.db.CHASSIS_STATE_DB, False)
@@ -178,12 +194,21 @@ class Portstat(object):
                 self.collect_stat_from_lc()
                 self.sorted = intfsorted
             else:
-                self.collect_stat()
+                self.merge_stat(self.collect_stat())
                 self.sorted = natsorted
         else:
-            self.collect_stat()
+            self.merge_stat(self.collect_stat())
         return self.cnstat_dict, self.ratestat_dict
 
+    def merge_stat(self, ns_stats):
+        """
+            Merge the per namespace statistics in namespace order
+        """
+        for cnstat_dict, ratestat_dict, wred_capable in ns_stats:
+            self.cnstat_dict.update(cnstat_dict)
+            self.ratestat_dict.update(ratestat_dict)
+            self.wred_capable.update(wred_capable)
+
     def collect_stat_from_lc(self):
         # Retrieve the current counter values from all LCs
 
@@ -207,8 +232,8 @@ class Portstat(object):
                     lc_count += 1
 
         # Notify the Linecards to publish their counter values instantly
-        self.db.set(self.db.CHASSIS_STATE_DB, "GET_LINECARD_COUNTER|pull", "enable", "true")
-        time.sleep(2)
+        # and wait until all of them have published
+        self.pull_linecard_counters(lc_count)
 
         # Check if all LCs have published counters
         linecard_names = self.db.keys(self.db.CHASSIS_STATE_DB, LINECARD_PORT_STAT_MARK_TABLE + "*")
@@ -227,23 +252,24 @@ class Portstat(object):
         ratestat_dict = OrderedDict()
 
         # Get the counter values from CHASSIS_STATE_DB
-        for key in linecard_port_aliases:
-            rx_ok = self.db.get(self.db.CHASSIS_STATE_DB, key, "rx_ok")
-            rx_bps = self.db.get(self.db.CHASSIS_STATE_DB, key, "rx_bps")
-            rx_pps = self.db.get(self.db.CHASSIS_STATE_DB, key, "rx_pps")
-            rx_util = self.db.get(self.db.CHASSIS_STATE_DB, key, "rx_util")
-            rx_err = self.db.get(self.db.CHASSIS_STATE_DB, key, "rx_err")
-            rx_drop = self.db.get(self.db.CHASSIS_STATE_DB, key, "rx_drop")
-            rx_ovr = self.db.get(self.db.CHASSIS_STATE_DB, key, "rx_ovr")
-            tx_ok = self.db.get(self.db.CHASSIS_STATE_DB, key, "tx_ok")
-            tx_bps = self.db.get(self.db.CHASSIS_STATE_DB, key, "tx_bps")
-            tx_pps = self.db.get(self.db.CHASSIS_STATE_DB, key, "tx_pps")
-            tx_util = self.db.get(self.db.CHASSIS_STATE_DB, key, "tx_util")
-            tx_err = self.db.get(self.db.CHASSIS_STATE_DB, key, "tx_err")
-            tx_drop = self.db.get(self.db.CHASSIS_STATE_DB, key, "tx_drop")
-            tx_ovr = self.db.get(self.db.CHASSIS_STATE_DB, key, "tx_ovr")
-            fec_pre_ber = self.db.get(self.db.CHASSIS_STATE_DB, key, "fec_pre_ber")
-            fec_post_ber = self.db.get(self.db.CHASSIS_STATE_DB, key, "fec_post_ber")
+        all_fvs = bulk_db.hgetall_many(self.db, self.db.CHASSIS_STATE_DB, linecard_port_aliases)
+        for key, fvs in zip(linecard_port_aliases, all_fvs):
+            rx_ok = fvs.get("rx_ok")
+            rx_bps = fvs.get("rx_bps")
+            rx_pps = fvs.get("rx_pps")
+            rx_util = fvs.get("rx_util")
+            rx_err = fvs.get("rx_err")
+            rx_drop = fvs.get("rx_drop")
+            rx_ovr = fvs.get("rx_ovr")
+            tx_ok = fvs.get("tx_ok")
+            tx_bps = fvs.get("tx_bps")
+            tx_pps = fvs.get("tx_pps")
+            tx_util = fvs.get("tx_util")
+            tx_err = fvs.get("tx_err")
+            tx_drop = fvs.get("tx_drop")
+            tx_ovr = fvs.get("tx_ovr")
+            fec_pre_ber = fvs.get("fec_pre_ber")
+            fec_post_ber = fvs.get("fec_post_ber")
             port_alias = key.split("|")[-1]
             cnstat_dict[port_alias] = NStats._make([rx_ok, rx_err, rx_drop, rx_ovr, tx_ok, tx_err, tx_drop, tx_ovr] +
                                                    [STATUS_NA] * (len(NStats._fields) - 8))._asdict()
@@ -252,74 +278,68 @@ class Portstat(object):
         self.cnstat_dict.update(cnstat_dict)
         self.ratestat_dict.update(ratestat_dict)
 
-    @multi_asic_util.run_on_multi_asic
+    def pull_linecard_counters(self, lc_count):
+        """
+            Request the linecards to publish their counters and wait until
+            lc_count linecards have published or the timeout expires.
+        """
+        # Subscribe before the request so that no publish notification is missed
+        pubsub = None
+        client = bulk_db.get_pipeline_client(self.db, self.db.CHASSIS_STATE_DB)
+        if client is not None:
+            pubsub = client.pubsub()
+            pubsub.psubscribe("__keyspace@{}__:{}*".format(self.db.get_dbid(self.db.CHASSIS_STATE_DB),
+                                                           LINECARD_PORT_STAT_MARK_TABLE))
+
+        self.db.set(self.db.CHASSIS_STATE_DB, "GET_LINECARD_COUNTER|pull", "enable", "true")
+
+        deadline = time.monotonic() + self.lc_pull_timeout
+        try:
+            while len(self.db.keys(self.db.CHASSIS_STATE_DB, LINECARD_PORT_STAT_MARK_TABLE + "*") or []) < lc_count:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if pubsub is not None:
+                    # Only count the linecards again on the next mark table notification,
+                    # or a last time when the timeout expires
+                    while pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining) is None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                else:
+                    time.sleep(min(remaining, LINECARD_PULL_POLL_INTERVAL))
+        finally:
+            if pubsub is not None:
+                pubsub.punsubscribe()
+
+    @multi_asic_util.run_on_multi_asic_concurrently
     def collect_stat(self):
         """
         Collect the statisitics from all the asics present on the
-        device and store in a dict
+        device and return them as dicts
         """
 
-        global BUCKET_NUM
-        global wred_green_pkt_stat_capable
-        global wred_yellow_pkt_stat_capable
-        global wred_red_pkt_stat_capable
-        global wred_total_pkt_stat_capable
-        global is_wred_stats_reqd
-
-        wred_green_pkt_stat_capable = self.db.get(
-            self.db.STATE_DB,
-            "PORT_COUNTER_CAPABILITIES|WRED_ECN_PORT_WRED_GREEN_DROP_COUNTER",
-            "isSupported")
-        wred_yellow_pkt_stat_capable = self.db.get(
-            self.db.STATE_DB,
-            "PORT_COUNTER_CAPABILITIES|WRED_ECN_PORT_WRED_YELLOW_DROP_COUNTER",
-            "isSupported")
-        wred_red_pkt_stat_capable = self.db.get(
-            self.db.STATE_DB,
-            "PORT_COUNTER_CAPABILITIES|WRED_ECN_PORT_WRED_RED_DROP_COUNTER",
-            "isSupported")
-        wred_total_pkt_stat_capable = self.db.get(
-            self.db.STATE_DB,
-            "PORT_COUNTER_CAPABILITIES|WRED_ECN_PORT_WRED_TOTAL_DROP_COUNTER",
-            "isSupported")
-
-        # Remove the unsupported stats from the counter dict
-        if (is_wred_stats_reqd is False) or (wred_green_pkt_stat_capable != "true"):
-            if ('SAI_PORT_STAT_GREEN_WRED_DROPPED_PACKETS' in counter_bucket_dict.keys()):
-                del counter_bucket_dict['SAI_PORT_STAT_GREEN_WRED_DROPPED_PACKETS']
-                BUCKET_NUM = (BUCKET_NUM - 1)
-
-        if (is_wred_stats_reqd is False) or (wred_yellow_pkt_stat_capable != "true"):
-            if ('SAI_PORT_STAT_YELLOW_WRED_DROPPED_PACKETS' in counter_bucket_dict.keys()):
-                del counter_bucket_dict['SAI_PORT_STAT_YELLOW_WRED_DROPPED_PACKETS']
-                BUCKET_NUM = (BUCKET_NUM - 1)
-
-        if (is_wred_stats_reqd is False) or (wred_red_pkt_stat_capable != "true"):
-            if ('SAI_PORT_STAT_RED_WRED_DROPPED_PACKETS' in counter_bucket_dict.keys()):
-                del counter_bucket_dict['SAI_PORT_STAT_RED_WRED_DROPPED_PACKETS']
-                BUCKET_NUM = (BUCKET_NUM - 1)
-
-        if (is_wred_stats_reqd is False) or (wred_total_pkt_stat_capable != "true"):
-            if ('SAI_PORT_STAT_WRED_DROPPED_PACKETS' in counter_bucket_dict.keys()):
-                del counter_bucket_dict['SAI_PORT_STAT_WRED_DROPPED_PACKETS']
-                BUCKET_NUM = (BUCKET_NUM - 1)
+        # The namespaces are collected concurrently: the WRED capabilities
+        # are returned with the counters rather than saved in self
+        wred_capable = OrderedDict()
+        for color, capability in WRED_DROP_COUNTERS.items():
+            wred_capable[color] = self.db.get(self.db.STATE_DB,
+                                              "PORT_COUNTER_CAPABILITIES|" + capability,
+                                              "isSupported")
 
         cnstat_dict, ratestat_dict = self.get_cnstat()
-        self.cnstat_dict.update(cnstat_dict)
-        self.ratestat_dict.update(ratestat_dict)
+        return cnstat_dict, ratestat_dict, wred_capable
 
     def get_cnstat(self):
         """
             Get the counters info from database.
         """
-        def get_counters(port):
+        def get_counters(fvs):
             """
                 Get the counters from specific table.
             """
             fields = ["0"]*BUCKET_NUM
 
-            _, fvs = counter_table.get(PortCounter(), port)
-            fvs = dict(fvs)
             for pos, cntr_list in counter_bucket_dict.items():
                 for counter_name in cntr_list:
                     if counter_name not in fvs:
@@ -330,14 +350,13 @@ class Portstat(object):
             cntr = NStats._make(fields)._asdict()
             return cntr
 
-        def get_rates(table_id):
+        def get_rates(fvs):
             """
                 Get the rates from specific table.
             """
             fields = ["0", "0", "0", "0", "0", "0", "0", "0"]
             for pos, name in enumerate(rates_key_list):
-                full_table_id = RATES_TABLE_PREFIX + table_id
-                counter_data = self.db.get(self.db.COUNTERS_DB, full_table_id, name)
+                counter_data = fvs.get(name)
                 if counter_data is None:
                     fields[pos] = STATUS_NA
                 elif fields[pos] != STATUS_NA:
@@ -351,17 +370,41 @@ class Portstat(object):
         cnstat_dict = OrderedDict()
         cnstat_dict['time'] = datetime.datetime.now()
         ratestat_dict = OrderedDict()
-        counter_table = CounterTable(self.db.get_redis_client(self.db.COUNTERS_DB))
         if counter_port_name_map is None:
             return cnstat_dict, ratestat_dict
-        for port in self.sorted(counter_port_name_map):
-            port_name = port.split(":")[0]
-            if self.multi_asic.skip_display(constants.PORT_OBJ, port_name):
-                continue
-            cnstat_dict[port] = get_counters(port)
-            ratestat_dict[port] = get_rates(counter_port_name_map[port])
+
+        ports = [port for port in self.sorted(counter_port_name_map)
+                 if not self.multi_asic.skip_display(constants.PORT_OBJ, port.split(":")[0])]
+        oids = [counter_port_name_map[port] for port in ports]
+
+        # Fetch all the port counter and rate hashes in bulk and decode them in memory
+        all_rates = bulk_db.hgetall_many(self.db, self.db.COUNTERS_DB,
+                                         [RATES_TABLE_PREFIX + oid for oid in oids])
+        if self.is_gearbox_configured():
+            # CounterTable merges the gearbox line/system side counters, keep using it
+            counter_table = CounterTable(self.db.get_redis_client(self.db.COUNTERS_DB))
+            all_counters = [dict(counter_table.get(PortCounter(), port)[1]) for port in ports]
+        else:
+            all_counters = bulk_db.hgetall_many(self.db, self.db.COUNTERS_DB,
+                                                [COUNTER_TABLE_PREFIX + oid for oid in oids])
+
+        for port, counters, rates in zip(ports, all_counters, all_rates):
+            cnstat_dict[port] = get_counters(counters)
+            ratestat_dict[port] = get_rates(rates)
         return cnstat_dict, ratestat_dict
 
+    def is_gearbox_configured(self):
+        """
+            Check whether gearbox PHYs are present in the current namespace,
+            APPL_DB is only scanned the first time
+        """
+        namespace = self.multi_asic.current_namespace
+        if namespace not in self.gearbox_configured:
+            # Stop at the first PHY, without blocking redis with KEYS
+            self.gearbox_configured[namespace] = next(
+                bulk_db.scan_keys(self.db, self.db.APPL_DB, GEARBOX_TABLE_PHY_PATTERN), None) is not None
+        return self.gearbox_configured[namespace]
+
     def get_port_speed(self, port_name):
         """
             Get the port speed
@@ -500,34 +543,34 @@ class Portstat(object):
                                                                                       old_cntr['tx_bca'])))
 
             if (
-                wred_green_pkt_stat_capable == "true"
-                or wred_yellow_pkt_stat_capable == "true"
-                or wred_red_pkt_stat_capable == "true"
-                or wred_total_pkt_stat_capable == "true"
+                self.wred_capable['green'] == "true"
+                or self.wred_capable['yellow'] == "true"
+                or self.wred_capable['red'] == "true"
+                or self.wred_capable['total'] == "true"
             ):
                 print("")
-                if wred_green_pkt_stat_capable == "true":
+                if self.wred_capable['green'] == "true":
                     print(
                         "WRED Green Dropped Packets..................... {}".format(
                             ns_diff(cntr['wred_grn_drp_pkt'], old_cntr['wred_grn_drp_pkt'])
                         )
                     )
 
-                if wred_yellow_pkt_stat_capable == "true":
+                if self.wred_capable['yellow'] == "true":
                     print(
                         "WRED Yellow Dropped Packets.................... {}".format(
                             ns_diff(cntr['wred_ylw_drp_pkt'], old_cntr['wred_ylw_drp_pkt'])
                         )
                     )
 
-                if wred_red_pkt_stat_capable == "true":
+                if self.wred_capable['red'] == "true":
                     print(
                         "WRED Red Dropped Packets....................... {}".format(
                             ns_diff(cntr['wred_red_drp_pkt'], old_cntr['wred_red_drp_pkt'])
                         )
                     )
 
-                if wred_total_pkt_stat_capable == "true":
+                if self.wred_capable['total'] == "true":
                     print(
                         "WRED Total Dropped Packets..................... {}".format(
                             ns_diff(cntr['wred_tot_drp_pkt'], old_cntr['wred_tot_drp_pkt'])
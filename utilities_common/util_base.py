@@ -1,11 +1,17 @@
+import functools
+import json
 import os
 import pkgutil
 import importlib
+import tempfile
 
+import lazy_object_proxy
 from sonic_py_common import logger
 
 # Constants ====================================================================
 PDDF_SUPPORT_FILE = '/usr/share/sonic/platform/pddf_support'
+PLUGINS_MANIFEST_DIR = '/var/cache/sonic-utilities'
+PLUGINS_MANIFEST_VERSION = 1
 
 # Helper classs
 
@@ -84,8 +90,181 @@ class UtilHelper(object):
         else:
             return False
 
-    def load_and_register_plugins(self, plugins, cli):
-        """ Load plugins and register them """
+    def load_and_register_plugins(self, plugins, cli, manifest_path=None):
+        """ Load plugins and register them.
 
-        for plugin in self.load_plugins(plugins):
-            self.register_plugin(plugin, cli)
\ No newline at end of file
+        If manifest_path is given, the top-level commands added or extended
+        by every plugin are cached in that file, and a plugin listed there is
+        imported and registered only when one of its commands is used.
+        Plugins which are not in the manifest or were modified since it was
+        written are loaded and registered right away, and the manifest is
+        updated.
+        """
+
+        if manifest_path is None:
+            for plugin in self.load_plugins(plugins):
+                self.register_plugin(plugin, cli)
+            return
+
+        manifest = self.read_plugins_manifest(manifest_path)
+        new_manifest = {}
+        lazy_plugins = {}
+        for module_name, fingerprint in self.iter_plugin_modules(plugins):
+            entry = manifest.get(module_name)
+            if fingerprint is not None and entry and entry.get('fingerprint') == fingerprint:
+                new_manifest[module_name] = entry
+                if entry['commands']:
+                    lazy_plugins[module_name] = entry['commands']
+                continue
+
+            commands = self.load_and_register_plugin(module_name, cli)
+            if commands is not None and fingerprint is not None:
+                new_manifest[module_name] = {'fingerprint': fingerprint, 'commands': commands}
+
+        self.register_lazy_plugins(cli, lazy_plugins)
+
+        if new_manifest != manifest:
+            self.write_plugins_manifest(manifest_path, new_manifest)
+
+    def get_plugins_manifest_path(self, plugins):
+        """ Return the path of the manifest caching the commands of plugins,
+        None if plugins should be loaded eagerly. """
+
+        # Unit tests mock modules the plugins depend on, load them every time.
+        if os.environ.get('UTILITIES_UNIT_TESTING'):
+            return None
+        return os.path.join(PLUGINS_MANIFEST_DIR, plugins.__name__ + '.json')
+
+    def iter_plugin_modules(self, plugins_namespace):
+        """ Discover CLI plugins without importing them.
+        Yield the plugin module name and the fingerprint of its source file. """
+
+        for module_finder, module_name, ispkg in pkgutil.iter_modules(plugins_namespace.__path__,
+                                                                      plugins_namespace.__name__ + "."):
+            if ispkg:
+                yield from self.iter_plugin_modules(importlib.import_module(module_name))
+                continue
+            path = os.path.join(module_finder.path, module_name.rsplit('.', 1)[-1] + '.py')
+            try:
+                stat = os.stat(path)
+                fingerprint = [stat.st_mtime_ns, stat.st_size]
+            except OSError:
+                fingerprint = None
+            yield module_name, fingerprint
+
+    def load_and_register_plugin(self, module_name, cli):
+        """ Load and register plugin module_name in top-level command cli.
+        Return the names of the top-level commands the plugin added or changed,
+        None if the plugin failed to load. """
+
+        log.log_debug('importing plugin: {}'.format(module_name))
+        try:
+            plugin = importlib.import_module(module_name)
+        except Exception as err:
+            log.log_error('failed to import plugin {}: {}'.format(module_name, err),
+                          also_print_to_console=True)
+            return None
+
+        before = {name: self.get_command_tree(command) for name, command in cli.commands.items()}
+        self.register_plugin(plugin, cli)
+        after = {name: self.get_command_tree(command) for name, command in cli.commands.items()}
+        return sorted(name for name in set(before) | set(after) if before.get(name) != after.get(name))
+
+    def get_command_tree(self, command, path=()):
+        """ Return the identities of command, of its parameters and of all
+        its subcommands, to find out the commands a plugin changed. """
+
+        tree = {path: (id(command), tuple(id(param) for param in command.params))}
+        for name, subcommand in getattr(command, 'commands', {}).items():
+            tree.update(self.get_command_tree(subcommand, path + (name,)))
+        return tree
+
+    def register_lazy_plugins(self, cli, lazy_plugins):
+        """ Replace every top-level command added or changed by lazy_plugins
+        with a placeholder which registers the plugins on first use.
+
+        lazy_plugins maps a plugin module name to the names of its commands.
+        """
+
+        originals = {}
+        for command_names in lazy_plugins.values():
+            for command_name in command_names:
+                originals.setdefault(command_name, cli.commands.get(command_name))
+
+        for command_name in originals:
+            load = functools.partial(self.load_lazy_plugins, cli, command_name, originals, lazy_plugins)
+            cli.add_command(lazy_object_proxy.Proxy(load), name=command_name)
+
+    def load_lazy_plugins(self, cli, command_name, originals, lazy_plugins):
+        """ Register the plugins of top-level command command_name, and the plugins
+        sharing commands with them, on first use. Return the command once
+        extended by the plugins. """
+
+        if command_name not in originals:
+            # Registered along with the plugins of another command
+            return cli.commands[command_name]
+
+        command_names = {command_name}
+        module_names = []
+        found = True
+        while found:
+            found = False
+            for module_name, plugin_commands in lazy_plugins.items():
+                if module_name not in module_names and command_names.intersection(plugin_commands):
+                    module_names.append(module_name)
+                    command_names.update(plugin_commands)
+                    found = True
+
+        # Put the original commands back, plugins may look them up or add them
+        for name in command_names:
+            command = originals.pop(name)
+            if command is None:
+                cli.commands.pop(name, None)
+            else:
+                cli.commands[name] = command
+
+        for module_name in [name for name in lazy_plugins if name in module_names]:
+            lazy_plugins.pop(module_name)
+            log.log_debug('importing plugin: {}'.format(module_name))
+            try:
+                plugin = importlib.import_module(module_name)
+            except Exception as err:
+                log.log_error('failed to import plugin {}: {}'.format(module_name, err),
+                              also_print_to_console=True)
+                continue
+            self.register_plugin(plugin, cli)
+
+        if command_name not in cli.commands:
+            raise RuntimeError('plugins {} did not register command {}'.format(module_names, command_name))
+        return cli.commands[command_name]
+
+    def read_plugins_manifest(self, manifest_path):
+        try:
+            with open(manifest_path) as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(manifest, dict) or manifest.get('version') != PLUGINS_MANIFEST_VERSION:
+            return {}
+        return manifest.get('plugins', {})
+
+    def write_plugins_manifest(self, manifest_path, plugins_manifest):
+        """ Write the manifest atomically. Failures are ignored,
+        the plugins are loaded eagerly until it can be written. """
+
+        manifest = {'version': PLUGINS_MANIFEST_VERSION, 'plugins': plugins_manifest}
+        try:
+            manifest_dir = os.path.dirname(manifest_path)
+            os.makedirs(manifest_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=manifest_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as manifest_file:
+                    json.dump(manifest, manifest_file)
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, manifest_path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except OSError as err:
+            log.log_debug('failed to write plugins manifest {}: {}'.format(manifest_path, err))